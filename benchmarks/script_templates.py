@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+
+"""Time the script byte templates against the former hex string building."""
+
+from binascii import hexlify, unhexlify
+
+import timeit
+
+from hdwallet.libs.script import (
+    p2pkh_script, p2wpkh_script, multisig_script
+)
+
+NUMBER: int = 200000
+
+public_key_hash, public_key = bytes(range(20)), b"\x02" + bytes(range(32))
+cases = [
+    ("P2PKH", lambda: p2pkh_script(public_key_hash),
+     lambda: unhexlify("76a914" + hexlify(public_key_hash).decode() + "88ac")),
+    ("P2WPKH", lambda: p2wpkh_script(public_key_hash),
+     lambda: unhexlify("0014" + hexlify(public_key_hash).decode())),
+    ("1-of-1 multisig", lambda: multisig_script(public_key),
+     lambda: unhexlify("5121" + public_key.hex() + "51ae")),
+]
+
+for name, template, string in cases:
+    assert template() == string()
+    template_us, string_us = (
+        timeit.timeit(function, number=NUMBER) / NUMBER * 1e6 for function in (template, string)
+    )
+    print(f"{name}: template {template_us:.3f} us, hex string {string_us:.3f} us")
@@ -23,15 +23,16 @@ bip44_hdwallet.clean_derivation()
 print("Mnemonic:", bip44_hdwallet.mnemonic())
 print("Base HD Path:  m/44'/60'/0'/0/{address_index}", "\n")
 
+# Drive the shared m/44'/60'/0'/0 node once, addresses are its children
+change_node = bip44_hdwallet.node().derive_path(path="m/44'/60'/0'/0")
+
 # Get Ethereum BIP44HDWallet information's from address index
 for address_index in range(10):
     # Derivation from Ethereum BIP44 derivation path
     bip44_derivation: BIP44Derivation = BIP44Derivation(
         cryptocurrency=EthereumMainnet, account=0, change=False, address=address_index
     )
-    # Drive Ethereum HDWallet
-    bip44_hdwallet.from_path(path=bip44_derivation)
+    # Drive Ethereum HDWallet from the change node child
+    bip44_hdwallet.from_node(node=change_node.derive(index=address_index), path=bip44_derivation)
     # Print address_index, path, address and private_key
     print(f"({address_index}) {bip44_hdwallet.path()} {bip44_hdwallet.address()} 0x{bip44_hdwallet.private_key()}")
-    # Clean derivation indexes/paths
-    bip44_hdwallet.clean_derivation()
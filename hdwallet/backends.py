@@ -0,0 +1,379 @@
+#!/usr/bin/env python3
+
+from abc import (
+    ABC, abstractmethod
+)
+from ecdsa.curves import SECP256k1
+from ecdsa.keys import (
+    SigningKey, VerifyingKey, BadSignatureError, MalformedPointError
+)
+from hashlib import sha256
+from typing import (
+    Dict, Iterable, List, Optional, Tuple, Type, Union
+)
+
+import ecdsa
+import os
+import secrets
+
+from .libs.ecc import (
+    S256Point, PrivateKey, Signature, N,
+    jacobian_add, generator_multiply, glv_multiply, from_jacobian, batch_sec, verify_many,
+    batch_inverse, batch_from_jacobian
+)
+from .exceptions import BackendError
+
+try:
+    import coincurve
+except ImportError:  # pragma: no cover
+    coincurve = None
+
+# Environment variable used to select the default backend.
+BACKEND_ENVIRON: str = "HDWALLET_BACKEND"
+# Backends tried in order when the backend is "auto".
+AUTO_BACKENDS: Tuple[str, ...] = ("coincurve", "python")
+
+
+class Backend(ABC):
+    """
+    Elliptic curve (secp256k1) backend interface.
+
+    Public keys are SEC encoded bytes (33 bytes compressed, 65 bytes uncompressed or 64 raw bytes),
+    private keys are 32 bytes and signatures are ``(r, s)`` integer tuples.
+    """
+
+    NAME: str
+
+    @staticmethod
+    def is_available() -> bool:
+        return True
+
+    @abstractmethod
+    def public_key(self, private_key: bytes, compressed: bool = True) -> bytes:
+        pass
+
+    @abstractmethod
+    def multiply(self, public_key: bytes, scalar: int, compressed: bool = True) -> bytes:
+        pass
+
+    @abstractmethod
+    def add(self, public_key: bytes, other_public_key: bytes, compressed: bool = True) -> bytes:
+        pass
+
+    def tweak_add(self, public_key: bytes, tweak: int, compressed: bool = True) -> bytes:
+        return self.add(public_key, self.public_key(tweak.to_bytes(32, "big")), compressed)
+
+    @abstractmethod
+    def serialize(self, public_key: bytes, compressed: bool = True) -> bytes:
+        pass
+
+    @abstractmethod
+    def sign(self, private_key: bytes, digest: bytes, deterministic: bool = True) -> Tuple[int, int]:
+        pass
+
+    def sign_many(self, private_key: bytes, digests: Iterable[bytes],
+                  deterministic: bool = True) -> List[Tuple[int, int]]:
+        return [self.sign(private_key, digest, deterministic=deterministic) for digest in digests]
+
+    @abstractmethod
+    def verify(self, public_key: bytes, digest: bytes, signature: Tuple[int, int]) -> bool:
+        pass
+
+    def verify_many(self, items: Iterable[Tuple[bytes, bytes, Tuple[int, int]]]) -> List[bool]:
+        # a malformed public key only fails its own item, whatever the backend raises for it
+        results = []
+        for public_key, digest, signature in items:
+            try:
+                results.append(self.verify(public_key, digest, signature))
+            except (ValueError, MalformedPointError):
+                results.append(False)
+        return results
+
+
+class PythonBackend(Backend):
+    """
+    Pure-Python backend on top of ``hdwallet.libs.ecc``.
+    """
+
+    NAME = "python"
+
+    @staticmethod
+    def _secret(private_key: bytes) -> int:
+        secret = int.from_bytes(private_key, "big")
+        if len(private_key) != 32 or not 0 < secret < N:
+            raise ValueError("Invalid private key.")
+        return secret
+
+    @staticmethod
+    def _point(public_key: bytes) -> S256Point:
+        if len(public_key) == 64:
+            public_key = b"\x04" + public_key
+        if len(public_key) not in [33, 65] or public_key[0] not in [2, 3, 4]:
+            raise ValueError("Invalid public key.")
+        return S256Point.parse(public_key)
+
+    @staticmethod
+    def _sec(point: tuple, compressed: bool) -> bytes:
+        if not point[2]:
+            raise ValueError("Invalid public key, resulting in the point at infinity.")
+        return batch_sec([point], compressed=compressed)[0]
+
+    def public_key(self, private_key: bytes, compressed: bool = True) -> bytes:
+        return self._sec(generator_multiply(self._secret(private_key)), compressed)
+
+    def multiply(self, public_key: bytes, scalar: int, compressed: bool = True) -> bytes:
+        return self._sec(glv_multiply(self._point(public_key).jacobian(), scalar), compressed)
+
+    def add(self, public_key: bytes, other_public_key: bytes, compressed: bool = True) -> bytes:
+        return self._sec(jacobian_add(
+            self._point(public_key).jacobian(), self._point(other_public_key).jacobian()
+        ), compressed)
+
+    def tweak_add(self, public_key: bytes, tweak: int, compressed: bool = True) -> bytes:
+        return self._sec(jacobian_add(
+            generator_multiply(tweak), self._point(public_key).jacobian()
+        ), compressed)
+
+    def serialize(self, public_key: bytes, compressed: bool = True) -> bytes:
+        return self._point(public_key).sec(compressed=compressed)
+
+    def sign(self, private_key: bytes, digest: bytes, deterministic: bool = True) -> Tuple[int, int]:
+        if len(digest) > 32:
+            raise ValueError("Invalid digest, must be at most 32 bytes.")
+        key, z = PrivateKey(self._secret(private_key)), int.from_bytes(digest, "big")
+        k = key.deterministic_k(z) if deterministic else (secrets.randbelow(N - 1) + 1)
+        r = from_jacobian(generator_multiply(k))[0] % N
+        s = (z + r * key.secret) * pow(k, N - 2, N) % N
+        return r, s
+
+    def sign_many(self, private_key: bytes, digests: Iterable[bytes],
+                  deterministic: bool = True) -> List[Tuple[int, int]]:
+        digests = list(digests)
+        if any(len(digest) > 32 for digest in digests):
+            raise ValueError("Invalid digest, must be at most 32 bytes.")
+        # one key (and its nonce HMAC state) for every digest, the R points
+        # and the nonces are inverted with one inversion each for the batch
+        key, zs = PrivateKey(self._secret(private_key)), [int.from_bytes(digest, "big") for digest in digests]
+        ks = [key.deterministic_k(z) if deterministic else (secrets.randbelow(N - 1) + 1) for z in zs]
+        points = batch_from_jacobian([generator_multiply(k) for k in ks])
+        signatures = []
+        for z, (x, _), k_inv in zip(zs, points, batch_inverse(ks, N)):
+            r = x % N
+            signatures.append((r, (z + r * key.secret) * k_inv % N))
+        return signatures
+
+    def verify(self, public_key: bytes, digest: bytes, signature: Tuple[int, int]) -> bool:
+        r, s = signature
+        if not (0 < r < N and 0 < s < N):
+            return False
+        return self._point(public_key).verify(int.from_bytes(digest, "big"), Signature(r, s))
+
+    def _point_or_infinity(self, public_key: bytes) -> S256Point:
+        try:
+            return self._point(public_key)
+        except ValueError:
+            # the point at infinity never verifies, so a malformed key only fails its own item
+            return S256Point(None, None)
+
+    def verify_many(self, items: Iterable[Tuple[bytes, bytes, Tuple[int, int]]]) -> List[bool]:
+        # signatures of the same key share its precomputed multiples
+        return verify_many([
+            (self._point_or_infinity(public_key), int.from_bytes(digest, "big"), Signature(*signature))
+            for public_key, digest, signature in items
+        ])
+
+
+class ECDSABackend(Backend):
+    """
+    Backend on top of the pure-Python ``ecdsa`` package.
+    """
+
+    NAME = "ecdsa"
+
+    @staticmethod
+    def _encode(point: ecdsa.ellipticcurve.Point, compressed: bool) -> bytes:
+        if point == ecdsa.ellipticcurve.INFINITY:
+            raise ValueError("Invalid public key, resulting in the point at infinity.")
+        x, y = point.x().to_bytes(32, "big"), point.y()
+        if compressed:
+            return (b"\3" if y & 1 else b"\2") + x
+        return b"\4" + x + y.to_bytes(32, "big")
+
+    @staticmethod
+    def _point(public_key: bytes) -> ecdsa.ellipticcurve.Point:
+        return VerifyingKey.from_string(public_key, curve=SECP256k1).pubkey.point
+
+    def public_key(self, private_key: bytes, compressed: bool = True) -> bytes:
+        key = SigningKey.from_string(private_key, curve=SECP256k1)
+        return self._encode(key.get_verifying_key().pubkey.point, compressed)
+
+    def multiply(self, public_key: bytes, scalar: int, compressed: bool = True) -> bytes:
+        return self._encode(self._point(public_key) * (scalar % N), compressed)
+
+    def add(self, public_key: bytes, other_public_key: bytes, compressed: bool = True) -> bytes:
+        return self._encode(self._point(public_key) + self._point(other_public_key), compressed)
+
+    def tweak_add(self, public_key: bytes, tweak: int, compressed: bool = True) -> bytes:
+        return self._encode(self._point(public_key) + SECP256k1.generator * tweak, compressed)
+
+    def serialize(self, public_key: bytes, compressed: bool = True) -> bytes:
+        return self._encode(self._point(public_key), compressed)
+
+    def sign(self, private_key: bytes, digest: bytes, deterministic: bool = True) -> Tuple[int, int]:
+        key = SigningKey.from_string(private_key, curve=SECP256k1)
+        if deterministic:
+            r, s, _ = key.sign_digest_deterministic(digest, hashfunc=sha256, sigencode=lambda *x: x)
+        else:
+            r, s, _ = key.sign_digest(digest, sigencode=lambda *x: x)
+        return r, s
+
+    def verify(self, public_key: bytes, digest: bytes, signature: Tuple[int, int]) -> bool:
+        key = VerifyingKey.from_string(public_key, curve=SECP256k1)
+        try:
+            return key.verify_digest(signature, digest, sigdecode=lambda signature, order: signature)
+        except BadSignatureError:
+            return False
+
+
+class CoincurveBackend(Backend):
+    """
+    Backend on top of ``coincurve`` (libsecp256k1 bindings), used when it is importable.
+    """
+
+    NAME = "coincurve"
+
+    @staticmethod
+    def is_available() -> bool:
+        return coincurve is not None
+
+    @staticmethod
+    def _point(public_key: bytes) -> "coincurve.PublicKey":
+        if len(public_key) == 64:
+            public_key = b"\x04" + public_key
+        return coincurve.PublicKey(public_key)
+
+    def public_key(self, private_key: bytes, compressed: bool = True) -> bytes:
+        return coincurve.PrivateKey(private_key).public_key.format(compressed=compressed)
+
+    def multiply(self, public_key: bytes, scalar: int, compressed: bool = True) -> bytes:
+        return self._point(public_key).multiply((scalar % N).to_bytes(32, "big")).format(compressed=compressed)
+
+    def add(self, public_key: bytes, other_public_key: bytes, compressed: bool = True) -> bytes:
+        return coincurve.PublicKey.combine_keys([
+            self._point(public_key), self._point(other_public_key)
+        ]).format(compressed=compressed)
+
+    def tweak_add(self, public_key: bytes, tweak: int, compressed: bool = True) -> bytes:
+        return self._point(public_key).add(tweak.to_bytes(32, "big")).format(compressed=compressed)
+
+    def serialize(self, public_key: bytes, compressed: bool = True) -> bytes:
+        return self._point(public_key).format(compressed=compressed)
+
+    def sign(self, private_key: bytes, digest: bytes, deterministic: bool = True) -> Tuple[int, int]:
+        if not deterministic:
+            # libsecp256k1 always derives its nonce with RFC6979.
+            return get_backend("python").sign(private_key, digest, deterministic=False)
+        signature = Signature.parse(coincurve.PrivateKey(private_key).sign(digest, hasher=None))
+        return signature.r, signature.s
+
+    def sign_many(self, private_key: bytes, digests: Iterable[bytes],
+                  deterministic: bool = True) -> List[Tuple[int, int]]:
+        if not deterministic:
+            return get_backend("python").sign_many(private_key, digests, deterministic=False)
+        key, signatures = coincurve.PrivateKey(private_key), []
+        for digest in digests:
+            signature = Signature.parse(key.sign(digest, hasher=None))
+            signatures.append((signature.r, signature.s))
+        return signatures
+
+    def verify(self, public_key: bytes, digest: bytes, signature: Tuple[int, int]) -> bool:
+        r, s = signature
+        if not (0 < r < N and 0 < s < N):
+            return False
+        # libsecp256k1 only accepts low s values, (r, s) and (r, N - s) are equally valid.
+        der = Signature(r, min(s, N - s)).der()
+        return self._point(public_key).verify(der, digest, hasher=None)
+
+
+BACKENDS: Dict[str, Type[Backend]] = {
+    PythonBackend.NAME: PythonBackend,
+    ECDSABackend.NAME: ECDSABackend,
+    CoincurveBackend.NAME: CoincurveBackend
+}
+
+_instances: Dict[str, Backend] = {}
+
+
+def register_backend(backend: Type[Backend]) -> Type[Backend]:
+    """
+    Register an elliptic curve backend class.
+
+    :param backend: Backend class with a unique ``NAME``.
+    :type backend: Backend
+
+    :returns: Backend -- The registered backend class.
+
+    >>> from hdwallet.backends import Backend, register_backend
+    >>> @register_backend
+    ... class MyBackend(Backend):
+    ...     NAME = "my-backend"
+    """
+
+    if not (isinstance(backend, type) and issubclass(backend, Backend)):
+        raise TypeError("Invalid backend type, the class must be a Backend subclass.")
+    BACKENDS[backend.NAME] = backend
+    _instances.pop(backend.NAME, None)
+    return backend
+
+
+def get_backend(backend: Optional[Union[str, Backend]] = None) -> Backend:
+    """
+    Get elliptic curve backend.
+
+    :param backend: Backend name or instance, default to the ``HDWALLET_BACKEND`` environment variable or ``auto``.
+    :type backend: str, Backend
+
+    :returns: Backend -- Backend instance.
+
+    >>> from hdwallet.backends import get_backend
+    >>> get_backend("python")
+    <hdwallet.backends.PythonBackend object at 0x000001E8BFB98D60>
+    >>> get_backend("python").NAME
+    "python"
+    """
+
+    if isinstance(backend, Backend):
+        return backend
+    name = (backend or os.environ.get(BACKEND_ENVIRON) or "auto").lower()
+    if name == "auto":
+        name = next(_name for _name in AUTO_BACKENDS if BACKENDS[_name].is_available())
+    if name not in BACKENDS:
+        raise BackendError(
+            f"Invalid backend '{name}'",
+            f"choose only the following options 'auto', {', '.join(repr(_name) for _name in BACKENDS)} backends."
+        )
+    if not BACKENDS[name].is_available():
+        raise BackendError(f"Backend '{name}' is not available", "install its package first.")
+    if name not in _instances:
+        _instances[name] = BACKENDS[name]()
+    return _instances[name]
+
+
+def batch_verify(items: Iterable[Tuple[bytes, bytes, Tuple[int, int]]],
+                 backend: Optional[Union[str, Backend]] = None) -> bool:
+    """
+    Verify many signatures at once.
+
+    :param items: Public key SEC bytes, digest bytes and ``(r, s)`` signature triples.
+    :type items: list
+    :param backend: Backend name or instance, default to ``None``.
+    :type backend: str, Backend
+
+    :returns: bool -- ``True`` when every signature is valid, use ``Backend.verify_many`` to find the invalid ones.
+
+    >>> from hdwallet.backends import batch_verify
+    >>> batch_verify([(public_key, digest, signature) for public_key, digest, signature in signatures])
+    True
+    """
+
+    return all(get_backend(backend).verify_many(items))
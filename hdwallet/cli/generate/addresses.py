@@ -3,6 +3,7 @@
 from typing import Optional
 
 from hdwallet import HDWallet
+from hdwallet.nodes import HDNode
 from hdwallet.derivations import (
     Derivation, BIP32Derivation
 )
@@ -65,14 +66,16 @@ def generate_addresses(
                 mnemonic=mnemonic, language=language, passphrase=passphrase
             )
 
+        # Every address shares the parent of its index, derive it once.
+        root: HDNode = hdwallet.node()
+        parent: Optional[HDNode] = None
         for index in range(start_index, end_index):
             if path:
                 derivation: Derivation = Derivation(path=path)
                 derivation.from_index(index=index, hardened=hardened)
-                hdwallet.from_path(path=derivation)
             else:
                 cryptocurrency: Cryptocurrency = get_cryptocurrency(symbol=symbol)
-                bip32_derivation: BIP32Derivation = BIP32Derivation(
+                derivation: Derivation = BIP32Derivation(
                     purpose=(
                         44, False if xpublic_key else True
                     ),
@@ -86,7 +89,11 @@ def generate_addresses(
                     change=change,
                     address=index
                 )
-                hdwallet.from_path(path=bip32_derivation)
+            if parent is None:
+                parent = root.derive_path(path=str(derivation).rsplit("/", 1)[0])
+            hdwallet.from_node(
+                node=parent.derive(index=index, hardened=bool(path and hardened)), path=derivation
+            )
 
             rows: str = ""
             dumps = hdwallet.dumps()
@@ -98,8 +105,6 @@ def generate_addresses(
                 )
             click.echo(rows)
 
-            hdwallet.clean_derivation()
-
     except TimeoutError as exception:
         click.echo(click.style(f"Error: {str(exception)}"), err=True)
         sys.exit()
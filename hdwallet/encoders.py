@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+
+from types import MappingProxyType
+from typing import (
+    Any, Callable, Dict, Mapping, NamedTuple, Optional
+)
+
+import inspect
+
+from .libs.base58 import (
+    check_encode, account_addresses, XRP_ALPHABET
+)
+
+# Coin family of the symbols whose P2PKH address is not base58check of a hash160.
+FAMILIES: Dict[str, str] = {
+    "ETH": "evm", "ETHTEST": "evm", "XDC": "evm", "XDCTEST": "evm", "TRX": "tron", "XRP": "xrp"
+}
+
+# Encoders compiled so far, keyed by Cryptocurrency class.
+_ENCODERS: Dict[Any, "Encoder"] = {}
+
+
+def prefix_bytes(value: Optional[int]) -> Optional[bytes]:
+    """
+    Big-endian bytes of a version or prefix integer, as short as possible (same as ``utils._unhexlify``).
+
+    :param value: Prefix integer.
+    :type value: int
+
+    :returns: bytes -- Prefix bytes, ``None`` for ``None``.
+
+    >>> from hdwallet.encoders import prefix_bytes
+    >>> prefix_bytes(0x488ade4)
+    b"\\x04\\x88\\xad\\xe4"
+    """
+
+    if value is None:
+        return None
+    return value.to_bytes((value.bit_length() + 7) // 8 or 1, "big")
+
+
+def _base58_p2pkh(encoder: "Encoder", public_key_hash: bytes) -> str:
+    return check_encode(encoder.public_key_address + public_key_hash)
+
+
+def _xrp_p2pkh(encoder: "Encoder", public_key_hash: bytes) -> str:
+    return check_encode(encoder.public_key_address + public_key_hash, alphabet=XRP_ALPHABET)
+
+
+def _account_p2pkh(encoder: "Encoder", uncompressed: bytes) -> str:
+    return account_addresses([uncompressed], crypto=encoder.account)[0]
+
+
+# P2PKH address function of each family, and the public key form it takes.
+P2PKH_ENCODERS: Dict[str, Callable[["Encoder", bytes], str]] = {
+    "btc": _base58_p2pkh, "xrp": _xrp_p2pkh, "evm": _account_p2pkh, "tron": _account_p2pkh
+}
+P2PKH_INPUTS: Dict[str, str] = {
+    "btc": "hash160", "xrp": "hash160", "evm": "uncompressed", "tron": "uncompressed"
+}
+
+
+class Encoder(NamedTuple):
+    """
+    Address and key encoding data of one cryptocurrency, compiled once and immutable.
+
+    Version mappings are keyed by lower case semantic (``p2pkh``, ``p2wpkh``, ...)
+    and hold ``None`` where the cryptocurrency has no such version.
+    """
+
+    family: str
+    account: Optional[str]
+    public_key_address: bytes
+    script_address: bytes
+    wif_secret_key: Optional[bytes]
+    hrp: Optional[str]
+    segwit_version: int
+    xprivate_key_versions: Mapping[str, Optional[bytes]]
+    xpublic_key_versions: Mapping[str, Optional[bytes]]
+
+    @property
+    def p2pkh_input(self) -> str:
+        return P2PKH_INPUTS[self.family]
+
+    def p2pkh_address(self, data: bytes) -> str:
+        """
+        P2PKH address from the hash160 or the uncompressed public key, see ``p2pkh_input``.
+        """
+
+        return P2PKH_ENCODERS[self.family](self, data)
+
+
+def _versions(extended: Any) -> Mapping[str, Optional[bytes]]:
+    return MappingProxyType({
+        name.lower(): prefix_bytes(value) for name, value in inspect.getmembers(extended)
+        if not name.startswith("_") and (value is None or isinstance(value, int))
+    })
+
+
+def get_encoder(cryptocurrency: Any) -> Encoder:
+    """
+    Get the compiled encoder of a cryptocurrency.
+
+    :param cryptocurrency: Cryptocurrency class.
+    :type cryptocurrency: Cryptocurrency
+
+    :returns: Encoder -- Frozen encoder descriptor.
+
+    >>> from hdwallet.encoders import get_encoder
+    >>> from hdwallet.cryptocurrencies import BitcoinMainnet
+    >>> get_encoder(BitcoinMainnet).hrp
+    "bc"
+    """
+
+    encoder = _ENCODERS.get(cryptocurrency)
+    if encoder is None:
+        family = FAMILIES.get(cryptocurrency.SYMBOL, "btc")
+        encoder = _ENCODERS[cryptocurrency] = Encoder(
+            family=family,
+            account=("trx" if family == "tron" else cryptocurrency.SYMBOL[:3].lower()) if family in ("evm", "tron") else None,
+            public_key_address=prefix_bytes(cryptocurrency.PUBLIC_KEY_ADDRESS),
+            script_address=prefix_bytes(cryptocurrency.SCRIPT_ADDRESS),
+            wif_secret_key=prefix_bytes(getattr(cryptocurrency, "WIF_SECRET_KEY", None)),
+            hrp=cryptocurrency.SEGWIT_ADDRESS.HRP,
+            segwit_version=cryptocurrency.SEGWIT_ADDRESS.VERSION,
+            xprivate_key_versions=_versions(cryptocurrency.EXTENDED_PRIVATE_KEY),
+            xpublic_key_versions=_versions(cryptocurrency.EXTENDED_PUBLIC_KEY)
+        )
+    return encoder
@@ -26,13 +26,7 @@ SOFTWARE.
 
 from ecdsa.curves import SECP256k1
 from ecdsa.ellipticcurve import Point
-from ecdsa.keys import (
-    SigningKey, VerifyingKey
-)
 from ecdsa.util import sigencode_der
-from ecdsa.ecdsa import (
-    int_to_string, string_to_int
-)
 from binascii import (
     hexlify, unhexlify
 )
@@ -42,25 +36,26 @@ from typing import (
 from mnemonic import Mnemonic
 from hashlib import sha256
 from typing import (
-    Optional, Any, Union
+    Optional, Any, Union, AnyStr, Iterable, Iterator, List, Dict
 )
-from functools import partial
 
 import hmac
+import copy
 import ecdsa
 import struct
-from Crypto.Hash import keccak
 import unicodedata
 import hashlib
-import base58
 
-from .libs.ripemd160 import ripemd160
-from .libs.ecc import S256Point, N, G
+from .libs.ripemd160 import hash160
+from .libs import script
+from .libs.ecc import (
+    S256Point, N, INFINITY_JACOBIAN, jacobian_add, generator_multiply, batch_sec
+)
 from .libs.bech32 import (
     bech32_encode, encode, bech32_decode, decode
 )
 from .libs.base58 import (
-    check_encode, checksum_encode, check_decode, ensure_string
+    check_encode, ensure_string
 )
 from .cryptocurrencies import (
     Cryptocurrency, get_cryptocurrency, SegwitAddress
@@ -68,16 +63,30 @@ from .cryptocurrencies import (
 from .derivations import (
     Derivation, BIP32Derivation, BIP44Derivation, BIP49Derivation, BIP84Derivation, BIP141Derivation
 )
+from .backends import (
+    Backend, get_backend
+)
+from .encoders import (
+    Encoder, get_encoder
+)
+from .nodes import (
+    BIP32KEY_HARDEN, ChildKey, HDNode, NodeCache, derive_paths, parse_path
+)
+from .keys import (
+    parse_xprivate_key, parse_xpublic_key, parse_wif
+)
 from .exceptions import (
     SemanticError, DerivationError
 )
 from .utils import (
-    get_bytes, is_entropy, is_mnemonic, get_entropy_strength, _unhexlify, is_root_xpublic_key,
-    get_mnemonic_language, is_root_xprivate_key, get_mnemonic_strength, get_semantic
+    get_bytes, is_entropy, is_mnemonic, get_entropy_strength,
+    get_mnemonic_language, get_mnemonic_strength
 )
 
 MIN_ENTROPY_LEN: int = 128
-BIP32KEY_HARDEN: int = 0x80000000
+ADDRESS_SEMANTICS: Tuple[str, ...] = (
+    "p2pkh", "p2sh", "p2wpkh", "p2wpkh_in_p2sh", "p2wsh", "p2wsh_in_p2sh"
+)
 highest_s = 0x7fffffffffffffffffffffffffffffff5d576e7357a4501ddfe92f46681b20a0
 
 CURVE_GEN: Any = ecdsa.ecdsa.generator_secp256k1
@@ -98,6 +107,10 @@ class HDWallet:
     :type semantic: str
     :param use_default_path: Use default derivation path, defaults to ``False``.
     :type use_default_path: bool
+    :param backend: Elliptic curve backend name or instance, defaults to ``None`` (``HDWALLET_BACKEND`` environment variable or ``auto``).
+    :type backend: str, Backend
+    :param cache: Intermediate node cache used by ``from_path``, can be shared between wallets, defaults to ``None`` (disabled).
+    :type cache: NodeCache
 
     :returns: HDWallet -- Hierarchical Deterministic Wallet instance.
 
@@ -106,7 +119,8 @@ class HDWallet:
     """
 
     def __init__(self, symbol: str = "BTC", cryptocurrency: Any = None,
-                 semantic: Optional[str] = None, use_default_path: bool = False):
+                 semantic: Optional[str] = None, use_default_path: bool = False,
+                 backend: Optional[Union[str, Backend]] = None, cache: Optional[NodeCache] = None):
         self._cryptocurrency: Any = None
         if cryptocurrency:
             if not issubclass(cryptocurrency, Cryptocurrency):
@@ -114,6 +128,9 @@ class HDWallet:
             self._cryptocurrency: Any = cryptocurrency
         else:
             self._cryptocurrency: Any = get_cryptocurrency(symbol=symbol)
+        self._encoder: Encoder = get_encoder(self._cryptocurrency)
+        self._backend: Backend = get_backend(backend)
+        self._cache: Optional[NodeCache] = cache
 
         self._strength: Optional[int] = None
         self._entropy: Optional[str] = None
@@ -127,9 +144,6 @@ class HDWallet:
         self._path: str = "m"
 
         self._seed: Optional[bytes] = None
-        self._private_key: Optional[bytes] = None
-        self._key: Optional[SigningKey] = None
-        self._verified_key: Optional[VerifyingKey] = None
         self._semantic: str = semantic
         self._from_class: bool = False
         self._path_class: str = "m"
@@ -137,7 +151,8 @@ class HDWallet:
         self._root_private_key: Optional[tuple] = None
         self._root_public_key: Optional[tuple] = None
         self._private_key: Optional[bytes] = None
-        self._public_key: Optional[str] = None
+        self._public_key: Optional[bytes] = None
+        self._node_hashes: Tuple[Optional[bytes], Dict[str, bytes]] = (None, {})
         self._chain_code: Optional[bytes] = None
         self._depth: int = 0
         self._index: int = 0
@@ -146,6 +161,29 @@ class HDWallet:
         self._root_parent_fingerprint: bytes = b"\0\0\0\0"
         self._root_index: int = 0
 
+    @property
+    def _public_key(self) -> Optional[bytes]:
+        # public key of a derived private key is computed when it is first read,
+        # a hardened derivation chain does not need it
+        if self._lazy_public_key is None and self._private_key is not None:
+            self._lazy_public_key = self._backend.public_key(self._private_key)
+        return self._lazy_public_key
+
+    @_public_key.setter
+    def _public_key(self, public_key: Optional[bytes]) -> None:
+        self._lazy_public_key = public_key
+
+    @property
+    def _parent_fingerprint(self) -> bytes:
+        if self._lazy_parent_fingerprint is None:
+            self._lazy_parent_fingerprint = hash160(self._backend.public_key(self._parent_private_key))[:4]
+            self._parent_private_key = None
+        return self._lazy_parent_fingerprint
+
+    @_parent_fingerprint.setter
+    def _parent_fingerprint(self, parent_fingerprint: bytes) -> None:
+        self._lazy_parent_fingerprint, self._parent_private_key = parent_fingerprint, None
+
     def from_entropy(self, entropy: str, language: str = "english", passphrase: str = None) -> "HDWallet":
         """
         Master from Entropy hex string.
@@ -241,11 +279,9 @@ class HDWallet:
             raise ValueError("Bad seed, resulting in invalid key!")
 
         self._private_key, self._chain_code = il, ir
-        self._key = ecdsa.SigningKey.from_string(self._private_key, curve=SECP256k1)
-        self._verified_key = self._key.get_verifying_key()
+        self._public_key = self._backend.public_key(self._private_key)
         if self._use_default_path:
             self.from_path(path=self._cryptocurrency.DEFAULT_PATH)
-        self._public_key = self.compressed()
         if self._from_class:
             self.from_path(path=self._path_class)
         if self._semantic is None:
@@ -270,36 +306,26 @@ class HDWallet:
         <hdwallet.hdwallet.HDWallet object at 0x000001E8BFB98D60>
         """
 
-        if not is_root_xprivate_key(xprivate_key=xprivate_key, symbol=self._cryptocurrency.SYMBOL):
+        xkey = parse_xprivate_key(xprivate_key=xprivate_key, cryptocurrency=self._cryptocurrency)
+        if not xkey.is_root:
             if strict:
                 raise ValueError("Invalid root xprivate key.")
 
-        _deserialize_xprivate_key = self._deserialize_xprivate_key(xprivate_key=xprivate_key)
         self._root_depth, self._root_parent_fingerprint, self._root_index = (
-            int.from_bytes(_deserialize_xprivate_key[1], "big"),
-            _deserialize_xprivate_key[2],
-            struct.unpack(">L", _deserialize_xprivate_key[3])[0]
+            xkey.depth, xkey.parent_fingerprint, xkey.index
         )
         self._depth, self._parent_fingerprint, self._index = (
-            int.from_bytes(_deserialize_xprivate_key[1], "big"),
-            _deserialize_xprivate_key[2],
-            struct.unpack(">L", _deserialize_xprivate_key[3])[0]
+            xkey.depth, xkey.parent_fingerprint, xkey.index
         )
-        self._i = _deserialize_xprivate_key[5] + _deserialize_xprivate_key[4]
-        self._root_private_key = (_deserialize_xprivate_key[5], _deserialize_xprivate_key[4])
+        self._i = xkey.key + xkey.chain_code
+        self._root_private_key = (xkey.key, xkey.chain_code)
         self._private_key, self._chain_code = self._i[:32], self._i[32:]
-        self._key = ecdsa.SigningKey.from_string(_deserialize_xprivate_key[5], curve=SECP256k1)
-        self._verified_key = self._key.get_verifying_key()
+        self._public_key = self._backend.public_key(self._private_key)
         if self._use_default_path:
             self.from_path(path=self._cryptocurrency.DEFAULT_PATH)
         if self._from_class:
             self.from_path(path=self._path_class)
-        self._public_key = self.compressed()
-        self._semantic = get_semantic(
-            _cryptocurrency=self._cryptocurrency,
-            version=_deserialize_xprivate_key[0],
-            key_type="private_key"
-        )
+        self._semantic = xkey.semantic
         return self
 
     def from_xpublic_key(self, xpublic_key: str, strict: bool = False) -> "HDWallet":
@@ -320,38 +346,25 @@ class HDWallet:
         <hdwallet.hdwallet.HDWallet object at 0x000001E8BFB98D60>
         """
 
-        if not is_root_xpublic_key(xpublic_key=xpublic_key, symbol=self._cryptocurrency.SYMBOL):
+        xkey = parse_xpublic_key(xpublic_key=xpublic_key, cryptocurrency=self._cryptocurrency)
+        if not xkey.is_root:
             if strict:
                 raise ValueError("Invalid root xpublic key.")
 
-        _deserialize_xpublic_key = self._deserialize_xpublic_key(xpublic_key=xpublic_key)
         self._root_depth, self._root_parent_fingerprint, self._root_index = (
-            int.from_bytes(_deserialize_xpublic_key[1], "big"),
-            _deserialize_xpublic_key[2],
-            struct.unpack(">L", _deserialize_xpublic_key[3])[0]
+            xkey.depth, xkey.parent_fingerprint, xkey.index
         )
         self._depth, self._parent_fingerprint, self._index = (
-            int.from_bytes(_deserialize_xpublic_key[1], "big"),
-            _deserialize_xpublic_key[2],
-            struct.unpack(">L", _deserialize_xpublic_key[3])[0]
-        )
-        self._chain_code = _deserialize_xpublic_key[4]
-        self._verified_key = ecdsa.VerifyingKey.from_string(
-            _deserialize_xpublic_key[5], curve=SECP256k1
-        )
-        self._root_public_key = (
-            _deserialize_xpublic_key[5], _deserialize_xpublic_key[4]
+            xkey.depth, xkey.parent_fingerprint, xkey.index
         )
+        self._chain_code = xkey.chain_code
+        self._public_key = self._backend.serialize(xkey.key)
+        self._root_public_key = (xkey.key, xkey.chain_code)
         if self._use_default_path:
             self.from_path(path=self._cryptocurrency.DEFAULT_PATH)
         if self._from_class:
             self.from_path(path=str(self._path_class).replace("'", ""))
-        self._public_key = self.compressed()
-        self._semantic = get_semantic(
-            _cryptocurrency=self._cryptocurrency,
-            version=_deserialize_xpublic_key[0],
-            key_type="public_key"
-        )
+        self._semantic = xkey.semantic
         return self
 
     def from_wif(self, wif: str) -> "HDWallet":
@@ -370,14 +383,8 @@ class HDWallet:
         <hdwallet.hdwallet.HDWallet object at 0x000001E8BFB98D60>
         """
 
-        raw = check_decode(wif)[:-1]
-        if not raw.startswith(_unhexlify(self._cryptocurrency.WIF_SECRET_KEY)):
-            raise ValueError(f"Invalid {self.cryptocurrency()} wallet important format.")
-
-        self._private_key = raw.split(_unhexlify(self._cryptocurrency.WIF_SECRET_KEY), 1).pop()
-        self._key = ecdsa.SigningKey.from_string(self._private_key, curve=SECP256k1)
-        self._verified_key = self._key.get_verifying_key()
-        self._public_key = self.compressed()
+        self._private_key = parse_wif(wif=wif, cryptocurrency=self._cryptocurrency)[0]
+        self._public_key = self._backend.public_key(self._private_key)
         return self
 
     def from_private_key(self, private_key: str) -> "HDWallet":
@@ -397,9 +404,7 @@ class HDWallet:
         """
 
         self._private_key = unhexlify(private_key)
-        self._key = ecdsa.SigningKey.from_string(self._private_key, curve=SECP256k1)
-        self._verified_key = self._key.get_verifying_key()
-        self._public_key = self.compressed()
+        self._public_key = self._backend.public_key(self._private_key)
         return self
 
     def from_public_key(self, public_key: str) -> "HDWallet":
@@ -418,10 +423,7 @@ class HDWallet:
         <hdwallet.hdwallet.HDWallet object at 0x000001E8BFB98D60>
         """
 
-        self._verified_key = ecdsa.VerifyingKey.from_string(
-            unhexlify(public_key), curve=SECP256k1
-        )
-        self._public_key = self.compressed()
+        self._public_key = self._backend.serialize(unhexlify(public_key))
         return self
 
     def from_path(self, path: Union[str, Derivation]) -> "HDWallet":
@@ -446,6 +448,12 @@ class HDWallet:
         elif str(path)[0:2] != "m/":
             raise ValueError("Bad path, please insert like this type of path \"m/0'/0\"!, not: %r" % ( path ))
 
+        if self._cache is not None:
+            if not self._root_private_key and not self._root_public_key:
+                raise ValueError("You can't drive this master key.")
+            node = self._cache.derive(self.node(), parse_path(path))
+            return self.from_node(node=node, path=self._path + path[1:])
+
         for index in path.lstrip("m/").split("/"):
             if "'" in index:
                 self._derive_key_by_index(int(index[:-1]) + BIP32KEY_HARDEN)
@@ -488,6 +496,226 @@ class HDWallet:
             self._path += ("/%d" % index)
             return self._derive_key_by_index(index)
 
+    def node(self) -> HDNode:
+        """
+        Get the current key as an immutable node.
+
+        Nodes derive children without touching the wallet, so a parent node can be
+        derived once and its children derived from it for every index.
+
+        :returns: HDNode -- Hierarchical Deterministic node.
+
+        >>> from hdwallet import HDWallet
+        >>> from hdwallet.symbols import BTC
+        >>> hdwallet = HDWallet(symbol=BTC)
+        >>> hdwallet.from_xprivate_key(xprivate_key="xprv9s21ZrQH143K3xPGUzpogJeKtRdjHkK6muBJo8v7rEVRzT83xJgNcLpMoJXUf9wJFKfuHR4SGvfgdShh4t9VmjjrE9usBunK3LfNna31LGF")
+        >>> hdwallet.from_path(path="m/44'/0'/0'/0")
+        >>> hdwallet.node().derive(index=0).index
+        0
+        """
+
+        if not self._chain_code:
+            raise ValueError("You can't drive xprivate_key and private_key.")
+
+        return HDNode(
+            chain_code=self._chain_code, private_key=self._private_key, public_key=self._lazy_public_key,
+            depth=self._depth, index=self._index, parent_fingerprint=self._parent_fingerprint,
+            backend=self._backend
+        )
+
+    def from_node(self, node: HDNode, path: Optional[Union[str, Derivation]] = None) -> "HDWallet":
+        """
+        Set the current key from a node, the node is the master key if there is none yet.
+
+        :param node: Hierarchical Deterministic node.
+        :type node: HDNode
+        :param path: Derivation path of the node, default to ``None`` (unknown, like a non-root xprivate key).
+        :type path: str, Derivation
+
+        :returns: HDWallet -- Hierarchical Deterministic Wallet instance.
+
+        >>> from hdwallet import HDWallet
+        >>> from hdwallet.symbols import BTC
+        >>> hdwallet = HDWallet(symbol=BTC)
+        >>> hdwallet.from_xprivate_key(xprivate_key="xprv9s21ZrQH143K3xPGUzpogJeKtRdjHkK6muBJo8v7rEVRzT83xJgNcLpMoJXUf9wJFKfuHR4SGvfgdShh4t9VmjjrE9usBunK3LfNna31LGF")
+        >>> account = hdwallet.node().derive_path(path="m/44'/0'/0'/0")
+        >>> hdwallet.from_node(node=account.derive(index=0), path="m/44'/0'/0'/0/0").p2pkh_address()
+        "184xW5gWDnhS7LriL2JAZs1XGTJjimz7pq"
+        """
+
+        if not isinstance(node, HDNode):
+            raise TypeError("Invalid node type, the node must be HDNode instance.")
+
+        if not self._root_private_key and not self._root_public_key:
+            if node.private_key is not None:
+                self._i = node.private_key + node.chain_code
+                self._root_private_key = (node.private_key, node.chain_code)
+            else:
+                self._root_public_key = (node.public_key, node.chain_code)
+            self._root_depth, self._root_parent_fingerprint, self._root_index = (
+                node.depth, node.parent_fingerprint, node.index
+            )
+            if self._semantic is None:
+                self._semantic = "p2pkh"
+
+        # keys the node has not computed yet stay lazy in the wallet too
+        self._private_key, self._public_key, self._chain_code = (
+            node.private_key, node._public_key, node.chain_code
+        )
+        self._depth, self._index = node.depth, node.index
+        if node._parent_fingerprint is None:
+            self._lazy_parent_fingerprint, self._parent_private_key = None, node._parent.private_key
+        else:
+            self._parent_fingerprint = node._parent_fingerprint
+        self._path = str(path) if path else "m"
+        return self
+
+    def derive_range(self, path: Union[str, Derivation], start: int, stop: int, hardened: bool = False,
+                     semantics: Iterable[str] = ("p2pkh",)) -> Iterator[ChildKey]:
+        """
+        Derive children ``start`` to ``stop`` (excluded) of a path, in order.
+
+        The path node is derived once (through the cache when there is one), then each
+        child from it, one at a time, and the wallet itself is left unchanged.
+
+        :param path: Derivation path of the parent, relative to the current key like ``from_path``.
+        :type path: str, Derivation
+        :param start: First child index.
+        :type start: int
+        :param stop: Child index to stop at, excluded.
+        :type stop: int
+        :param hardened: Hardened children, default to ``False``.
+        :type hardened: bool
+        :param semantics: Address semantics of every child, default to ``("p2pkh",)``.
+        :type semantics: list, tuple
+
+        :returns: generator -- Child key records.
+
+        >>> from hdwallet import HDWallet
+        >>> from hdwallet.symbols import BTC
+        >>> hdwallet = HDWallet(symbol=BTC)
+        >>> hdwallet.from_xprivate_key(xprivate_key="xprv9s21ZrQH143K3xPGUzpogJeKtRdjHkK6muBJo8v7rEVRzT83xJgNcLpMoJXUf9wJFKfuHR4SGvfgdShh4t9VmjjrE9usBunK3LfNna31LGF")
+        >>> [child.addresses["p2pkh"] for child in hdwallet.derive_range(path="m/44'/0'/0'/0", start=0, stop=2)]
+        ['184xW5gWDnhS7LriL2JAZs1XGTJjimz7pq', '1FyRqBXWTM3gUgB4eHU2jEosSqNp5MsQG8']
+        """
+
+        if not isinstance(start, int) or not isinstance(stop, int):
+            raise ValueError("Bad index, Please import only integer number!")
+        if not 0 <= start <= stop <= BIP32KEY_HARDEN:
+            raise ValueError(f"Invalid index range, must be 0 <= start <= stop <= {BIP32KEY_HARDEN}.")
+        semantics = self._address_semantics(semantics)
+        if not self._root_private_key and not self._root_public_key:
+            raise ValueError("You can't drive this master key.")
+
+        path = str(path)
+        indexes = parse_path(path)
+        if self._cache is not None:
+            parent = self._cache.derive(self.node(), indexes)
+        else:
+            parent = self.node().derive_path(path)
+        return self._derive_range(parent, self._path + path[1:], start, stop, hardened, semantics)
+
+    def _derive_range(self, parent: HDNode, parent_path: str, start: int, stop: int,
+                      hardened: bool, semantics: Tuple[str, ...]) -> Iterator[ChildKey]:
+        # a generator of its own, so that derive_range checks its arguments on call
+        suffix = "'" if hardened else ""
+        for index in range(start, stop):
+            yield self._child_key(
+                parent.derive(index, hardened=hardened), f"{parent_path}/{index}{suffix}", semantics
+            )
+
+    def derive_many(self, paths: Iterable[Union[str, Derivation]],
+                    semantics: Iterable[str] = ("p2pkh",)) -> List[ChildKey]:
+        """
+        Derive many scattered paths at once, every shared parent only once.
+
+        The paths form a prefix tree below the current key, each of its nodes is derived
+        a single time however many paths go through it, and the wallet itself is left unchanged.
+
+        :param paths: Derivation paths, relative to the current key like ``from_path``.
+        :type paths: list
+        :param semantics: Address semantics of every key, default to ``("p2pkh",)``.
+        :type semantics: list, tuple
+
+        :returns: list -- Child key records, in the order of the paths.
+
+        >>> from hdwallet import HDWallet
+        >>> from hdwallet.symbols import BTC
+        >>> hdwallet = HDWallet(symbol=BTC)
+        >>> hdwallet.from_xprivate_key(xprivate_key="xprv9s21ZrQH143K3xPGUzpogJeKtRdjHkK6muBJo8v7rEVRzT83xJgNcLpMoJXUf9wJFKfuHR4SGvfgdShh4t9VmjjrE9usBunK3LfNna31LGF")
+        >>> [child.addresses["p2pkh"] for child in hdwallet.derive_many(paths=["m/44'/0'/0'/0/1", "m/44'/0'/0'/0/0"])]
+        ['1FyRqBXWTM3gUgB4eHU2jEosSqNp5MsQG8', '184xW5gWDnhS7LriL2JAZs1XGTJjimz7pq']
+        """
+
+        semantics = self._address_semantics(semantics)
+        if not self._root_private_key and not self._root_public_key:
+            raise ValueError("You can't drive this master key.")
+
+        paths = [str(path) for path in paths]
+        nodes = derive_paths(self.node(), paths)
+        return [
+            self._child_key(node, self._path + path[1:], semantics) for path, node in zip(paths, nodes)
+        ]
+
+    @staticmethod
+    def _address_semantics(semantics: Iterable[str]) -> Tuple[str, ...]:
+        semantics = tuple(semantics)
+        for semantic in semantics:
+            if semantic not in ADDRESS_SEMANTICS:
+                raise ValueError(
+                    f"Invalid semantic {semantic!r}, choose only the following options {', '.join(ADDRESS_SEMANTICS)}."
+                )
+        return semantics
+
+    def _child_key(self, node: HDNode, path: str, semantics: Tuple[str, ...]) -> ChildKey:
+        public_key = node.public_key
+        return ChildKey(
+            index=node.index & ~BIP32KEY_HARDEN,
+            path=path,
+            public_key=public_key,
+            private_key=node.private_key,
+            addresses={
+                semantic: getattr(self, f"{semantic}_address")(public_key=public_key) for semantic in semantics
+            }
+        )
+
+    def child_public_keys(self, indexes: Iterable[int], compressed: bool = True) -> List[Optional[bytes]]:
+        """
+        Get non-hardened child public keys in bulk.
+
+        Child points are kept in jacobian coordinates and normalized together with a single modular inversion.
+
+        :param indexes: Non-hardened child indexes.
+        :type indexes: list, range
+        :param compressed: Compressed public keys, default to ``True``.
+        :type compressed: bool
+
+        :returns: list -- Child public keys SEC bytes, ``None`` for an invalid child index.
+
+        >>> from hdwallet import HDWallet
+        >>> from hdwallet.symbols import BTC
+        >>> hdwallet = HDWallet(symbol=BTC)
+        >>> hdwallet.from_xpublic_key(xpublic_key="xpub6FjoSaU1JaG6fC6wTYmb1mJzaZxSunxASN7nTRHhFynh33gKRfmmNrtQ82s8YouLCrEniskjumfACiiTyVmi4aXyLL8HvLdZc8mjKsbzT9z")
+        >>> [hdwallet.p2pkh_address(public_key=public_key) for public_key in hdwallet.child_public_keys(indexes=range(2))]
+        ['1QD5czMPfV7TLDXnHFcMKH2qZw1B7kAPqu', '16Po6JxzwqS2e7T2HmCrfmyCjsrMYHs3iH']
+        """
+
+        if not self._chain_code:
+            raise ValueError("You can't drive xprivate_key and private_key.")
+
+        public_key = self._public_key
+        key_point = S256Point.parse(public_key).jacobian()
+        points = []
+        for index in indexes:
+            if index < 0 or index & BIP32KEY_HARDEN:
+                raise DerivationError("Hardened derivation path is invalid for child public keys.")
+            i = hmac.new(self._chain_code, public_key + struct.pack(">L", index), hashlib.sha512).digest()
+            il_int = int.from_bytes(i[:32], "big")
+            points.append(
+                INFINITY_JACOBIAN if il_int >= N else jacobian_add(generator_multiply(il_int), key_point)
+            )
+        return batch_sec(points, compressed=compressed)
+
     def _derive_key_by_index(self, index) -> Optional["HDWallet"]:
 
         if not self._root_private_key and not self._root_public_key:
@@ -495,11 +723,11 @@ class HDWallet:
 
         i_str = struct.pack(">L", index)
         if index & BIP32KEY_HARDEN:
-            if self._key is None:
+            if self._private_key is None:
                 raise DerivationError("Hardened derivation path is invalid for xpublic key.")
-            data = b"\0" + self._key.to_string() + i_str
+            data = b"\0" + self._private_key + i_str
         else:
-            data = unhexlify(self.public_key()) + i_str
+            data = self._public_key + i_str
 
         if not self._chain_code:
             raise ValueError("You can't drive xprivate_key and private_key.")
@@ -507,57 +735,33 @@ class HDWallet:
         i = hmac.new(self._chain_code, data, hashlib.sha512).digest()
         il, ir = i[:32], i[32:]
 
-        il_int = string_to_int(il)
+        il_int = int.from_bytes(il, "big")
         if il_int > CURVE_ORDER:
             return None
 
-        if self._key:
-            pvt_int = string_to_int(self._key.to_string())
+        if self._private_key:
+            pvt_int = int.from_bytes(self._private_key, "big")
             k_int = (il_int + pvt_int) % CURVE_ORDER
             if k_int == 0:
                 return None
-            secret = (b"\0" * 32 + int_to_string(k_int))[-32:]
+            secret = k_int.to_bytes(32, "big")
 
-            self._private_key, self._chain_code, self._depth, self._index, self._parent_fingerprint = (
-                secret, ir, (self._depth + 1), index, unhexlify(self.finger_print())
+            if self._lazy_public_key is not None:
+                self._parent_fingerprint = self._node_hash("hash160")[:4]
+            else:
+                # parent fingerprint waits for a read too, only its private key is kept
+                self._lazy_parent_fingerprint, self._parent_private_key = None, self._private_key
+            self._private_key, self._chain_code, self._depth, self._index = (
+                secret, ir, (self._depth + 1), index
             )
-            self._key = ecdsa.SigningKey.from_string(self._private_key, curve=SECP256k1)
-            self._verified_key = self._key.get_verifying_key()
+            self._public_key = None
         else:
-            key_point = S256Point.parse(unhexlify(self.public_key()))
-            left_point = il_int * G
-            total = key_point + left_point
-
             self._chain_code, self._depth, self._index, self._parent_fingerprint = (
-                ir, (self._depth + 1), index, unhexlify(self.finger_print())
-            )
-            self._verified_key = ecdsa.VerifyingKey.from_string(
-                total.sec(), curve=SECP256k1
+                ir, (self._depth + 1), index, self._node_hash("hash160")[:4]
             )
+            self._public_key = self._backend.tweak_add(self._public_key, il_int)
         return self
 
-    @staticmethod
-    def _deserialize_xprivate_key(xprivate_key: str, encoded: bool = True) -> tuple:
-        decoded_xprivate_key = check_decode(xprivate_key) if encoded else xprivate_key
-        if len(decoded_xprivate_key) != 78:  # 156
-            raise ValueError("Invalid xprivate key.")
-        return (
-            decoded_xprivate_key[:4], decoded_xprivate_key[4:5],
-            decoded_xprivate_key[5:9], decoded_xprivate_key[9:13],
-            decoded_xprivate_key[13:45], decoded_xprivate_key[46:]
-        )
-
-    @staticmethod
-    def _deserialize_xpublic_key(xpublic_key: str, encoded: bool = True) -> tuple:
-        decoded_xpublic_key = check_decode(xpublic_key) if encoded else xpublic_key
-        if len(decoded_xpublic_key) != 78:  # 156
-            raise ValueError("Invalid xpublic key.")
-        return (
-            decoded_xpublic_key[:4], decoded_xpublic_key[4:5],
-            decoded_xpublic_key[5:9], decoded_xpublic_key[9:13],
-            decoded_xpublic_key[13:45], decoded_xpublic_key[45:]
-        )
-
     @staticmethod
     def _serialize_xkeys(version: bytes, depth: bytes, parent_fingerprint: bytes, index: bytes,
                          chain_code: bytes, data: bytes, encoded: bool = True) -> Optional[str]:
@@ -568,9 +772,8 @@ class HDWallet:
             return None
 
     def raw_sign(self, data, deterministic=True):
-        # sig_key = SigningKey.from_string(self._private_key, curve=SECP256k1)
-        sig_func = partial(self._key.sign_digest_deterministic, hashfunc=sha256) if deterministic else self._key.sign_digest
-        r, s, order = sig_func(data, sigencode=lambda *x: x)
+        r, s = self._backend.sign(self._private_key, data, deterministic=deterministic)
+        order = CURVE_ORDER
         if s < 0x01:
             raise ValueError('Too low s value for signature: {}'.format(s))
         # ref: https://github.com/bitcoin/bips/blob/master/bip-0062.mediawiki#Low_S_values_in_signatures
@@ -585,6 +788,102 @@ class HDWallet:
     def sign(self, data, deterministic=True):
         return sigencode_der(*self.raw_sign(data, deterministic))
 
+    def verify(self, data: bytes, signature: Tuple[int, int]) -> bool:
+        """
+        Verify signature.
+
+        :param data: Signed digest bytes.
+        :type data: bytes
+        :param signature: Signature ``(r, s)`` integers.
+        :type signature: tuple
+
+        :returns: bool -- Signature is valid.
+
+        >>> from hdwallet import HDWallet
+        >>> from hdwallet.symbols import BTC
+        >>> from hashlib import sha256
+        >>> hdwallet = HDWallet(symbol=BTC)
+        >>> hdwallet.from_private_key(private_key="6cd78b0d69eab1a47bfa53a52b9d8c4331e858b5d7a599270a95d9735fdb0b94")
+        >>> digest = sha256(b"meherett").digest()
+        >>> hdwallet.verify(data=digest, signature=hdwallet.raw_sign(data=digest)[:2])
+        True
+        """
+
+        return self._backend.verify(self._public_key, data, signature[:2])
+
+    def sign_many(self, digests: Iterable[bytes], deterministic: bool = True,
+                  der: bool = True) -> List[Union[bytes, Tuple[int, int]]]:
+        """
+        Sign many digests with the current private key.
+
+        :param digests: Digests bytes.
+        :type digests: list
+        :param deterministic: Deterministic (RFC6979) signatures, default to ``True``.
+        :type deterministic: bool
+        :param der: DER encoded signatures, default to ``True``.
+        :type der: bool
+
+        :returns: list -- DER signatures or ``(r, s)`` tuples, in the order of the digests.
+
+        >>> from hdwallet import HDWallet
+        >>> from hdwallet.symbols import BTC
+        >>> from hashlib import sha256
+        >>> hdwallet = HDWallet(symbol=BTC)
+        >>> hdwallet.from_private_key(private_key="6cd78b0d69eab1a47bfa53a52b9d8c4331e858b5d7a599270a95d9735fdb0b94")
+        >>> [signature.hex() for signature in hdwallet.sign_many(digests=[sha256(b"meherett").digest()])]
+        ['304402207d7a90576d99032acf892239e0c0ec4981521d7ad978f27cef5f8945d8a0d21602205120ee48a753ab24b825dc115307bda5702da0d15524440b8e0e87db27c9b59f']
+        """
+
+        if not self._private_key:
+            raise ValueError("You can't sign without private key.")
+
+        signatures = []
+        for r, s in self._backend.sign_many(self._private_key, digests, deterministic=deterministic):
+            # ref: https://github.com/bitcoin/bips/blob/master/bip-0062.mediawiki#Low_S_values_in_signatures
+            if s > highest_s:
+                s = CURVE_ORDER - s
+            signatures.append(sigencode_der(r, s, CURVE_ORDER) if der else (r, s))
+        return signatures
+
+    def sign_paths(self, items: Iterable[Tuple[Union[str, Derivation], bytes]], deterministic: bool = True,
+                   der: bool = True) -> List[Union[bytes, Tuple[int, int]]]:
+        """
+        Derive and sign many (path, digest) pairs.
+
+        Paths are derived from the current key like ``from_path``, each distinct path once,
+        and the current key is left unchanged.
+
+        :param items: Derivation path and digest bytes pairs.
+        :type items: list
+        :param deterministic: Deterministic (RFC6979) signatures, default to ``True``.
+        :type deterministic: bool
+        :param der: DER encoded signatures, default to ``True``.
+        :type der: bool
+
+        :returns: list -- DER signatures or ``(r, s)`` tuples, in the order of the items.
+
+        >>> from hdwallet import HDWallet
+        >>> from hdwallet.symbols import BTC
+        >>> from hashlib import sha256
+        >>> hdwallet = HDWallet(symbol=BTC)
+        >>> hdwallet.from_xprivate_key(xprivate_key="xprv9s21ZrQH143K3xPGUzpogJeKtRdjHkK6muBJo8v7rEVRzT83xJgNcLpMoJXUf9wJFKfuHR4SGvfgdShh4t9VmjjrE9usBunK3LfNna31LGF")
+        >>> [signature.hex() for signature in hdwallet.sign_paths(items=[("m/44'/0'/0'/0/0", sha256(b"meherett").digest()), ("m/44'/0'/0'/0/1", sha256(b"hdwallet").digest())])]
+        ['304402207d7a90576d99032acf892239e0c0ec4981521d7ad978f27cef5f8945d8a0d21602205120ee48a753ab24b825dc115307bda5702da0d15524440b8e0e87db27c9b59f', '304402204f3a931ff185ff402fb01dab40a7b91d2dd119c8334de2cd059cf5a3531b354802200562d2d35489fbe380ed7f8dd5a8bb96e57201a1597d8d3c84dccdb190be7386']
+        """
+
+        items, positions = list(items), {}
+        for position, (path, _) in enumerate(items):
+            positions.setdefault(str(path), []).append(position)
+
+        signatures: List[Union[bytes, Tuple[int, int], None]] = [None] * len(items)
+        for path, _positions in positions.items():
+            hdwallet = copy.copy(self).from_path(path=path)
+            for position, signature in zip(_positions, hdwallet.sign_many(
+                [items[position][1] for position in _positions], deterministic=deterministic, der=der
+            )):
+                signatures[position] = signature
+        return signatures
+
     def root_xprivate_key(self, encoded: bool = True) -> Optional[str]:
         """
         Get Root XPrivate Key.
@@ -605,9 +904,7 @@ class HDWallet:
 
         if self._semantic is None:
             return None
-        version = self._cryptocurrency.EXTENDED_PRIVATE_KEY.__getattribute__(
-            self._semantic.upper()
-        )
+        version = self._encoder.xprivate_key_versions.get(self._semantic)
         if version is None:
             raise NotImplementedError(
                 f"{self.__class__.__name__} is not implemented for {self._cryptocurrency.NAME} {self._cryptocurrency.NETWORK} cryptocurrency."
@@ -620,7 +917,7 @@ class HDWallet:
         index = struct.pack(">L", self._root_index)
         data = b"\x00" + secret_key
         return self._serialize_xkeys(
-            _unhexlify(version), depth, parent_fingerprint, index, chain_code, data, encoded
+            version, depth, parent_fingerprint, index, chain_code, data, encoded
         )
 
     def root_xpublic_key(self, encoded: bool = True) -> Optional[str]:
@@ -643,9 +940,7 @@ class HDWallet:
 
         if self._semantic is None:
             return None
-        version = self._cryptocurrency.EXTENDED_PUBLIC_KEY.__getattribute__(
-            self._semantic.upper()
-        )
+        version = self._encoder.xpublic_key_versions.get(self._semantic)
         if version is None:
             raise NotImplementedError(
                 f"{self.__class__.__name__} is not implemented for {self._cryptocurrency.NAME} {self._cryptocurrency.NETWORK} cryptocurrency."
@@ -663,7 +958,7 @@ class HDWallet:
         parent_fingerprint = self._root_parent_fingerprint
         index = struct.pack(">L", self._root_index)
         return self._serialize_xkeys(
-            _unhexlify(version), depth, parent_fingerprint, index, chain_code, data, encoded
+            version, depth, parent_fingerprint, index, chain_code, data, encoded
         )
 
     def xprivate_key(self, encoded=True) -> Optional[str]:
@@ -686,9 +981,7 @@ class HDWallet:
 
         if self._semantic is None:
             return None
-        version = self._cryptocurrency.EXTENDED_PRIVATE_KEY.__getattribute__(
-            self._semantic.upper()
-        )
+        version = self._encoder.xprivate_key_versions.get(self._semantic)
         if version is None:
             raise NotImplementedError(
                 f"{self.__class__.__name__} is not implemented for {self._cryptocurrency.NAME} {self._cryptocurrency.NETWORK} cryptocurrency."
@@ -701,7 +994,7 @@ class HDWallet:
             return None
         data = b"\x00" + unhexlify(self.private_key())
         return self._serialize_xkeys(
-            _unhexlify(version), depth, parent_fingerprint, index, chain_code, data, encoded
+            version, depth, parent_fingerprint, index, chain_code, data, encoded
         )
 
     def xpublic_key(self, encoded: bool = True) -> Optional[str]:
@@ -724,9 +1017,7 @@ class HDWallet:
 
         if self._semantic is None:
             return None
-        version = self._cryptocurrency.EXTENDED_PUBLIC_KEY.__getattribute__(
-            self._semantic.upper()
-        )
+        version = self._encoder.xpublic_key_versions.get(self._semantic)
         if version is None:
             raise NotImplementedError(
                 f"{self.__class__.__name__} is not implemented for {self._cryptocurrency.NAME} {self._cryptocurrency.NETWORK} cryptocurrency."
@@ -737,7 +1028,7 @@ class HDWallet:
         chain_code = self._chain_code
         data = unhexlify(self.public_key())
         return self._serialize_xkeys(
-            _unhexlify(version), depth, parent_fingerprint, index, chain_code, data, encoded
+            version, depth, parent_fingerprint, index, chain_code, data, encoded
         )
 
     def clean_derivation(self) -> "HDWallet":
@@ -764,16 +1055,13 @@ class HDWallet:
                 "m", "m", 0, b"\0\0\0\0", 0
             )
             self._private_key, self._chain_code = self._root_private_key
-            self._key = ecdsa.SigningKey.from_string(self._private_key, curve=SECP256k1)
-            self._verified_key = self._key.get_verifying_key()
+            self._public_key = None
         elif self._root_public_key:
             self._path, self._path_class, self._depth, self._parent_fingerprint, self._index = (
                 "m", "m", 0, b"\0\0\0\0", 0
             )
             self._chain_code = self._root_public_key[1]
-            self._verified_key = ecdsa.VerifyingKey.from_string(
-                self._root_public_key[0], curve=SECP256k1
-            )
+            self._public_key = self._backend.serialize(self._root_public_key[0])
         return self
 
     def uncompressed(self, compressed: Optional[str] = None) -> str:
@@ -794,15 +1082,8 @@ class HDWallet:
         "f93f58b97c3bb616645c3dda256ec946d87c45baf531984c022dd0fd1503b0a875f63285a539213ac241fc4a88e7137ba1c8d897b1c1e5efb81bfc6b45a22d40"
         """
 
-        p = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEFFFFFC2F
-        public_key = unhexlify(compressed) if compressed else unhexlify(self.compressed())
-        x = int.from_bytes(public_key[1:33], byteorder='big')
-        y_sq = (pow(x, 3, p) + 7) % p
-        y = pow(y_sq, (p + 1) // 4, p)
-        if y % 2 != public_key[0] % 2:
-            y = p - y
-        y = y.to_bytes(32, byteorder='big')
-        return (public_key[1:33] + y).hex()
+        public_key = unhexlify(compressed) if compressed else self._public_key
+        return self._backend.serialize(public_key, compressed=False)[1:].hex()
 
     def compressed(self, uncompressed: Optional[str] = None) -> str:
         """
@@ -822,16 +1103,8 @@ class HDWallet:
         "02f93f58b97c3bb616645c3dda256ec946d87c45baf531984c022dd0fd1503b0a8"
         """
 
-        _verified_key = ecdsa.VerifyingKey.from_string(
-            unhexlify(uncompressed), curve=SECP256k1
-        ) if uncompressed else self._verified_key
-        padx = (b"\0" * 32 + int_to_string(
-            _verified_key.pubkey.point.x()))[-32:]
-        if _verified_key.pubkey.point.y() & 1:
-            ck = b"\3" + padx
-        else:
-            ck = b"\2" + padx
-        return hexlify(ck).decode()
+        public_key = unhexlify(uncompressed) if uncompressed else self._public_key
+        return hexlify(self._backend.serialize(public_key)).decode()
 
     def private_key(self) -> str:
         """
@@ -848,7 +1121,7 @@ class HDWallet:
         "6cd78b0d69eab1a47bfa53a52b9d8c4331e858b5d7a599270a95d9735fdb0b94"
         """
 
-        return hexlify(self._key.to_string()).decode() if self._key else None
+        return hexlify(self._private_key).decode() if self._private_key else None
 
     def public_key(self, compressed: bool = True, private_key: Optional[str] = None) -> str:
         """
@@ -871,16 +1144,8 @@ class HDWallet:
         """
 
         if private_key:
-            key = ecdsa.SigningKey.from_string(
-                unhexlify(private_key), curve=SECP256k1)
-            verified_key = key.get_verifying_key()
-            padx = (b"\0" * 32 + int_to_string(
-                verified_key.pubkey.point.x()))[-32:]
-            if verified_key.pubkey.point.y() & 1:
-                ck = b"\3" + padx
-            else:
-                ck = b"\2" + padx
-            return hexlify(ck).decode() if compressed else self.uncompressed(compressed=hexlify(ck).decode())
+            public_key = self._backend.public_key(unhexlify(private_key), compressed=compressed)
+            return hexlify(public_key if compressed else public_key[1:]).decode()
         return self.compressed() if compressed else self.uncompressed()
 
     def strength(self) -> Optional[int]:
@@ -1093,9 +1358,9 @@ class HDWallet:
         "4d887566d408dfe5ea8090f2b716f9639523ca89"
         """
 
-        return hexlify(ripemd160(sha256(unhexlify(self.public_key(
-            private_key=private_key if private_key else self.private_key()
-        ))).digest())).decode("utf-8")
+        if private_key and private_key != self.private_key():
+            return hexlify(hash160(unhexlify(self.public_key(private_key=private_key)))).decode("utf-8")
+        return hexlify(self._node_hash("hash160")).decode("utf-8")
 
     def finger_print(self) -> str:
         """
@@ -1114,10 +1379,42 @@ class HDWallet:
 
         return self.hash(self.private_key())[:8]
 
-    def p2pkh_address(self) -> str:
+    def _compressed_public_key(self, public_key: Optional[AnyStr] = None) -> bytes:
+        return get_bytes(public_key) if public_key else self._public_key
+
+    def _node_hash(self, name: str, public_key: Optional[AnyStr] = None) -> bytes:
+        if public_key:
+            return self._script_hash(name, public_key)
+        # hashes of the current node are computed once and dropped as soon
+        # as its key changes (derivation, clean derivation or a new master key)
+        node_public_key, hashes = self._node_hashes
+        if node_public_key != self._public_key:
+            hashes = {}
+            self._node_hashes = (self._public_key, hashes)
+        if name not in hashes:
+            hashes[name] = self._script_hash(name)
+        return hashes[name]
+
+    def _script_hash(self, name: str, public_key: Optional[AnyStr] = None) -> bytes:
+        if name == "hash160":
+            return hash160(self._compressed_public_key(public_key))
+        elif name == "p2sh":
+            return hash160(script.p2pkh_script(self._node_hash("hash160", public_key)))
+        elif name == "p2wpkh_in_p2sh":
+            return hash160(script.p2wpkh_script(self._node_hash("hash160", public_key)))
+        elif name == "p2wsh":
+            return sha256(script.multisig_script(self._compressed_public_key(public_key))).digest()
+        elif name == "p2wsh_in_p2sh":
+            return hash160(script.p2wsh_script(self._node_hash("p2wsh", public_key)))
+        raise ValueError(f"Invalid script hash name {name!r}.")
+
+    def p2pkh_address(self, public_key: Optional[AnyStr] = None) -> str:
         """
         Get Pay to Public Key Hash (P2PKH) address.
 
+        :param public_key: Compressed public key bytes or hex string, default to ``None``.
+        :type public_key: bytes, str
+
         :returns: str -- P2PKH address.
 
         >>> from hdwallet import HDWallet
@@ -1129,38 +1426,19 @@ class HDWallet:
         "184xW5gWDnhS7LriL2JAZs1XGTJjimz7pq"
         """
 
-        if self._cryptocurrency.SYMBOL in ["ETH", "ETHTEST"]:
-            keccak_256 = keccak.new(digest_bits=256)
-            keccak_256.update(unhexlify(self.uncompressed()))
-            address = keccak_256.hexdigest()[24:]
-            return checksum_encode(address, crypto="eth")
-        elif self._cryptocurrency.SYMBOL in ["XDC", "XDCTEST"]:
-            keccak_256 = keccak.new(digest_bits=256)
-            keccak_256.update(unhexlify(self.uncompressed()))
-            address = keccak_256.hexdigest()[24:]
-            return checksum_encode(address, crypto="xdc")
-        elif self._cryptocurrency.SYMBOL in ["TRX"]:
-            keccak_256 = keccak.new(digest_bits=256)
-            keccak_256.update(unhexlify(self.uncompressed()))
-            address = keccak_256.hexdigest()[24:]
-            network_hash160_bytes = _unhexlify(self._cryptocurrency.PUBLIC_KEY_ADDRESS) + bytearray.fromhex(address)
-            return ensure_string(base58.b58encode_check(network_hash160_bytes))
-        elif self._cryptocurrency.SYMBOL in ["XRP"]:
-            XRPL_ALPHABET = b"rpshnaf39wBUDNEGHJKLM4PQRST7VWXYZ2bcdeCg65jkm8oFqi1tuvAxyz"
-            compressed_public_key = unhexlify(self.compressed())
-            public_key_hash = hashlib.new("ripemd160", sha256(compressed_public_key).digest()).digest()
-            network_hash160_bytes = _unhexlify(self._cryptocurrency.PUBLIC_KEY_ADDRESS) + public_key_hash
-            return ensure_string(base58.b58encode_check(network_hash160_bytes, alphabet=XRPL_ALPHABET))
-
-        compressed_public_key = unhexlify(self.compressed())
-        public_key_hash = ripemd160(sha256(compressed_public_key).digest())
-        network_hash160_bytes = _unhexlify(self._cryptocurrency.PUBLIC_KEY_ADDRESS) + public_key_hash
-        return ensure_string(base58.b58encode_check(network_hash160_bytes))
-
-    def p2sh_address(self) -> str:
+        if self._encoder.p2pkh_input == "uncompressed":
+            return self._encoder.p2pkh_address(
+                self._backend.serialize(self._compressed_public_key(public_key), compressed=False)
+            )
+        return self._encoder.p2pkh_address(self._node_hash("hash160", public_key))
+
+    def p2sh_address(self, public_key: Optional[AnyStr] = None) -> str:
         """
         Get Pay to Script Hash (P2SH) address.
 
+        :param public_key: Compressed public key bytes or hex string, default to ``None``.
+        :type public_key: bytes, str
+
         :returns: str -- P2SH address.
 
         >>> from hdwallet import HDWallet
@@ -1172,17 +1450,17 @@ class HDWallet:
         "3Jp6ad4ErhibQmhSRfavbPRiUyg2xTTT4j"
         """
 
-        compressed_public_key = unhexlify(self.compressed())
-        public_key_hash = hexlify(ripemd160(sha256(compressed_public_key).digest())).decode("utf-8")
-        public_key_hash_script = unhexlify("76a914" + public_key_hash + "88ac")
-        script_hash = ripemd160(sha256(public_key_hash_script).digest())
-        network_hash160_bytes = _unhexlify(self._cryptocurrency.SCRIPT_ADDRESS) + script_hash
-        return ensure_string(base58.b58encode_check(network_hash160_bytes))
+        script_hash = self._node_hash("p2sh", public_key)
+        network_hash160_bytes = self._encoder.script_address + script_hash
+        return check_encode(network_hash160_bytes)
 
-    def p2wpkh_address(self) -> Optional[str]:
+    def p2wpkh_address(self, public_key: Optional[AnyStr] = None) -> Optional[str]:
         """
         Get Pay to Witness Public Key Hash (P2WPKH) address.
 
+        :param public_key: Compressed public key bytes or hex string, default to ``None``.
+        :type public_key: bytes, str
+
         :returns: str -- P2WPKH address.
 
         >>> from hdwallet import HDWallet
@@ -1194,17 +1472,18 @@ class HDWallet:
         "bc1qfky82ek5pr07t65qjretw9hevw2j8j5fdrn5hc"
         """
 
-        compressed_public_key = unhexlify(self.compressed())
-        public_key_hash = ripemd160(sha256(compressed_public_key).digest())
-        segwit = self._cryptocurrency.SEGWIT_ADDRESS
-        if segwit.HRP is None:
+        public_key_hash = self._node_hash("hash160", public_key)
+        if self._encoder.hrp is None:
             return None
-        return ensure_string(encode(segwit.HRP, segwit.VERSION, public_key_hash))
+        return ensure_string(encode(self._encoder.hrp, self._encoder.segwit_version, public_key_hash))
 
-    def p2wpkh_in_p2sh_address(self) -> Optional[str]:
+    def p2wpkh_in_p2sh_address(self, public_key: Optional[AnyStr] = None) -> Optional[str]:
         """
         Get P2WPKH nested in P2SH address.
 
+        :param public_key: Compressed public key bytes or hex string, default to ``None``.
+        :type public_key: bytes, str
+
         :returns: str -- P2WPKH nested in P2SH address.
 
         >>> from hdwallet import HDWallet
@@ -1216,18 +1495,19 @@ class HDWallet:
         "3CCrxPrHNa6ePbnB7qjh7S3vaPx9qiLc3e"
         """
 
-        compressed_public_key = unhexlify(self.compressed())
-        public_key_hash = hexlify(ripemd160(sha256(compressed_public_key).digest())).decode("utf-8")
-        script_hash = ripemd160(sha256(unhexlify("0014" + public_key_hash)).digest())
-        network_hash160_bytes = _unhexlify(self._cryptocurrency.SCRIPT_ADDRESS) + script_hash
-        if self._cryptocurrency.SEGWIT_ADDRESS.HRP is None:
+        script_hash = self._node_hash("p2wpkh_in_p2sh", public_key)
+        network_hash160_bytes = self._encoder.script_address + script_hash
+        if self._encoder.hrp is None:
             return None
-        return ensure_string(base58.b58encode_check(network_hash160_bytes))
+        return check_encode(network_hash160_bytes)
 
-    def p2wsh_address(self) -> Optional[str]:
+    def p2wsh_address(self, public_key: Optional[AnyStr] = None) -> Optional[str]:
         """
         Get Pay to Witness Script Hash (P2WSH) address.
 
+        :param public_key: Compressed public key bytes or hex string, default to ``None``.
+        :type public_key: bytes, str
+
         :returns: str -- P2WSH address.
 
         >>> from hdwallet import HDWallet
@@ -1239,17 +1519,18 @@ class HDWallet:
         "bc1qaj2xa9j6eegcxls3y8p6erw6vdgdxynasrd4hl3xuctht5edu3msdeshgf"
         """
 
-        compressed_public_key = unhexlify("5121" + self.compressed() + "51ae")
-        script_hash = sha256(compressed_public_key).digest()
-        segwit = self._cryptocurrency.SEGWIT_ADDRESS
-        if segwit.HRP is None:
+        script_hash = self._node_hash("p2wsh", public_key)
+        if self._encoder.hrp is None:
             return None
-        return ensure_string(encode(segwit.HRP, segwit.VERSION, script_hash))
+        return ensure_string(encode(self._encoder.hrp, self._encoder.segwit_version, script_hash))
 
-    def p2wsh_in_p2sh_address(self) -> Optional[str]:
+    def p2wsh_in_p2sh_address(self, public_key: Optional[AnyStr] = None) -> Optional[str]:
         """
         Get P2WSH nested in P2SH address.
 
+        :param public_key: Compressed public key bytes or hex string, default to ``None``.
+        :type public_key: bytes, str
+
         :returns: str -- P2WSH nested in P2SH address.
 
         >>> from hdwallet import HDWallet
@@ -1261,13 +1542,11 @@ class HDWallet:
         "38YMonfh2yLFRViLrM2kdvZx8ctcp1vbbV"
         """
 
-        compressed_public_key = unhexlify("5121" + self.compressed() + "51ae")
-        script_hash = unhexlify("0020" + sha256(compressed_public_key).hexdigest())
-        script_hash = ripemd160(sha256(script_hash).digest())
-        network_hash160_bytes = _unhexlify(self._cryptocurrency.SCRIPT_ADDRESS) + script_hash
-        if self._cryptocurrency.SEGWIT_ADDRESS.HRP is None:
+        script_hash = self._node_hash("p2wsh_in_p2sh", public_key)
+        network_hash160_bytes = self._encoder.script_address + script_hash
+        if self._encoder.hrp is None:
             return None
-        return ensure_string(base58.b58encode_check(network_hash160_bytes))
+        return check_encode(network_hash160_bytes)
 
     def wif(self) -> Optional[str]:
         """
@@ -1284,7 +1563,7 @@ class HDWallet:
         "KzsHWUJsrTWUUhBGPfMMxLLydiH7NhEn6z7mKHXD5qNkUWaC4TEn"
         """
 
-        return check_encode(_unhexlify(self._cryptocurrency.WIF_SECRET_KEY) + self._key.to_string() + b"\x01") if self._key else None
+        return check_encode(self._encoder.wif_secret_key + self._private_key + b"\x01") if self._private_key else None
 
     def dumps(self) -> dict:
         """
@@ -1358,6 +1637,8 @@ class BIP32HDWallet(HDWallet):
     :type change: bool
     :param address: Address index, default to ``0``.
     :type address: int, tuple
+    :param backend: Elliptic curve backend name or instance, default to ``None``.
+    :type backend: str, Backend
 
     :returns: BIP32HDWallet -- BIP32 Hierarchical Deterministic Wallet instance.
 
@@ -1372,9 +1653,10 @@ class BIP32HDWallet(HDWallet):
                  coin_type: Union[int, Tuple[int, bool]] = 0,
                  account: Union[int, Tuple[int, bool]] = 0,
                  change: bool = False,
-                 address: Union[int, Tuple[int, bool]] = 0):
+                 address: Union[int, Tuple[int, bool]] = 0,
+                 backend: Optional[Union[str, Backend]] = None):
         super(BIP32HDWallet, self).__init__(
-            symbol=symbol, cryptocurrency=cryptocurrency, semantic="p2pkh"
+            symbol=symbol, cryptocurrency=cryptocurrency, semantic="p2pkh", backend=backend
         )
 
         self._from_class = True
@@ -1415,6 +1697,8 @@ class BIP44HDWallet(HDWallet):
     :type change: bool
     :param address: Address index, default to ``0``.
     :type address: int, tuple
+    :param backend: Elliptic curve backend name or instance, default to ``None``.
+    :type backend: str, Backend
 
     :returns: BIP44HDWallet -- BIP44 Hierarchical Deterministic Wallet instance.
 
@@ -1427,9 +1711,10 @@ class BIP44HDWallet(HDWallet):
     def __init__(self, symbol: str = "BTC", cryptocurrency: Any = None,
                  account: Union[int, Tuple[int, bool]] = 0,
                  change: bool = False,
-                 address: Union[int, Tuple[int, bool]] = 0):
+                 address: Union[int, Tuple[int, bool]] = 0,
+                 backend: Optional[Union[str, Backend]] = None):
         super(BIP44HDWallet, self).__init__(
-            symbol=symbol, cryptocurrency=cryptocurrency, semantic="p2pkh"
+            symbol=symbol, cryptocurrency=cryptocurrency, semantic="p2pkh", backend=backend
         )
 
         self._from_class = True
@@ -1468,6 +1753,8 @@ class BIP49HDWallet(HDWallet):
     :type change: bool
     :param address: Address index, default to ``0``.
     :type address: int, tuple
+    :param backend: Elliptic curve backend name or instance, default to ``None``.
+    :type backend: str, Backend
 
     :returns: BIP49HDWallet -- BIP49 Hierarchical Deterministic Wallet instance.
 
@@ -1480,9 +1767,10 @@ class BIP49HDWallet(HDWallet):
     def __init__(self, symbol: str = "BTC", cryptocurrency: Any = None,
                  account: Union[int, Tuple[int, bool]] = 0,
                  change: bool = False,
-                 address: Union[int, Tuple[int, bool]] = 0):
+                 address: Union[int, Tuple[int, bool]] = 0,
+                 backend: Optional[Union[str, Backend]] = None):
         super(BIP49HDWallet, self).__init__(
-            symbol=symbol, cryptocurrency=cryptocurrency, semantic="p2wpkh_in_p2sh"
+            symbol=symbol, cryptocurrency=cryptocurrency, semantic="p2wpkh_in_p2sh", backend=backend
         )
 
         self._from_class = True
@@ -1521,6 +1809,8 @@ class BIP84HDWallet(HDWallet):
     :type change: bool
     :param address: Address index, default to ``0``.
     :type address: int, tuple
+    :param backend: Elliptic curve backend name or instance, default to ``None``.
+    :type backend: str, Backend
 
     :returns: BIP84HDWallet -- BIP84 Hierarchical Deterministic Wallet instance.
 
@@ -1533,9 +1823,10 @@ class BIP84HDWallet(HDWallet):
     def __init__(self, symbol: str = "BTC", cryptocurrency: Any = None,
                  account: Union[int, Tuple[int, bool]] = 0,
                  change: bool = False,
-                 address: Union[int, Tuple[int, bool]] = 0):
+                 address: Union[int, Tuple[int, bool]] = 0,
+                 backend: Optional[Union[str, Backend]] = None):
         super(BIP84HDWallet, self).__init__(
-            symbol=symbol, cryptocurrency=cryptocurrency, semantic="p2wpkh"
+            symbol=symbol, cryptocurrency=cryptocurrency, semantic="p2wpkh", backend=backend
         )
 
         self._from_class = True
@@ -1572,6 +1863,8 @@ class BIP141HDWallet(HDWallet):
     :type path: str
     :param semantic: Extended semantic, defaults to ``P2WPKH``.
     :type semantic: str
+    :param backend: Elliptic curve backend name or instance, default to ``None``.
+    :type backend: str, Backend
 
     :returns: BIP141HDWallet -- BIP141 Hierarchical Deterministic Wallet instance.
 
@@ -1582,9 +1875,10 @@ class BIP141HDWallet(HDWallet):
     """
 
     def __init__(self, symbol: str = "BTC", cryptocurrency: Any = None,
-                 path: Union[str, Derivation] = None, semantic: str = "p2wpkh"):
+                 path: Union[str, Derivation] = None, semantic: str = "p2wpkh",
+                 backend: Optional[Union[str, Backend]] = None):
         super(BIP141HDWallet, self).__init__(
-            symbol=symbol, cryptocurrency=cryptocurrency, semantic=semantic
+            symbol=symbol, cryptocurrency=cryptocurrency, semantic=semantic, backend=backend
         )
 
         self._from_class = True
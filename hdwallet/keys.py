@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+
+from typing import (
+    Any, Dict, List, NamedTuple, Tuple, Union
+)
+
+from .cryptocurrencies import get_cryptocurrency
+from .encoders import get_encoder
+from .libs.base58 import (
+    check_decode, encode, is_base58
+)
+
+# Base58 string bounds of every accepted prefix, per cryptocurrency and key kind.
+_BOUNDS: Dict[Tuple[Any, str], List[tuple]] = {}
+
+
+class ExtendedKey(NamedTuple):
+    """
+    Parsed extended private or public key, immutable.
+
+    ``key`` is the 32 byte secret of an xprivate key (without its zero pad byte)
+    or the 33 byte compressed point of an xpublic key.
+    """
+
+    version: bytes
+    depth: int
+    parent_fingerprint: bytes
+    index: int
+    chain_code: bytes
+    key: bytes
+    semantic: str
+    is_private: bool
+
+    @property
+    def is_root(self) -> bool:
+        return self.depth == 0 and self.parent_fingerprint == b"\x00\x00\x00\x00" and self.index == 0
+
+
+def _cryptocurrency(cryptocurrency: Union[str, Any]) -> Any:
+    return get_cryptocurrency(symbol=cryptocurrency) if isinstance(cryptocurrency, str) else cryptocurrency
+
+
+def _bounds(cryptocurrency: Any, kind: str) -> List[tuple]:
+    """
+    Smallest and largest base58 string for each accepted prefix.
+
+    The standard alphabet is in ASCII order, so for strings of the same length
+    comparing (length, string) tuples is comparing the encoded numbers, and the
+    prefix of an input is known without decoding it.
+    """
+
+    bounds = _BOUNDS.get((cryptocurrency, kind))
+    if bounds is not None:
+        return bounds
+    bounds, encoder = [], get_encoder(cryptocurrency)
+    if kind == "wif":
+        prefix = encoder.wif_secret_key
+        for size, compressed in ([(36, False), (37, True)] if prefix is not None else []):
+            lowest, highest = encode(prefix + b"\x00" * size), encode(prefix + b"\xff" * size)
+            bounds.append(((len(lowest), lowest), (len(highest), highest), prefix, compressed))
+    else:
+        versions = encoder.xprivate_key_versions if kind == "private_key" else encoder.xpublic_key_versions
+        seen = set()
+        # Same order as utils.get_semantic, the first semantic of a shared version wins.
+        for semantic, version in versions.items():
+            if version is None or version in seen:
+                continue
+            seen.add(version)
+            lowest, highest = encode(version + b"\x00" * 78), encode(version + b"\xff" * 78)
+            bounds.append(((len(lowest), lowest), (len(highest), highest), version, semantic))
+    _BOUNDS[(cryptocurrency, kind)] = bounds
+    return bounds
+
+
+def _match(string: str, cryptocurrency: Any, kind: str) -> tuple:
+    if not is_base58(string):
+        return None
+    size = (len(string), string)
+    for lowest, highest, prefix, extra in _bounds(cryptocurrency, kind):
+        if lowest <= size <= highest:
+            return prefix, extra
+    return None
+
+
+def _parse_xkey(xkey: str, cryptocurrency: Any, kind: str) -> ExtendedKey:
+    name = "xprivate key" if kind == "private_key" else "xpublic key"
+    # Alphabet, length and version prefix first, no big int work for garbage.
+    match = _match(xkey, cryptocurrency, kind)
+    if match is None:
+        raise ValueError(f"Invalid {name}.")
+    raw = check_decode(xkey)
+    if len(raw) != 78:  # 156
+        raise ValueError(f"Invalid {name}.")
+    if (kind == "private_key" and raw[45] != 0) or (kind == "public_key" and raw[45] not in (2, 3)):
+        raise ValueError(f"Invalid {name}.")
+    return ExtendedKey(
+        version=raw[:4], depth=raw[4], parent_fingerprint=raw[5:9], index=int.from_bytes(raw[9:13], "big"),
+        chain_code=raw[13:45], key=raw[46:] if kind == "private_key" else raw[45:],
+        semantic=match[1], is_private=kind == "private_key"
+    )
+
+
+def parse_xprivate_key(xprivate_key: str, cryptocurrency: Union[str, Any]) -> ExtendedKey:
+    """
+    Parse an extended private key in one pass.
+
+    :param xprivate_key: Root or Non-Root XPrivate key.
+    :type xprivate_key: str
+    :param cryptocurrency: Cryptocurrency class or symbol.
+    :type cryptocurrency: Cryptocurrency, str
+
+    :returns: ExtendedKey -- Parsed extended key.
+
+    >>> from hdwallet.keys import parse_xprivate_key
+    >>> parse_xprivate_key(xprivate_key="xprv9s21ZrQH143K3xPGUzpogJeKtRdjHkK6muBJo8v7rEVRzT83xJgNcLpMoJXUf9wJFKfuHR4SGvfgdShh4t9VmjjrE9usBunK3LfNna31LGF", cryptocurrency="BTC").is_root
+    True
+    """
+
+    return _parse_xkey(xprivate_key, _cryptocurrency(cryptocurrency), "private_key")
+
+
+def parse_xpublic_key(xpublic_key: str, cryptocurrency: Union[str, Any]) -> ExtendedKey:
+    """
+    Parse an extended public key in one pass.
+
+    :param xpublic_key: Root or Non-Root XPublic key.
+    :type xpublic_key: str
+    :param cryptocurrency: Cryptocurrency class or symbol.
+    :type cryptocurrency: Cryptocurrency, str
+
+    :returns: ExtendedKey -- Parsed extended key.
+
+    >>> from hdwallet.keys import parse_xpublic_key
+    >>> parse_xpublic_key(xpublic_key="xpub661MyMwAqRbcGSTjb2Mp3Sb4STUDhD2x986ubXKjQa2QsFTCVqzdA98qeZjcncHT1AaZcMSjiP1HJ16jH97q72RwyFfiNhmG8zQ6KBB5PaQ", cryptocurrency="BTC").semantic
+    "p2pkh"
+    """
+
+    return _parse_xkey(xpublic_key, _cryptocurrency(cryptocurrency), "public_key")
+
+
+def parse_wif(wif: str, cryptocurrency: Union[str, Any]) -> Tuple[bytes, bool]:
+    """
+    Parse a Wallet Important Format (WIF) private key in one pass.
+
+    :param wif: Wallet important format.
+    :type wif: str
+    :param cryptocurrency: Cryptocurrency class or symbol.
+    :type cryptocurrency: Cryptocurrency, str
+
+    :returns: tuple -- Private key bytes and whether it is for a compressed public key.
+
+    >>> from hdwallet.keys import parse_wif
+    >>> parse_wif(wif="KzsHWUJsrTWUUhBGPfMMxLLydiH7NhEn6z7mKHXD5qNkUWaC4TEn", cryptocurrency="BTC")[0].hex()
+    "6cd78b0d69eab1a47bfa53a52b9d8c4331e858b5d7a599270a95d9735fdb0b94"
+    """
+
+    cryptocurrency = _cryptocurrency(cryptocurrency)
+    match = _match(wif, cryptocurrency, "wif")
+    if match is None:
+        raise ValueError(f"Invalid {cryptocurrency.NAME} wallet important format.")
+    (prefix, compressed), raw = match, check_decode(wif)
+    if len(raw) != len(prefix) + 32 + compressed or (compressed and raw[-1] != 1):
+        raise ValueError(f"Invalid {cryptocurrency.NAME} wallet important format.")
+    return raw[len(prefix):len(prefix) + 32], compressed
@@ -2,38 +2,123 @@
 
 from hashlib import sha256
 
-from Crypto.Hash import keccak
+import math
 import six
 
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
 
-__base58_alphabet = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
-__base58_alphabet_bytes = b"123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
-__base58_radix = len(__base58_alphabet)
+from .keccak import keccak_256, keccak_256_many
+
+
+ALPHABET = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+XRP_ALPHABET = "rpshnaf39wBUDNEGHJKLM4PQRST7VWXYZ2bcdeCg65jkm8oFqi1tuvAxyz"
+
+__base58_radix = len(ALPHABET)
+# Digits handled per big int divmod/multiply, 58 ** 10 still fits in 64 bits.
+__base58_chunk = 10
+__base58_chunk_radix = __base58_radix ** __base58_chunk
+# Reverse lookup tables, from a character code to its digit or -1, per alphabet.
+__base58_tables = {}
+# Two digit strings for every value below 58 ** 2, per alphabet.
+__base58_pairs = {}
+# str.translate tables deleting every character of an alphabet.
+__base58_deletions = {}
+
+# Address prefix (or base58check version for TRX) of each Keccak account address family.
+ACCOUNT_PREFIXES = {"eth": "0x", "xdc": "xdc", "trx": b"\x41"}
+# 0x20 for hex digits whose nibble has the high bit set, the case bit EIP-55 flips.
+__nibble_mask = bytes(0x20 if character in b"89abcdef" else 0 for character in range(256))
+# Batches below this size are cheaper one address at a time than through NumPy.
+ACCOUNT_BATCH_THRESHOLD = 1024
+
+
+def _alphabet(alphabet):
+    return alphabet.decode("ascii") if isinstance(alphabet, (bytes, bytearray)) else alphabet
+
+
+def _table(alphabet):
+    table = __base58_tables.get(alphabet)
+    if table is None:
+        table = [-1] * 256
+        for digit, character in enumerate(alphabet):
+            table[ord(character)] = digit
+        __base58_tables[alphabet] = table
+    return table
+
+
+def _checksum_case(addr):
+    # Upper case the letters of a lower case hex address where the matching
+    # nibble of its Keccak-256 digest is 8 or more (EIP-55), all in big ints:
+    # letters have 0x40 set, so (value >> 1) & mask clears their 0x20 case bit.
+    raw = addr.encode("ascii")
+    mask = keccak_256(raw).hex()[:len(raw)].encode("ascii").translate(__nibble_mask)
+    value = int.from_bytes(raw, "big")
+    return (value - (int.from_bytes(mask, "big") & value >> 1)).to_bytes(len(raw), "big").decode("ascii")
+
+
+def is_base58(data, alphabet=ALPHABET):
+    """Whether data is a non-empty string of alphabet characters, checked without decoding it."""
+    alphabet = _alphabet(alphabet)
+    deletions = __base58_deletions.get(alphabet)
+    if deletions is None:
+        deletions = __base58_deletions[alphabet] = str.maketrans("", "", alphabet)
+    return isinstance(data, str) and bool(data) and not data.translate(deletions)
 
 
 def checksum_encode(address, crypto="eth"):
-    out = ""
-    keccak_256 = keccak.new(digest_bits=256)
     addr = address.lower().replace("0x", "") if crypto == "eth" else address.lower().replace("xdc", "")
-    keccak_256.update(addr.encode("ascii"))
-    hash_addr = keccak_256.hexdigest()
-    for i, c in enumerate(addr):
-        if int(hash_addr[i], 16) >= 8:
-            out += c.upper()
-        else:
-            out += c
-    return ("0x" + out) if crypto == "eth" else ("xdc" + out)
+    return ("0x" if crypto == "eth" else "xdc") + _checksum_case(addr)
+
+
+def account_addresses(public_keys, crypto="eth"):
+    """Keccak account addresses of N uncompressed public keys, EIP-55 checksummed for eth and xdc.
+
+    public_keys is a sequence of 64 byte (or 0x04 prefixed 65 byte) keys, or an (N, 64) uint8 array.
+    Large batches hash both Keccak-256 passes with NumPy and apply the checksum case as a nibble mask.
+    """
+    if crypto not in ACCOUNT_PREFIXES:
+        raise ValueError(f"Invalid account address crypto {crypto!r}.")
+    prefix = ACCOUNT_PREFIXES[crypto]
+    if numpy is not None and isinstance(public_keys, numpy.ndarray):
+        keys = public_keys[:, 1:] if public_keys.ndim == 2 and public_keys.shape[1] == 65 else public_keys
+        if keys.ndim != 2 or keys.shape[1] != 64:
+            raise ValueError("Public keys must be an (N, 64) uint8 array.")
+    else:
+        keys = [bytes(key[1:] if len(key) == 65 else key) for key in public_keys]
+        if any(len(key) != 64 for key in keys):
+            raise ValueError("Public keys must be 64 bytes uncompressed.")
+    count = len(keys)
+
+    if numpy is None or count < ACCOUNT_BATCH_THRESHOLD:
+        if not isinstance(keys, list):
+            keys = [key.tobytes() for key in keys]
+        hashes = [keccak_256(key)[12:] for key in keys]
+        if crypto == "trx":
+            return [check_encode(prefix + _hash) for _hash in hashes]
+        return [prefix + _checksum_case(_hash.hex()) for _hash in hashes]
+
+    hashes = keccak_256_many(keys)[:, 12:]
+    if crypto == "trx":
+        return check_encode_many(hashes, version=prefix)
+    # Lower case hex as ASCII, then the EIP-55 case bit from the digest of that hex.
+    hexes = numpy.empty((count, 40), dtype=numpy.uint8)
+    digits = numpy.frombuffer(b"0123456789abcdef", dtype=numpy.uint8)
+    hexes[:, 0::2], hexes[:, 1::2] = digits[hashes >> 4], digits[hashes & 15]
+    digests = keccak_256_many(hexes)[:, :20]
+    mask = numpy.empty((count, 40), dtype=numpy.uint8)
+    mask[:, 0::2], mask[:, 1::2] = digests & 0x80, (digests & 0x08) << 4
+    hexes -= (mask & (hexes << 1)) >> 2
+    text = hexes.tobytes().decode("ascii")
+    return [prefix + text[index:index + 40] for index in range(0, 40 * count, 40)]
 
 
 def string_to_int(data):
-    val = 0
-
     if type(data) == str:
         data = bytearray(data)
-
-    for (i, c) in enumerate(data[::-1]):
-        val += (256 ** i) * c
-    return val
+    return int.from_bytes(data, "big")
 
 
 def ensure_string(data):
@@ -44,49 +129,123 @@ def ensure_string(data):
     return data
 
 
-def encode(data):
-    enc = ""
-    val = string_to_int(data)
-    while val >= __base58_radix:
-        val, mod = divmod(val, __base58_radix)
-        enc = __base58_alphabet[mod] + enc
-    if val:
-        enc = __base58_alphabet[val] + enc
-
+def _pairs(alphabet):
+    pairs = __base58_pairs.get(alphabet)
+    if pairs is None:
+        pairs = [high + low for high in alphabet for low in alphabet]
+        __base58_pairs[alphabet] = pairs
+    return pairs
+
+
+def encode(data, alphabet=ALPHABET):
+    alphabet = _alphabet(alphabet)
+    pairs, pair_radix = _pairs(alphabet), __base58_radix ** 2
+    val, chunks = string_to_int(data), []
+    # Peel 10 digits per big int divmod, each chunk is then written two digits at a time.
+    while val:
+        val, chunk = divmod(val, __base58_chunk_radix)
+        for _ in range(__base58_chunk // 2):
+            chunk, mod = divmod(chunk, pair_radix)
+            chunks.append(pairs[mod])
     n = len(data) - len(data.lstrip(b"\0"))
-    return __base58_alphabet[0] * n + enc
+    return alphabet[0] * n + "".join(reversed(chunks)).lstrip(alphabet[0])
 
 
-def check_encode(raw):
+def check_encode(raw, alphabet=ALPHABET):
     chk = sha256(sha256(raw).digest()).digest()[:4]
-    return encode(raw + chk)
-
-
-def decode(data):
-    if bytes != str:
-        data = bytes(data, "ascii")
-
-    val = 0
-    prefix = 0
-    for c in data:
-        val = (val * __base58_radix) + __base58_alphabet_bytes.find(c)
-        if val == 0:
-            prefix += 1
-
-    dec = bytearray()
-    while val > 0:
-        val, mod = divmod(val, 256)
-        dec.append(mod)
-
-    dec.extend(bytearray(prefix))
-
-    return bytes(dec[::-1])
-
-
-def check_decode(enc):
-    dec = decode(enc)
+    return encode(raw + chk, alphabet)
+
+
+def decode(data, alphabet=ALPHABET):
+    alphabet = _alphabet(alphabet)
+    if isinstance(data, (bytes, bytearray)):
+        data = data.decode("ascii")
+    table = _table(alphabet)
+    try:
+        digits = [table[ord(character)] for character in data]
+    except IndexError:
+        digits = [-1]
+    if -1 in digits:
+        raise ValueError("Invalid base58 string, character not in alphabet")
+
+    prefix = len(data) - len(data.lstrip(alphabet[0]))
+    val, head = 0, len(digits) % __base58_chunk
+    # Accumulate 10 digits at a time into the big int.
+    for i in range(0, head):
+        val = val * __base58_radix + digits[i]
+    for i in range(head, len(digits), __base58_chunk):
+        chunk = 0
+        for digit in digits[i:i + __base58_chunk]:
+            chunk = chunk * __base58_radix + digit
+        val = val * __base58_chunk_radix + chunk
+    return b"\0" * prefix + val.to_bytes((val.bit_length() + 7) // 8, "big")
+
+
+def check_decode(enc, alphabet=ALPHABET):
+    dec = decode(enc, alphabet)
     raw, chk = dec[:-4], dec[-4:]
     if chk != sha256(sha256(raw).digest()).digest()[:4]:
         raise ValueError("base58 decoding checksum error")
     else:
         return raw
+
+
+def check_encode_many(payloads, version=b"", alphabet=ALPHABET):
+    """Base58check encode N fixed-width payloads, each prefixed with version, into a list of strings.
+
+    payloads is an (N, width) uint8 array or a sequence of N bytes objects of the same width.
+    Checksums are hashed one row at a time, the radix 58 conversion runs on all rows at once
+    with NumPy, dividing big-endian 32-bit limbs by 58 ** 5 per pass.
+    """
+    if numpy is None:
+        raise ImportError("NumPy is required for check_encode_many, install it first.")
+    alphabet, version = _alphabet(alphabet), bytes(version)
+    if not isinstance(payloads, numpy.ndarray):
+        payloads = list(payloads)
+        if len({len(payload) for payload in payloads}) > 1:
+            raise ValueError("Payloads must all have the same width.")
+        payloads = numpy.frombuffer(b"".join(payloads), dtype=numpy.uint8).reshape(
+            len(payloads), len(payloads[0]) if payloads else 0
+        )
+    if payloads.ndim != 2 or payloads.dtype != numpy.uint8:
+        raise ValueError("Payloads must be a two dimensional uint8 array.")
+    count, width = payloads.shape
+    length = len(version) + width + 4
+    if not count:
+        return []
+
+    # version + payload + checksum rows, left padded with zeros to whole 32-bit limbs
+    pad = -length % 4
+    rows = numpy.zeros((count, pad + length), dtype=numpy.uint8)
+    rows[:, pad:pad + len(version)] = numpy.frombuffer(version, dtype=numpy.uint8)
+    rows[:, pad + len(version):-4] = payloads
+    rows[:, -4:] = numpy.frombuffer(b"".join([
+        sha256(sha256(version + payload.tobytes()).digest()).digest()[:4] for payload in payloads
+    ]), dtype=numpy.uint8).reshape(count, 4)
+
+    limbs = rows.view(">u4").astype(numpy.uint64)
+    radix, chunk_radix, shift = numpy.uint64(__base58_radix), numpy.uint64(__base58_radix ** 5), numpy.uint64(32)
+    digits = math.ceil(length * math.log(256) / math.log(__base58_radix))
+    columns = []
+    # Each pass divides every row by 58 ** 5, remainders stay below 2 ** 30
+    # so remainder * 2 ** 32 + limb fits in 64 bits.
+    for k in range(-(-digits // 5)):
+        # limbs above the bits left after k passes are zero for every row
+        bits = length * 8 - math.floor(k * 5 * math.log2(__base58_radix))
+        remainder = numpy.zeros(count, dtype=numpy.uint64)
+        for j in range(max(0, limbs.shape[1] - -(-bits // 32)), limbs.shape[1]):
+            current = (remainder << shift) | limbs[:, j]
+            limbs[:, j], remainder = numpy.divmod(current, chunk_radix)
+        for _ in range(5):
+            columns.append(remainder % radix)
+            remainder //= radix
+    table = numpy.frombuffer(alphabet.encode("ascii"), dtype=numpy.uint8)
+    text = table[numpy.stack(columns[::-1], axis=1)].tobytes().decode("ascii")
+
+    # leading zero bytes become leading zero digits, other leading zero digits are dropped
+    nonzero = rows[:, pad:] != 0
+    zeros = numpy.where(nonzero.any(axis=1), nonzero.argmax(axis=1), length).tolist()
+    size = len(columns)
+    return [
+        alphabet[0] * zeros[i] + text[i * size:(i + 1) * size].lstrip(alphabet[0]) for i in range(count)
+    ]
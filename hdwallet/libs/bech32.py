@@ -20,19 +20,31 @@
 
 """Reference implementation for Bech32 and segwit addresses."""
 
+from functools import lru_cache
 
 CHARSET = "qpzry9x8gf2tvdw0s3jn54khce6mua7l"
+GENERATOR = [0x3b6a57b2, 0x26508e6d, 0x1ea119fa, 0x3d4233dd, 0x2a1462b3]
 
+# Generator contributions indexed by the five bits shifted out of the checksum
+# register, so each symbol costs one lookup instead of five conditional xors.
+POLYMOD_TABLE = [
+    GENERATOR[0] * (top & 1) ^ GENERATOR[1] * (top >> 1 & 1) ^ GENERATOR[2] * (top >> 2 & 1) ^
+    GENERATOR[3] * (top >> 3 & 1) ^ GENERATOR[4] * (top >> 4 & 1) for top in range(32)
+]
+CHARSET_REVERSE = {x: i for i, x in enumerate(CHARSET)}
+# Both cases, for decoding without lowering (and normalising non-ASCII) first.
+__charset_words = dict(CHARSET_REVERSE, **{x.upper(): i for x, i in CHARSET_REVERSE.items()})
 
-def bech32_polymod(values):
+# Checksum registers kept after the expanded HRP, bounded since decoding takes
+# the HRP from untrusted input (one entry per SEGWIT_ADDRESS.HRP in practice).
+HRP_STATE_CACHE_SIZE = 256
+
+
+def bech32_polymod(values, chk=1):
     """Internal function that computes the Bech32 checksum."""
-    generator = [0x3b6a57b2, 0x26508e6d, 0x1ea119fa, 0x3d4233dd, 0x2a1462b3]
-    chk = 1
+    table = POLYMOD_TABLE
     for value in values:
-        top = chk >> 25
-        chk = (chk & 0x1ffffff) << 5 ^ value
-        for i in range(5):
-            chk ^= generator[i] if ((top >> i) & 1) else 0
+        chk = (chk & 0x1ffffff) << 5 ^ value ^ table[chk >> 25]
     return chk
 
 
@@ -41,15 +53,20 @@ def bech32_hrp_expand(hrp):
     return [ord(x) >> 5 for x in hrp] + [0] + [ord(x) & 31 for x in hrp]
 
 
+@lru_cache(maxsize=HRP_STATE_CACHE_SIZE)
+def bech32_hrp_state(hrp):
+    """Checksum state after the expanded HRP, LRU cached by HRP."""
+    return bech32_polymod(bech32_hrp_expand(hrp))
+
+
 def bech32_verify_checksum(hrp, data):
     """Verify a checksum given HRP and converted data characters."""
-    return bech32_polymod(bech32_hrp_expand(hrp) + data) == 1
+    return bech32_polymod(data, bech32_hrp_state(hrp)) == 1
 
 
 def bech32_create_checksum(hrp, data):
     """Compute the checksum values given HRP and data."""
-    values = bech32_hrp_expand(hrp) + data
-    polymod = bech32_polymod(values + [0, 0, 0, 0, 0, 0]) ^ 1
+    polymod = bech32_polymod(data + [0, 0, 0, 0, 0, 0], bech32_hrp_state(hrp)) ^ 1
     return [(polymod >> 5 * (5 - i)) & 31 for i in range(6)]
 
 
@@ -68,10 +85,11 @@ def bech32_decode(bech):
     pos = bech.rfind('1')
     if pos < 1 or pos + 7 > len(bech) or len(bech) > 90:
         return None, None
-    if not all(x in CHARSET for x in bech[pos+1:]):
+    try:
+        data = [CHARSET_REVERSE[x] for x in bech[pos+1:]]
+    except KeyError:
         return None, None
     hrp = bech[:pos]
-    data = [CHARSET.find(x) for x in bech[pos+1:]]
     if not bech32_verify_checksum(hrp, data):
         return None, None
     return hrp, data[:-6]
@@ -102,22 +120,91 @@ def convertbits(data, frombits, tobits, pad=True):
 
 def decode(hrp, addr):
     """Decode a segwit address."""
-    hrpgot, data = bech32_decode(addr)
-    if hrpgot != hrp:
-        return None, None
-    decoded = convertbits(data[1:], 5, 8, False)
-    if decoded is None or len(decoded) < 2 or len(decoded) > 40:
-        return None, None
-    if data[0] > 16:
-        return None, None
-    if data[0] == 0 and len(decoded) != 20 and len(decoded) != 32:
-        return None, None
-    return data[0], decoded
+    return decode_many(hrp, [addr])[0]
+
+
+def _is_valid_hrp(hrp):
+    """Whether an HRP survives the Bech32 decoder unchanged."""
+    return bool(hrp) and hrp == hrp.lower() and all(33 <= ord(x) <= 126 for x in hrp)
+
+
+def _program_to_words(witprog):
+    """Pad an 8-bit witness program into 5-bit words, as convertbits(witprog, 8, 5)."""
+    bits = len(witprog) * 8
+    pad = -bits % 5
+    value = int.from_bytes(bytes(witprog), "big") << pad
+    return [(value >> shift) & 31 for shift in range(bits + pad - 5, -5, -5)]
 
 
 def encode(hrp, witver, witprog):
     """Encode a segwit address."""
-    ret = bech32_encode(hrp, [witver] + convertbits(witprog, 8, 5))
-    if decode(hrp, ret) == (None, None):
-        return None
-    return ret
+    return encode_many(hrp, witver, [witprog])[0]
+
+
+def encode_many(hrp, witver, programs):
+    """Encode segwit addresses sharing one HRP and witness version (None for invalid programs)."""
+    if not _is_valid_hrp(hrp) or not 0 <= witver <= 16:
+        return [None] * len(programs)
+    state = bech32_polymod([witver], bech32_hrp_state(hrp))
+    prefix, charset, table = hrp + "1" + CHARSET[witver], CHARSET, POLYMOD_TABLE
+    addresses = []
+    for witprog in programs:
+        # Same rules the decoder enforces, checked up front instead of decoding the result.
+        if len(witprog) < 2 or len(witprog) > 40 or (witver == 0 and len(witprog) not in (20, 32)):
+            addresses.append(None)
+            continue
+        words = _program_to_words(witprog)
+        if len(prefix) + len(words) + 6 > 90:
+            addresses.append(None)
+            continue
+        chk = state
+        for value in words:
+            chk = (chk & 0x1ffffff) << 5 ^ value ^ table[chk >> 25]
+        for _ in range(6):
+            chk = (chk & 0x1ffffff) << 5 ^ table[chk >> 25]
+        chk ^= 1
+        addresses.append(
+            prefix + "".join([charset[value] for value in words]) +
+            "".join([charset[(chk >> 5 * (5 - i)) & 31] for i in range(6)])
+        )
+    return addresses
+
+
+def decode_many(hrp, addresses):
+    """Decode segwit addresses for one HRP ((None, None) for invalid addresses)."""
+    if not _is_valid_hrp(hrp):
+        return [(None, None)] * len(addresses)
+    state, words_map, table = bech32_hrp_state(hrp), __charset_words, POLYMOD_TABLE
+    size = len(hrp) + 1
+    heads = (hrp + "1", hrp.upper() + "1")
+    results = []
+    for addr in addresses:
+        # The separator is the last "1" as the data characters never include it,
+        # so matching the head also pins the HRP.
+        if len(addr) > 90 or len(addr) < size + 6 or addr[:size] not in heads or \
+                (addr != addr.lower() and addr != addr.upper()):
+            results.append((None, None))
+            continue
+        try:
+            words = [words_map[x] for x in addr[size:]]
+        except KeyError:
+            results.append((None, None))
+            continue
+        chk = state
+        for value in words:
+            chk = (chk & 0x1ffffff) << 5 ^ value ^ table[chk >> 25]
+        # Witness version, then at least two program bytes.
+        if chk != 1 or len(words) < 10 or words[0] > 16:
+            results.append((None, None))
+            continue
+        witver, bits, value = words[0], (len(words) - 7) * 5, 0
+        for word in words[1:-6]:
+            value = value << 5 | word
+        pad = bits % 8
+        length = bits // 8
+        if pad >= 5 or value & ((1 << pad) - 1) or length > 40 or \
+                (witver == 0 and length != 20 and length != 32):
+            results.append((None, None))
+            continue
+        results.append((witver, list((value >> pad).to_bytes(length, "big"))))
+    return results
@@ -1,46 +1,42 @@
+from collections import OrderedDict, namedtuple
 from io import BytesIO
 
+from .base58 import encode, check_encode
+from .ripemd160 import hash160
+
 import hashlib
 import hmac
+import os
+import threading
 
 A = 0
 B = 7
 P = 2**256 - 2**32 - 977
 N = 0xfffffffffffffffffffffffffffffffebaaedce6af48a03bbfd25e8cd0364141
-BASE58_ALPHABET = '123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz'
+# secp256k1 endomorphism: lambda * (x, y) == (beta * x, y)
+GLV_BETA = 0x7ae96a2b657c07106e64479eac3434e99cf0497512f58995c1396c28719501ee
+GLV_LAMBDA = 0x5363ad4cc05c30e0a5261c028812645a122e22ea20816678df02967c1b23bd72
+# short lattice basis used to split scalars, (a1, b1) and (a2, b2)
+GLV_A1 = 0x3086d221a7d46bcde86c90e49284eb15
+GLV_B1 = -0xe4437ed6010e88286f547fa90abfe4c3
+GLV_A2 = 0x114ca50f7a8e2f3f657c1108d9d44cfd8
+GLV_B2 = 0x3086d221a7d46bcde86c90e49284eb15
+# window width of the wNAF digits used by interleaved multiplication
+WNAF_WINDOW = 5
 
 
 def encode_base58(data):
     """
     This function encodes bytes to a base58 string
     """
-    # determine how many 0 bytes (b'\x00') s starts with
-    count = 0
-    for byte in data:
-        if byte == 0:
-            count += 1
-        else:
-            break
-    # convert to big endian integer
-    num = int.from_bytes(data, 'big')
-    prefix = '1' * count
-    result = ''
-    while num > 0:
-        num, mod = divmod(num, 58)
-        result = BASE58_ALPHABET[mod] + result
-    return prefix + result
+    return encode(data)
 
 
 def encode_base58_checksum(data):
     """
     This function returns the Base58 check format
     """
-    return encode_base58(data + hash256(data)[:4])
-
-
-def hash160(data):
-    """sha256 followed by ripemd160"""
-    return hashlib.new('ripemd160', hashlib.sha256(data).digest()).digest()
+    return check_encode(data)
 
 
 def hash256(data):
@@ -53,8 +49,506 @@ def sha256(data):
     return hashlib.sha256(data).digest()
 
 
+def jacobian_double(point):
+    '''doubles a point given in jacobian coordinates (X, Y, Z) over plain ints'''
+    x, y, z = point
+    # Z == 0 represents the point at infinity, Y == 0 is tangent to the vertical line
+    if not z or not y:
+        return INFINITY_JACOBIAN
+    ysq = y * y % P
+    s = 4 * x * ysq % P
+    # m = 3 * x**2 + a * z**4, but a is 0 on secp256k1
+    m = 3 * x * x % P
+    nx = (m * m - 2 * s) % P
+    ny = (m * (s - nx) - 8 * ysq * ysq) % P
+    nz = 2 * y * z % P
+    return nx, ny, nz
+
+
+def jacobian_add(point, other):
+    '''adds two points given in jacobian coordinates without any modular inversion'''
+    x1, y1, z1 = point
+    x2, y2, z2 = other
+    if not z1:
+        return other
+    if not z2:
+        return point
+    # when other is affine (Z == 1) this is a mixed addition and a few products go away
+    if z2 == 1:
+        u1, s1 = x1, y1
+    else:
+        z2z2 = z2 * z2 % P
+        u1, s1 = x1 * z2z2 % P, y1 * z2 * z2z2 % P
+    z1z1 = z1 * z1 % P
+    u2, s2 = x2 * z1z1 % P, y2 * z1 * z1z1 % P
+    if u1 == u2:
+        if s1 != s2:
+            return INFINITY_JACOBIAN
+        return jacobian_double(point)
+    h = (u2 - u1) % P
+    r = (s2 - s1) % P
+    h2 = h * h % P
+    h3 = h * h2 % P
+    u1h2 = u1 * h2 % P
+    nx = (r * r - h3 - 2 * u1h2) % P
+    ny = (r * (u1h2 - nx) - s1 * h3) % P
+    nz = h * z1 % P if z2 == 1 else h * z1 * z2 % P
+    return nx, ny, nz
+
+
+def jacobian_multiply(point, coefficient):
+    '''multiplies a jacobian point by an integer with a left-to-right double-and-add'''
+    if not point[2] or not coefficient:
+        return INFINITY_JACOBIAN
+    result = INFINITY_JACOBIAN
+    for bit in bin(coefficient)[2:]:
+        result = jacobian_double(result)
+        if bit == '1':
+            result = jacobian_add(result, point)
+    return result
+
+
+def glv_split(coefficient):
+    '''splits a scalar k into (k1, k2) of about 128 bits each with k == k1 + k2 * lambda (mod N)'''
+    k = coefficient % N
+    # round(b2 * k / N) and round(-b1 * k / N) with integer arithmetic
+    c1 = (GLV_B2 * k + N // 2) // N
+    c2 = (-GLV_B1 * k + N // 2) // N
+    k1 = k - c1 * GLV_A1 - c2 * GLV_A2
+    k2 = -c1 * GLV_B1 - c2 * GLV_B2
+    return k1, k2
+
+
+def glv_multiply(point, coefficient):
+    '''multiplies a jacobian point by an integer using the secp256k1 endomorphism'''
+    if not point[2] or not coefficient % N:
+        return INFINITY_JACOBIAN
+    # both ~128-bit halves share one interleaved run of doublings
+    return _strauss(_glv_terms(from_jacobian(point), coefficient))
+
+
+def _glv_terms(affine, coefficient):
+    '''returns the two non-negative (scalar, point) halves of k * (x, y)'''
+    x, y = affine
+    k1, k2 = glv_split(coefficient)
+    # lambda * (x, y) == (beta * x, y), negative halves use the negated point
+    return [
+        (abs(k1), (x, y if k1 >= 0 else P - y, 1)),
+        (abs(k2), (GLV_BETA * x % P, y if k2 >= 0 else P - y, 1))
+    ]
+
+
+def wnaf(coefficient, window=WNAF_WINDOW):
+    '''returns the width-w non-adjacent form of a non-negative integer, least significant digit first'''
+    digits, k = [], coefficient
+    while k:
+        if k & 1:
+            # odd digits in the range -2**(w-1) < d < 2**(w-1)
+            digit = k & ((1 << window) - 1)
+            if digit >= 1 << (window - 1):
+                digit -= 1 << window
+            k -= digit
+        else:
+            digit = 0
+        digits.append(digit)
+        k >>= 1
+    return digits
+
+
+def _odd_multiples(points, window=WNAF_WINDOW):
+    '''returns the affine odd multiples P, 3P, 5P, ... of every jacobian point, sharing one inversion'''
+    multiples = []
+    for point in points:
+        double, odd = jacobian_double(point), [point]
+        for _ in range((1 << (window - 2)) - 1):
+            odd.append(jacobian_add(odd[-1], double))
+        multiples.extend(odd)
+    affine, size = batch_from_jacobian(multiples), 1 << (window - 2)
+    return [affine[i * size:(i + 1) * size] for i in range(len(points))]
+
+
+def _interleave(tables):
+    '''evaluates the sum over (wnaf digits, positive multiples, negative multiples) tables'''
+    result = INFINITY_JACOBIAN
+    for i in range(max(len(digits) for digits, _, _ in tables) - 1, -1, -1):
+        result = jacobian_double(result)
+        for digits, positive, negative in tables:
+            if i < len(digits):
+                digit = digits[i]
+                if digit > 0:
+                    result = jacobian_add(result, positive[digit >> 1])
+                elif digit < 0:
+                    result = jacobian_add(result, negative[-digit >> 1])
+    return result
+
+
+def _strauss(terms, window=WNAF_WINDOW):
+    '''interleaved wNAF evaluation of the sum of k * P over non-negative (k, P) terms'''
+    terms = [(k, point) for k, point in terms if k and point[2]]
+    if not terms:
+        return INFINITY_JACOBIAN
+    tables = []
+    for (k, _), odd in zip(terms, _odd_multiples([point for _, point in terms], window)):
+        tables.append((
+            wnaf(k, window),
+            [(x, y, 1) for x, y in odd],
+            [(x, P - y, 1) for x, y in odd]
+        ))
+    return _interleave(tables)
+
+
+def multi_scalar_multiply(terms):
+    '''computes the sum of k * P over (k, P) jacobian terms in a single interleaved pass'''
+    generator, halves = 0, []
+    for coefficient, point in terms:
+        coefficient %= N
+        if not coefficient or not point[2]:
+            continue
+        affine = from_jacobian(point)
+        # every multiple of G is folded into one fixed-base table lookup
+        if affine == (G.x.num, G.y.num):
+            generator += coefficient
+            continue
+        halves.extend(_glv_terms(affine, coefficient))
+    result = _strauss(halves)
+    if generator % N:
+        result = jacobian_add(result, generator_multiply(generator))
+    return result
+
+
+def verify_many(items):
+    '''verifies (S256Point, z, Signature) items, returns one bool per item'''
+    items = list(items)
+    # the odd multiples of every distinct key (and of its endomorphism image,
+    # which only rescales x) are built once and normalized with one inversion
+    keys = {}
+    for point, _, _ in items:
+        if point.x is not None:
+            keys.setdefault((point.x.num, point.y.num), len(keys))
+    tables = []
+    for odd in (_odd_multiples([(x, y, 1) for x, y in keys]) if keys else []):
+        tables.append((
+            [(x, y, 1) for x, y in odd],
+            [(x, P - y, 1) for x, y in odd],
+            [(GLV_BETA * x % P, y, 1) for x, y in odd],
+            [(GLV_BETA * x % P, P - y, 1) for x, y in odd]
+        ))
+    results = []
+    for point, z, sig in items:
+        if point.x is None or not (0 < sig.r < N and 0 < sig.s < N):
+            results.append(False)
+            continue
+        positive, negative, endo_positive, endo_negative = tables[keys[(point.x.num, point.y.num)]]
+        s_inv = pow(sig.s, N - 2, N)
+        u, v = z * s_inv % N, sig.r * s_inv % N
+        k1, k2 = glv_split(v)
+        # v * P == k1 * P + k2 * lambda * P, a negative half swaps the tables
+        x, _, z3 = jacobian_add(_interleave([
+            (wnaf(abs(k1)),) + ((positive, negative) if k1 >= 0 else (negative, positive)),
+            (wnaf(abs(k2)),) + ((endo_positive, endo_negative) if k2 >= 0 else (endo_negative, endo_positive))
+        ]), generator_multiply(u))
+        # compare against X / Z**2 without converting back to affine
+        results.append(z3 != 0 and x == sig.r * z3 * z3 % P)
+    return results
+
+
+def batch_verify(items):
+    '''returns whether every (S256Point, z, Signature) item verifies'''
+    return all(verify_many(items))
+
+
+def from_jacobian(point):
+    '''returns the affine (x, y) ints of a jacobian point, or None for infinity'''
+    x, y, z = point
+    if not z:
+        return None
+    if z == 1:
+        return x, y
+    # the only modular inversion of the whole computation
+    z_inv = pow(z, P - 2, P)
+    z_inv2 = z_inv * z_inv % P
+    return x * z_inv2 % P, y * z_inv2 * z_inv % P
+
+
+def batch_inverse(values, modulus=P):
+    '''inverts many non-zero field elements with a single modular inversion'''
+    # Montgomery's trick: keep the running products, invert the last one
+    # and walk back, peeling one factor off per element
+    prefix, accumulator = [], 1
+    for value in values:
+        prefix.append(accumulator)
+        accumulator = accumulator * value % modulus
+    inverse = pow(accumulator, modulus - 2, modulus)
+    result = [0] * len(values)
+    for i in range(len(values) - 1, -1, -1):
+        result[i] = inverse * prefix[i] % modulus
+        inverse = inverse * values[i] % modulus
+    return result
+
+
+def batch_from_jacobian(points):
+    '''returns the affine (x, y) ints of many jacobian points sharing one modular inversion'''
+    finite = [point for point in points if point[2]]
+    inverses = iter(batch_inverse([z for _, _, z in finite]) if finite else [])
+    result = []
+    for x, y, z in points:
+        if not z:
+            result.append(None)
+            continue
+        z_inv = next(inverses)
+        z_inv2 = z_inv * z_inv % P
+        result.append((x * z_inv2 % P, y * z_inv2 * z_inv % P))
+    return result
+
+
+def batch_sec(points, compressed=True):
+    '''returns the SEC encodings of many jacobian points, None for the point at infinity'''
+    result = []
+    for affine in batch_from_jacobian(points):
+        if affine is None:
+            result.append(None)
+        elif compressed:
+            result.append((b'\x03' if affine[1] & 1 else b'\x02') + affine[0].to_bytes(32, 'big'))
+        else:
+            result.append(b'\x04' + affine[0].to_bytes(32, 'big') + affine[1].to_bytes(32, 'big'))
+    return result
+
+
+INFINITY_JACOBIAN = (0, 1, 0)
+
+# window width in bits of the fixed-base table for G, the table holds
+# d * 2**(w*i) * G for every window i and every non-zero digit d
+G_TABLE_WINDOW = 8
+# set to a file path to persist the fixed-base table between processes
+G_TABLE_ENVIRON = 'HDWALLET_ECC_TABLE'
+G_TABLE_MAGIC = b'HDWG'
+
+_g_table = None
+
+
+def build_generator_table():
+    '''builds the fixed-base table for G as rows of affine jacobian points'''
+    rows, base = [], (G.x.num, G.y.num, 1)
+    for _ in range(-(-256 // G_TABLE_WINDOW)):
+        row, current = [], base
+        for _ in range((1 << G_TABLE_WINDOW) - 1):
+            row.append(current)
+            current = jacobian_add(current, base)
+        rows.append(row)
+        # the next row starts at 2**window times this row's base, kept affine for mixed additions
+        base = from_jacobian(current) + (1,)
+    # normalize every entry with one shared inversion so that lookups are cheap mixed additions
+    affine = iter(batch_from_jacobian([point for row in rows for point in row]))
+    table = []
+    for row in rows:
+        table.append([None] + [next(affine) + (1,) for _ in row])
+    return table
+
+
+def save_generator_table(path, table=None):
+    '''writes the fixed-base table for G to path'''
+    table = table if table is not None else generator_table()
+    data = G_TABLE_MAGIC + bytes([G_TABLE_WINDOW]) + b''.join(
+        x.to_bytes(32, 'big') + y.to_bytes(32, 'big')
+        for row in table for x, y, _ in row[1:]
+    )
+    with open(path, 'wb') as table_file:
+        table_file.write(data + sha256(data))
+
+
+def load_generator_table(path):
+    '''reads a fixed-base table for G from path, returns None when the file does not match'''
+    with open(path, 'rb') as table_file:
+        data = table_file.read()
+    data, checksum = data[:-32], data[-32:]
+    if not data.startswith(G_TABLE_MAGIC) or sha256(data) != checksum:
+        return None
+    window = data[len(G_TABLE_MAGIC)]
+    if window != G_TABLE_WINDOW:
+        return None
+    stream, size = BytesIO(data[len(G_TABLE_MAGIC) + 1:]), (1 << window) - 1
+    table = []
+    for _ in range(-(-256 // window)):
+        row = [None]
+        for _ in range(size):
+            entry = stream.read(64)
+            if len(entry) != 64:
+                return None
+            row.append((int.from_bytes(entry[:32], 'big'), int.from_bytes(entry[32:], 'big'), 1))
+        table.append(row)
+    if not valid_generator_table(table, window):
+        return None
+    return table
+
+
+def _jacobian_equals(point, affine):
+    '''compares a jacobian point with an affine (x, y, 1) one without any modular inversion'''
+    x, y, z = point
+    if not z:
+        return False
+    zz = z * z % P
+    return x == affine[0] * zz % P and y == affine[1] * zz * z % P
+
+
+def _affine_sum(point, other, total):
+    '''checks total == point + other for distinct affine points, cross-multiplied instead of inverted'''
+    dx, dy = (other[0] - point[0]) % P, (other[1] - point[1]) % P
+    if not dx:
+        return False
+    dx2 = dx * dx % P
+    # x3 == lambda**2 - x1 - x2 and y3 == lambda * (x1 - x3) - y1, with lambda == dy / dx
+    return (total[0] * dx2 - dy * dy + (point[0] + other[0]) * dx2) % P == 0 and \
+        ((total[1] + point[1]) * dx - dy * (point[0] - total[0])) % P == 0
+
+
+def valid_generator_table(table, window=G_TABLE_WINDOW):
+    '''checks every entry of a fixed-base table for G, a tampered or corrupt table would silently give wrong keys'''
+    size = (1 << window) - 1
+    if len(table) != -(-256 // window) or any(len(row) != size + 1 for row in table):
+        return False
+    for row in table:
+        for x, y, z in row[1:]:
+            if z != 1 or not (0 <= x < P and 0 <= y < P) or (y * y - x * x * x - B) % P:
+                return False
+    # row i starts at 2**(window*i) * G and holds its multiples in order, the
+    # row after it starts at 2**window times its start
+    if table[0][1] != (G.x.num, G.y.num, 1):
+        return False
+    for i, row in enumerate(table):
+        base = row[1]
+        if not _jacobian_equals(jacobian_double(base), row[2]):
+            return False
+        for digit in range(2, size):
+            if not _affine_sum(row[digit], base, row[digit + 1]):
+                return False
+        if i + 1 < len(table) and not _affine_sum(row[size], base, table[i + 1][1]):
+            return False
+    return True
+
+
+def generator_table():
+    '''returns the fixed-base table for G, built (or loaded) once per process'''
+    global _g_table
+    if _g_table is None:
+        path, table = os.environ.get(G_TABLE_ENVIRON), None
+        if path and os.path.isfile(path):
+            try:
+                table = load_generator_table(path)
+            except (OSError, IndexError):
+                table = None
+        if table is None:
+            table = build_generator_table()
+            if path:
+                try:
+                    save_generator_table(path, table)
+                except OSError:
+                    pass
+        _g_table = table
+    return _g_table
+
+
+def generator_multiply(coefficient):
+    '''multiplies G by an integer with the fixed-base table, returns a jacobian point'''
+    coef = coefficient % N
+    mask = (1 << G_TABLE_WINDOW) - 1
+    result = INFINITY_JACOBIAN
+    for row in generator_table():
+        if not coef:
+            break
+        digit = coef & mask
+        if digit:
+            result = jacobian_add(result, row[digit])
+        coef >>= G_TABLE_WINDOW
+    return result
+
+
+# maximum number of compressed SEC keys kept with their decompressed y,
+# can also be set through the environment, 0 disables the cache
+DECOMPRESSION_CACHE_ENVIRON = 'HDWALLET_DECOMPRESSION_CACHE'
+DECOMPRESSION_CACHE_SIZE = 1024
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
+
+def _environ_cache_size():
+    '''returns the cache size set in the environment, the default when it is unset or not a size'''
+    try:
+        maxsize = int(os.environ.get(DECOMPRESSION_CACHE_ENVIRON, DECOMPRESSION_CACHE_SIZE))
+    except ValueError:
+        return DECOMPRESSION_CACHE_SIZE
+    return maxsize if maxsize >= 0 else DECOMPRESSION_CACHE_SIZE
+
+
+_decompression_cache = OrderedDict()
+_decompression_maxsize = _environ_cache_size()
+_decompression_hits = 0
+_decompression_misses = 0
+# guards the cache and its statistics, the square root itself runs unlocked
+_decompression_lock = threading.Lock()
+
+
+def decompress(sec_bin):
+    '''returns the (x, y) ints of a compressed SEC key, LRU cached by the 33 bytes'''
+    global _decompression_hits, _decompression_misses
+    sec_bin = bytes(sec_bin)
+    with _decompression_lock:
+        point = _decompression_cache.get(sec_bin)
+        if point is not None:
+            _decompression_hits += 1
+            _decompression_cache.move_to_end(sec_bin)
+            return point
+        _decompression_misses += 1
+    x = int.from_bytes(sec_bin[1:], 'big')
+    if len(sec_bin) != 33 or sec_bin[0] not in (2, 3) or x >= P:
+        raise ValueError('Invalid compressed SEC key {}'.format(sec_bin.hex()))
+    # right side of the equation y^2 = x^3 + 7, solve for left side
+    alpha = (x * x * x + B) % P
+    beta = pow(alpha, (P + 1) // 4, P)
+    if beta * beta % P != alpha:
+        raise ValueError('({}, ...) is not on the curve'.format(x))
+    # b'\x02' prefix for an even y, b'\x03' for an odd y
+    if beta % 2 != sec_bin[0] % 2:
+        beta = P - beta
+    point = (x, beta)
+    with _decompression_lock:
+        if _decompression_maxsize > 0:
+            _decompression_cache[sec_bin] = point
+            if len(_decompression_cache) > _decompression_maxsize:
+                _decompression_cache.popitem(last=False)
+    return point
+
+
+def decompression_cache_info():
+    '''returns the hits, misses, maxsize and currsize of the decompression cache'''
+    with _decompression_lock:
+        return CacheInfo(
+            _decompression_hits, _decompression_misses, _decompression_maxsize, len(_decompression_cache)
+        )
+
+
+def set_decompression_cache_size(maxsize):
+    '''sets the maximum size of the decompression cache, dropping the oldest entries'''
+    global _decompression_maxsize
+    if maxsize < 0:
+        raise ValueError('Cache size must be positive or 0 to disable it')
+    with _decompression_lock:
+        _decompression_maxsize = maxsize
+        while len(_decompression_cache) > maxsize:
+            _decompression_cache.popitem(last=False)
+
+
+def clear_decompression_cache():
+    '''empties the decompression cache and resets its statistics'''
+    global _decompression_hits, _decompression_misses
+    with _decompression_lock:
+        _decompression_cache.clear()
+        _decompression_hits = _decompression_misses = 0
+
+
 class FieldElement:
 
+    __slots__ = ('num', 'prime')
+
     def __init__(self, num, prime):
         if num >= prime or num < 0:
             error = 'Num {} not in field range 0 to {}'.format(
@@ -127,6 +621,8 @@ class FieldElement:
 
 class Point:
 
+    __slots__ = ('a', 'b', 'x', 'y')
+
     def __init__(self, x, y, a, b):
         self.a = a
         self.b = b
@@ -218,24 +714,82 @@ class Point:
 
 class S256Field(FieldElement):
 
+    # secp256k1 only, the prime is always P so the arithmetic skips the
+    # field checks of FieldElement and reduces plain ints directly
+    __slots__ = ()
+
     def __init__(self, num, prime=None):
-        super().__init__(num=num, prime=P)
+        if num >= P or num < 0:
+            raise ValueError('Num {} not in field range 0 to {}'.format(num, P - 1))
+        self.num = num
+        self.prime = P
+
+    @classmethod
+    def _new(cls, num):
+        '''returns an S256Field from an already reduced int'''
+        element = object.__new__(cls)
+        element.num = num
+        element.prime = P
+        return element
 
     def __repr__(self):
         return '{:x}'.format(self.num).zfill(64)
 
+    def __eq__(self, other):
+        if other is None:
+            return False
+        return self.num == other.num and self.prime == other.prime
+
+    def __add__(self, other):
+        return self._new((self.num + other.num) % P)
+
+    def __sub__(self, other):
+        return self._new((self.num - other.num) % P)
+
+    def __mul__(self, other):
+        return self._new(self.num * other.num % P)
+
+    def __pow__(self, exponent):
+        return self._new(pow(self.num, exponent % (P - 1), P))
+
+    def __truediv__(self, other):
+        return self._new(self.num * pow(other.num, P - 2, P) % P)
+
+    def __rmul__(self, coefficient):
+        return self._new(self.num * coefficient % P)
+
     def sqrt(self):
         return self**((P + 1) // 4)
 
 
+S256_A = S256Field(A)
+S256_B = S256Field(B)
+
+
 class S256Point(Point):
 
+    # the curve parameters are shared constants, the curve equation is
+    # checked on plain ints and only for points built from outside input
+    __slots__ = ()
+
     def __init__(self, x, y, a=None, b=None):
-        a, b = S256Field(A), S256Field(B)
+        self.a, self.b = S256_A, S256_B
+        if x is None and y is None:
+            self.x = self.y = None
+            return
         if type(x) == int:
-            super().__init__(x=S256Field(x), y=S256Field(y), a=a, b=b)
-        else:
-            super().__init__(x=x, y=y, a=a, b=b)
+            x, y = S256Field(x), S256Field(y)
+        if (y.num * y.num - x.num * x.num * x.num - B) % P:
+            raise ValueError('({}, {}) is not on the curve'.format(x, y))
+        self.x, self.y = x, y
+
+    @classmethod
+    def _new(cls, x, y):
+        '''returns an S256Point from ints known to be on the curve'''
+        point = object.__new__(cls)
+        point.a, point.b = S256_A, S256_B
+        point.x, point.y = S256Field._new(x), S256Field._new(y)
+        return point
 
     def __repr__(self):
         if self.x is None:
@@ -243,9 +797,49 @@ class S256Point(Point):
         else:
             return 'S256Point({}, {})'.format(self.x, self.y)
 
+    def __eq__(self, other):
+        if self.x is None or other.x is None:
+            return self.x is None and other.x is None
+        return self.x.num == other.x.num and self.y.num == other.y.num
+
+    def __add__(self, other):
+        if self.x is None:
+            return other
+        if other.x is None:
+            return self
+        x1, y1, x2, y2 = self.x.num, self.y.num, other.x.num, other.y.num
+        if x1 == x2:
+            if (y1 + y2) % P == 0:
+                return self.__class__(None, None)
+            # tangent slope s = 3*x1**2 / (2*y1)
+            s = 3 * x1 * x1 * pow(2 * y1, P - 2, P) % P
+        else:
+            s = (y2 - y1) * pow(x2 - x1, P - 2, P) % P
+        x3 = (s * s - x1 - x2) % P
+        return self._new(x3, (s * (x1 - x3) - y1) % P)
+
     def __rmul__(self, coefficient):
         coef = coefficient % N
-        return super().__rmul__(coef)
+        if self.x is None or coef == 0:
+            return self.__class__(None, None)
+        # multiply in jacobian coordinates and convert back to affine once
+        if self == G:
+            return self.from_jacobian(generator_multiply(coef))
+        return self.from_jacobian(glv_multiply(self.jacobian(), coef))
+
+    def jacobian(self):
+        '''returns the point as jacobian (X, Y, Z) ints'''
+        if self.x is None:
+            return INFINITY_JACOBIAN
+        return self.x.num, self.y.num, 1
+
+    @classmethod
+    def from_jacobian(cls, point):
+        '''returns an S256Point from jacobian (X, Y, Z) ints'''
+        affine = from_jacobian(point)
+        if affine is None:
+            return cls(None, None)
+        return cls._new(*affine)
 
     def verify(self, z, sig):
         # By Fermat's Little Theorem, 1/s = pow(s, N-2, N)
@@ -255,8 +849,9 @@ class S256Point(Point):
         # v = r / s
         v = sig.r * s_inv % N
         # u*G + v*P should have as the x coordinate, r
-        total = u * G + v * self
-        return total.x.num == sig.r
+        x, _, z = multi_scalar_multiply([(u, G.jacobian()), (v, self.jacobian())])
+        # compare against X / Z**2 without converting back to affine
+        return z != 0 and x == sig.r * z * z % P
 
     def sec(self, compressed=True):
         '''returns the binary version of the SEC format'''
@@ -292,22 +887,7 @@ class S256Point(Point):
             x = int.from_bytes(sec_bin[1:33], 'big')
             y = int.from_bytes(sec_bin[33:65], 'big')
             return S256Point(x=x, y=y)
-        is_even = sec_bin[0] == 2
-        x = S256Field(int.from_bytes(sec_bin[1:], 'big'))
-        # right side of the equation y^2 = x^3 + 7
-        alpha = x**3 + S256Field(B)
-        # solve for left side
-        beta = alpha.sqrt()
-        if beta.num % 2 == 0:
-            even_beta = beta
-            odd_beta = S256Field(P - beta.num)
-        else:
-            even_beta = S256Field(P - beta.num)
-            odd_beta = beta
-        if is_even:
-            return S256Point(x, even_beta)
-        else:
-            return S256Point(x, odd_beta)
+        return S256Point._new(*decompress(sec_bin))
 
 
 G = S256Point(
@@ -370,7 +950,15 @@ class PrivateKey:
 
     def __init__(self, secret):
         self.secret = secret
-        self.point = secret * G
+        self._point = None
+        self._k_hmac = None
+
+    @property
+    def point(self):
+        # computed on first use, signing does not need the public point
+        if self._point is None:
+            self._point = self.secret * G
+        return self._point
 
     def hex(self):
         return '{:x}'.format(self.secret).zfill(64)
@@ -397,7 +985,13 @@ class PrivateKey:
         z_bytes = z.to_bytes(32, 'big')
         secret_bytes = self.secret.to_bytes(32, 'big')
         s256 = hashlib.sha256
-        k = hmac.new(k, v + b'\x00' + secret_bytes + z_bytes, s256).digest()
+        # the first HMAC has a fixed key and starts with the secret, keep its
+        # state around so signing many digests only hashes z from there on
+        if self._k_hmac is None:
+            self._k_hmac = hmac.new(k, v + b'\x00' + secret_bytes, s256)
+        k_hmac = self._k_hmac.copy()
+        k_hmac.update(z_bytes)
+        k = k_hmac.digest()
         v = hmac.new(k, v, s256).digest()
         k = hmac.new(k, v + b'\x01' + secret_bytes + z_bytes, s256).digest()
         v = hmac.new(k, v, s256).digest()
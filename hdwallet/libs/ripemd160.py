@@ -6,9 +6,15 @@
 # Grudgingly ported to python2 compatibility by Richard Kiss
 
 import binascii
+import hashlib
 import struct
 import unittest
 
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
 
 if struct.calcsize("<L") != 4 or struct.calcsize("<Q") != 8:
     raise RuntimeError("unexpected struct sizes")
@@ -120,6 +126,101 @@ def ripemd160(data):
     return b"".join(struct.pack("<L", h & 0xffffffff) for h in state)
 
 
+def compress_many(h, x):
+    """Compress N lanes of state h (5 uint32 arrays) with N blocks x (16 uint32 arrays)."""
+    al, bl, cl, dl, el = h
+    ar, br, cr, dr, er = h
+    for j in range(80):
+        rnd = j >> 4
+        # Same rounds as compress(), on whole uint32 columns which wrap by themselves.
+        al = rol_many(al + fi(bl, cl, dl, rnd) + x[ML[j]] + numpy.uint32(KL[rnd]), RL[j]) + el
+        al, bl, cl, dl, el = el, al, bl, rol_many(cl, 10), dl
+        ar = rol_many(ar + fi(br, cr, dr, 4 - rnd) + x[MR[j]] + numpy.uint32(KR[rnd]), RR[j]) + er
+        ar, br, cr, dr, er = er, ar, br, rol_many(cr, 10), dr
+    h0, h1, h2, h3, h4 = h
+    return h1 + cl + dr, h2 + dl + er, h3 + el + ar, h4 + al + br, h0 + bl + cr
+
+
+def rol_many(x, i):
+    """Rotate uint32 array x left by i bits."""
+    return (x << numpy.uint32(i)) | (x >> numpy.uint32(32 - i))
+
+
+def ripemd160_many(messages):
+    """Compute the RIPEMD-160 hashes of N equal length messages as an (N, 20) uint8 array.
+
+    messages is an (N, L) uint8 array or a sequence of N bytes objects of the same length,
+    every message is one lane of uint32 columns hashed in parallel with NumPy.
+    """
+    if numpy is None:
+        raise ImportError("NumPy is required for ripemd160_many, install it first.")
+    if not isinstance(messages, numpy.ndarray):
+        messages = list(messages)
+        if len({len(message) for message in messages}) > 1:
+            raise ValueError("Messages must all have the same length.")
+        messages = numpy.frombuffer(b"".join(messages), dtype=numpy.uint8).reshape(
+            len(messages), len(messages[0]) if messages else 0
+        )
+    if messages.ndim != 2 or messages.dtype != numpy.uint8:
+        raise ValueError("Messages must be a two dimensional uint8 array.")
+    count, length = messages.shape
+    # Every lane shares the same padding and size, since all lengths are equal.
+    pad = b"\x80" + b"\x00" * ((119 - length) & 63) + struct.pack("<Q", 8 * length)
+    blocks = numpy.empty((count, length + len(pad)), dtype=numpy.uint8)
+    blocks[:, :length] = messages
+    blocks[:, length:] = numpy.frombuffer(pad, dtype=numpy.uint8)
+    # Transpose to one contiguous column per message word, so each round works on whole lanes.
+    words = numpy.ascontiguousarray(blocks.view("<u4").astype(numpy.uint32).T)
+    h = tuple(numpy.full(count, value, dtype=numpy.uint32) for value in (
+        0x67452301, 0xefcdab89, 0x98badcfe, 0x10325476, 0xc3d2e1f0
+    ))
+    for b in range(words.shape[0] >> 4):
+        h = compress_many(h, words[16*b:16*(b+1)])
+    return numpy.stack(h, axis=1).astype("<u4").view(numpy.uint8).reshape(count, 20)
+
+
+def _hashlib_ripemd160(data):
+    """RIPEMD-160 from OpenSSL through hashlib."""
+    return hashlib.new("ripemd160", data).digest()
+
+
+def _select_ripemd160():
+    """Probe once for a native RIPEMD-160, OpenSSL first, then pycryptodome."""
+    vector = binascii.unhexlify("8eb208f7e05d987a9b044a8e98c6b087f15a0bfc")
+    try:
+        # OpenSSL 3 builds may not ship the legacy provider with ripemd160.
+        if _hashlib_ripemd160(b"abc") == vector:
+            return "openssl", _hashlib_ripemd160
+    except ValueError:
+        pass
+    try:
+        from Crypto.Hash import RIPEMD160
+
+        def _pycryptodome_ripemd160(data):
+            """RIPEMD-160 from pycryptodome."""
+            return RIPEMD160.new(data).digest()
+
+        if _pycryptodome_ripemd160(b"abc") == vector:
+            return "pycryptodome", _pycryptodome_ripemd160
+    except ImportError:
+        pass
+    return "python", ripemd160
+
+
+# Name and function of the RIPEMD-160 provider used by new() and hash160().
+PROVIDER, new = _select_ripemd160()
+
+
+def hash160(data):
+    """Compute RIPEMD-160(SHA-256(data)) with the selected provider."""
+    return new(hashlib.sha256(data).digest())
+
+
+def hash160_many(messages):
+    """Compute RIPEMD-160(SHA-256(message)) of many messages as an (N, 20) uint8 array."""
+    return ripemd160_many([hashlib.sha256(message).digest() for message in messages])
+
+
 class TestFrameworkKey(unittest.TestCase):
     def test_ripemd160(self):
         """RIPEMD-160 test vectors."""
@@ -139,3 +240,4 @@ class TestFrameworkKey(unittest.TestCase):
             (b"a" * 1000000, "52783243c1697bdbe16d37f97f68f08325dc1528")
         ]:
             self.assertEqual(binascii.hexlify(ripemd160(msg)).decode(), hexout)
+            self.assertEqual(binascii.hexlify(new(msg)).decode(), hexout)
@@ -0,0 +1,415 @@
+#!/usr/bin/env python3
+
+from collections import OrderedDict
+from typing import (
+    Any, Dict, List, NamedTuple, Optional, Sequence, Union
+)
+
+import hashlib
+import hmac
+import struct
+import threading
+
+from .backends import (
+    Backend, get_backend
+)
+from .derivations import Derivation
+from .exceptions import DerivationError
+from .libs.ecc import (
+    N, CacheInfo
+)
+from .libs.ripemd160 import hash160
+
+BIP32KEY_HARDEN: int = 0x80000000
+NODE_CACHE_SIZE: int = 1024
+
+
+def parse_path(path: Union[str, Derivation]) -> List[int]:
+    """
+    Parse a derivation path into child indexes, hardened indexes include ``BIP32KEY_HARDEN``.
+
+    :param path: Derivation path.
+    :type path: str, Derivation
+
+    :returns: list -- Child indexes.
+
+    >>> from hdwallet.nodes import parse_path
+    >>> parse_path(path="m/44'/0'/0'/0/1")
+    [2147483692, 2147483648, 2147483648, 0, 1]
+    """
+
+    path = str(path)
+    if path == "m":
+        return []
+    if path[0:2] != "m/":
+        raise ValueError("Bad path, please insert like this type of path \"m/0'/0\"!, not: %r" % (path,))
+    return [
+        int(index[:-1]) + BIP32KEY_HARDEN if "'" in index else int(index)
+        for index in path.lstrip("m/").split("/")
+    ]
+
+
+def derive_paths(node: "HDNode", paths: Sequence[Union[str, Derivation, Sequence[int]]]) -> List["HDNode"]:
+    """
+    Derive many paths below a node, every shared prefix only once.
+
+    Distinct paths are walked in sorted order, so paths sharing a prefix are next to
+    each other and a stack of the current branch is all the prefix tree there is.
+
+    :param node: Node derivation starts from.
+    :type node: HDNode
+    :param paths: Derivation paths or child indexes lists, relative to the node.
+    :type paths: list
+
+    :returns: list -- Derived nodes, in the order of the paths.
+
+    >>> from hdwallet import HDWallet
+    >>> from hdwallet.nodes import derive_paths
+    >>> from hdwallet.symbols import BTC
+    >>> hdwallet = HDWallet(symbol=BTC)
+    >>> hdwallet.from_xprivate_key(xprivate_key="xprv9s21ZrQH143K3xPGUzpogJeKtRdjHkK6muBJo8v7rEVRzT83xJgNcLpMoJXUf9wJFKfuHR4SGvfgdShh4t9VmjjrE9usBunK3LfNna31LGF")
+    >>> [node.depth for node in derive_paths(hdwallet.node(), ["m/84'/0'/3'/0/17", "m/84'/0'/3'/1"])]
+    [5, 4]
+    """
+
+    keys = [
+        tuple(parse_path(path)) if isinstance(path, (str, Derivation)) else tuple(path) for path in paths
+    ]
+    nodes, branch = {}, [((), node)]
+    for key in sorted(set(keys)):
+        while key[:len(branch[-1][0])] != branch[-1][0]:
+            branch.pop()
+        prefix, current = branch[-1]
+        for depth in range(len(prefix), len(key)):
+            current = current.derive(key[depth])
+            branch.append((key[:depth + 1], current))
+        nodes[key] = current
+    return [nodes[key] for key in keys]
+
+
+class ChildKey(NamedTuple):
+    """
+    Derived child key record, lighter than a wallet.
+
+    ``private_key`` is ``None`` for children of a public key, ``addresses`` maps each
+    requested semantic (``p2pkh``, ``p2wpkh``, ...) to its address.
+    """
+
+    index: int
+    path: str
+    public_key: bytes
+    private_key: Optional[bytes]
+    addresses: Dict[str, str]
+
+
+class HDNode:
+    """
+    Immutable Hierarchical Deterministic key node.
+
+    :param chain_code: Chain code bytes.
+    :type chain_code: bytes
+    :param private_key: Private key bytes, default to ``None`` for a public node.
+    :type private_key: bytes
+    :param public_key: Compressed public key bytes, default to ``None`` (computed from the private key when first read).
+    :type public_key: bytes
+    :param depth: Depth, default to ``0``.
+    :type depth: int
+    :param index: Child index, default to ``0``.
+    :type index: int
+    :param parent_fingerprint: Parent fingerprint bytes, default to ``b"\\0\\0\\0\\0"``.
+    :type parent_fingerprint: bytes
+    :param backend: Elliptic curve backend name or instance, default to ``None``.
+    :type backend: str, Backend
+
+    :returns: HDNode -- Hierarchical Deterministic node instance.
+
+    >>> from hdwallet import HDWallet
+    >>> from hdwallet.symbols import BTC
+    >>> hdwallet = HDWallet(symbol=BTC)
+    >>> hdwallet.from_xprivate_key(xprivate_key="xprv9s21ZrQH143K3xPGUzpogJeKtRdjHkK6muBJo8v7rEVRzT83xJgNcLpMoJXUf9wJFKfuHR4SGvfgdShh4t9VmjjrE9usBunK3LfNna31LGF")
+    >>> account = hdwallet.node().derive_path(path="m/44'/0'/0'/0")
+    >>> [account.derive(index).public_key.hex() for index in range(2)]
+    ['02f93f58b97c3bb616645c3dda256ec946d87c45baf531984c022dd0fd1503b0a8', '03f5ed52ab5bd2f7683c59d92874f5a558aa2c30b63ac33a0d405fed05dd0c1fb9']
+    """
+
+    __slots__ = (
+        "depth", "index", "chain_code", "private_key", "backend",
+        "_public_key", "_parent_fingerprint", "_parent", "_fingerprint"
+    )
+
+    def __init__(self, chain_code: bytes, private_key: Optional[bytes] = None, public_key: Optional[bytes] = None,
+                 depth: int = 0, index: int = 0, parent_fingerprint: bytes = b"\0\0\0\0",
+                 backend: Optional[Union[str, Backend]] = None):
+        if private_key is None and public_key is None:
+            raise ValueError("HDNode requires a private key or a public key.")
+        # The public key of a private node is only computed when it is first read.
+        for name, value in (
+            ("depth", depth), ("index", index), ("chain_code", chain_code), ("private_key", private_key),
+            ("backend", get_backend(backend)), ("_public_key", public_key),
+            ("_parent_fingerprint", parent_fingerprint), ("_parent", None), ("_fingerprint", None)
+        ):
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable.")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable.")
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, HDNode):
+            return NotImplemented
+        return self._key() == other._key()
+
+    def __hash__(self) -> int:
+        return hash(self._key())
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(depth={self.depth}, index={self.index}, " \
+               f"fingerprint={self.fingerprint.hex()!r}, private={self.private_key is not None})"
+
+    def _key(self) -> tuple:
+        return self.depth, self.index, self.parent_fingerprint, self.chain_code, self.private_key, self.public_key
+
+    @property
+    def public_key(self) -> bytes:
+        """
+        Compressed public key bytes.
+        """
+
+        if self._public_key is None:
+            object.__setattr__(self, "_public_key", self.backend.public_key(self.private_key))
+        return self._public_key
+
+    @property
+    def parent_fingerprint(self) -> bytes:
+        """
+        Fingerprint of the parent node, taken from the parent when it is first read.
+        """
+
+        parent_fingerprint = self._parent_fingerprint
+        if parent_fingerprint is None:
+            # Another thread may have taken it already, it is set before the parent is dropped.
+            parent = self._parent
+            parent_fingerprint = self._parent_fingerprint if parent is None else parent.fingerprint
+            object.__setattr__(self, "_parent_fingerprint", parent_fingerprint)
+            object.__setattr__(self, "_parent", None)
+        return parent_fingerprint
+
+    @property
+    def fingerprint(self) -> bytes:
+        """
+        First four bytes of the public key hash160, the parent fingerprint of children.
+        """
+
+        if self._fingerprint is None:
+            object.__setattr__(self, "_fingerprint", hash160(self.public_key)[:4])
+        return self._fingerprint
+
+    def neuter(self) -> "HDNode":
+        """
+        Get the public node (without private key) of this node.
+
+        :returns: HDNode -- Public node.
+        """
+
+        return HDNode(
+            chain_code=self.chain_code, public_key=self.public_key, depth=self.depth,
+            index=self.index, parent_fingerprint=self.parent_fingerprint, backend=self.backend
+        )
+
+    def derive(self, index: int, hardened: bool = False) -> "HDNode":
+        """
+        Derive a child node, this node is left unchanged.
+
+        :param index: Child index, ``BIP32KEY_HARDEN`` included or set with ``hardened``.
+        :type index: int
+        :param hardened: Hardened child, default to ``False``.
+        :type hardened: bool
+
+        :returns: HDNode -- Child node.
+        """
+
+        if not isinstance(index, int):
+            raise ValueError("Bad index, Please import only integer number!")
+        if hardened:
+            index |= BIP32KEY_HARDEN
+        if not 0 <= index <= 0xffffffff:
+            raise DerivationError(f"Invalid child index {index}.")
+        if not self.chain_code:
+            raise ValueError("You can't drive xprivate_key and private_key.")
+
+        if index & BIP32KEY_HARDEN:
+            if self.private_key is None:
+                raise DerivationError("Hardened derivation path is invalid for xpublic key.")
+            data = b"\0" + self.private_key + struct.pack(">L", index)
+        else:
+            data = self.public_key + struct.pack(">L", index)
+        i = hmac.new(self.chain_code, data, hashlib.sha512).digest()
+        il_int = int.from_bytes(i[:32], "big")
+        if il_int >= N:
+            raise DerivationError(f"Invalid child {index}, derive the next index instead.")
+
+        if self.private_key is not None:
+            k_int = (il_int + int.from_bytes(self.private_key, "big")) % N
+            if k_int == 0:
+                raise DerivationError(f"Invalid child {index}, derive the next index instead.")
+            # A hardened chain is only scalar additions, the fingerprint of a parent
+            # without public key yet is taken from the parent when it is read.
+            # The public key is read once, a node shared between threads may get it meanwhile.
+            public_key = self._public_key
+            child = HDNode(
+                chain_code=i[32:], private_key=k_int.to_bytes(32, "big"), depth=self.depth + 1, index=index,
+                parent_fingerprint=None if public_key is None else self.fingerprint, backend=self.backend
+            )
+            if public_key is None:
+                object.__setattr__(child, "_parent", self)
+            return child
+        return HDNode(
+            chain_code=i[32:], public_key=self.backend.tweak_add(self.public_key, il_int), depth=self.depth + 1,
+            index=index, parent_fingerprint=self.fingerprint, backend=self.backend
+        )
+
+    def derive_path(self, path: Union[str, Derivation]) -> "HDNode":
+        """
+        Derive the node at a path relative to this node.
+
+        :param path: Derivation path, like ``m/44'/0'/0'/0``.
+        :type path: str, Derivation
+
+        :returns: HDNode -- Derived node.
+        """
+
+        node = self
+        for index in parse_path(path):
+            node = node.derive(index)
+        return node
+
+
+class NodeCache:
+    """
+    Bounded LRU cache of intermediate derivation nodes.
+
+    Nodes are keyed by the node derivation started from (its full private or public key,
+    chain code, depth, index and parent fingerprint) and the path prefix below it, so children of
+    ``m/84'/0'/0'/0`` only derive their last index once the prefix is cached.
+    Leaves are not cached, they are mostly distinct and would evict the shared prefixes.
+    A cache can be shared between wallets and threads.
+
+    :param maxsize: Maximum number of cached nodes, default to ``1024``, ``0`` disables the cache.
+    :type maxsize: int
+
+    :returns: NodeCache -- Node cache instance.
+
+    >>> from hdwallet import HDWallet
+    >>> from hdwallet.nodes import NodeCache
+    >>> from hdwallet.symbols import BTC
+    >>> cache = NodeCache(maxsize=256)
+    >>> hdwallet = HDWallet(symbol=BTC, cache=cache)
+    >>> hdwallet.from_xprivate_key(xprivate_key="xprv9s21ZrQH143K3xPGUzpogJeKtRdjHkK6muBJo8v7rEVRzT83xJgNcLpMoJXUf9wJFKfuHR4SGvfgdShh4t9VmjjrE9usBunK3LfNna31LGF")
+    >>> for index in range(3):
+    ...     hdwallet.from_path(path=f"m/44'/0'/0'/0/{index}").clean_derivation()
+    >>> cache.info()
+    CacheInfo(hits=2, misses=4, maxsize=256, currsize=4)
+    """
+
+    def __init__(self, maxsize: int = NODE_CACHE_SIZE):
+        if maxsize < 0:
+            raise ValueError("Cache size must be positive or 0 to disable it.")
+        self._maxsize: int = maxsize
+        self._nodes: "OrderedDict[tuple, HDNode]" = OrderedDict()
+        self._hits: int = 0
+        self._misses: int = 0
+        self._lock: threading.Lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    @staticmethod
+    def _root(node: HDNode) -> tuple:
+        # Not the 4 byte fingerprint, an xkey with a colliding one is cheap to build.
+        # A private key identifies the node as well as its public key, and keeps a
+        # lookup free of the scalar multiplication a lazy public key would need.
+        # Depth, index and parent fingerprint are serialized by every descendant.
+        metadata = (node.depth, node.index, node.parent_fingerprint)
+        if node.private_key is not None:
+            return (True, node.private_key, node.chain_code) + metadata
+        return (False, node.public_key, node.chain_code) + metadata
+
+    def derive(self, node: HDNode, indexes: Sequence[int]) -> HDNode:
+        """
+        Derive the node at child indexes below a node, through the cached prefixes.
+
+        :param node: Node derivation starts from.
+        :type node: HDNode
+        :param indexes: Child indexes, hardened ones include ``BIP32KEY_HARDEN``.
+        :type indexes: list
+
+        :returns: HDNode -- Derived node.
+        """
+
+        indexes = tuple(indexes)
+        if not indexes:
+            return node
+        root = self._root(node)
+        # Longest cached prefix first, a hit counts the whole prefix.
+        depth = len(indexes) - 1
+        with self._lock:
+            while depth:
+                cached = self._nodes.get((root, indexes[:depth]))
+                if cached is not None:
+                    self._hits += 1
+                    self._nodes.move_to_end((root, indexes[:depth]))
+                    node = cached
+                    break
+                depth -= 1
+        # Derivation runs outside the lock, a node derived by two threads at once is the same node.
+        for depth in range(depth + 1, len(indexes)):
+            node = node.derive(indexes[depth - 1])
+            with self._lock:
+                self._misses += 1
+                if self._maxsize > 0:
+                    self._nodes[(root, indexes[:depth])] = node
+                    if len(self._nodes) > self._maxsize:
+                        self._nodes.popitem(last=False)
+        return node.derive(indexes[-1])
+
+    def info(self) -> CacheInfo:
+        """
+        Get the hits, misses, maxsize and currsize of the cache.
+
+        :returns: CacheInfo -- Cache statistics.
+        """
+
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self._maxsize, len(self._nodes))
+
+    def resize(self, maxsize: int) -> "NodeCache":
+        """
+        Set the maximum number of cached nodes, dropping the least recently used.
+
+        :param maxsize: Maximum number of cached nodes, ``0`` disables the cache.
+        :type maxsize: int
+
+        :returns: NodeCache -- Node cache instance.
+        """
+
+        if maxsize < 0:
+            raise ValueError("Cache size must be positive or 0 to disable it.")
+        with self._lock:
+            self._maxsize = maxsize
+            while len(self._nodes) > maxsize:
+                self._nodes.popitem(last=False)
+        return self
+
+    def purge(self) -> "NodeCache":
+        """
+        Drop every cached node and reset the statistics.
+
+        :returns: NodeCache -- Node cache instance.
+        """
+
+        with self._lock:
+            self._nodes.clear()
+            self._hits = self._misses = 0
+        return self
@@ -12,10 +12,10 @@ import unicodedata
 import binascii
 
 from hdwallet import cryptocurrencies
-from .cryptocurrencies import (
-    get_cryptocurrency, Cryptocurrency
+from .cryptocurrencies import Cryptocurrency
+from .keys import (
+    parse_xprivate_key, parse_xpublic_key
 )
-from .libs.base58 import check_decode
 
 # Alphabet and digits.
 letters = string.ascii_letters + string.digits
@@ -319,30 +319,8 @@ def mnemonic_to_entropy(mnemonic: str, language: Optional[str] = None) -> str:
 
 
 def is_root_xprivate_key(xprivate_key: str, symbol: str) -> bool:
-    decoded_xprivate_key = check_decode(xprivate_key)
-    if len(decoded_xprivate_key) != 78:  # 78, 156
-        raise ValueError("Invalid xprivate key.")
-    cryptocurrency = get_cryptocurrency(symbol=symbol)
-    semantic = get_semantic(_cryptocurrency=cryptocurrency, version=decoded_xprivate_key[:4], key_type="private_key")
-    version = cryptocurrency.EXTENDED_PRIVATE_KEY.__getattribute__(
-        semantic.upper()
-    )
-    if version is None:
-        raise NotImplementedError(semantic)
-    raw = f"{_unhexlify(version).hex()}000000000000000000"
-    return decoded_xprivate_key.hex().startswith(raw)
+    return parse_xprivate_key(xprivate_key=xprivate_key, cryptocurrency=symbol).is_root
 
 
 def is_root_xpublic_key(xpublic_key: str, symbol: str) -> bool:
-    decoded_xpublic_key = check_decode(xpublic_key)
-    if len(decoded_xpublic_key) != 78:  # 78, 156
-        raise ValueError("Invalid xpublic key.")
-    cryptocurrency = get_cryptocurrency(symbol=symbol)
-    semantic = get_semantic(_cryptocurrency=cryptocurrency, version=decoded_xpublic_key[:4], key_type="public_key")
-    version = cryptocurrency.EXTENDED_PUBLIC_KEY.__getattribute__(
-        semantic.upper()
-    )
-    if version is None:
-        raise NotImplementedError(semantic)
-    raw = f"{_unhexlify(version).hex()}000000000000000000"
-    return decoded_xpublic_key.hex().startswith(raw)
+    return parse_xpublic_key(xpublic_key=xpublic_key, cryptocurrency=symbol).is_root
@@ -50,6 +50,12 @@ setup(
             "pytest-cov>=4.0.0,<5",
             "tox==3.28.0"
         ],
+        "coincurve": [
+            "coincurve>=17.0.0,<22"
+        ],
+        "numpy": [
+            "numpy>=1.21.0,<3"
+        ],
         "docs": [
             "sphinx>=5.3.0,<6",
             "furo==2022.12.7",
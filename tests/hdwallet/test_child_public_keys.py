@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+
+import json
+import os
+import pytest
+
+from hdwallet import HDWallet
+from hdwallet.exceptions import DerivationError
+
+# Test Values
+base_path: str = os.path.dirname(__file__)
+file_path: str = os.path.abspath(os.path.join(base_path, "../values.json"))
+values = open(file_path, "r", encoding="utf-8")
+_: dict = json.loads(values.read())
+values.close()
+
+
+def test_child_public_keys():
+
+    hdwallet: HDWallet = HDWallet(
+        symbol=_["bitcoin"]["mainnet"]["symbol"]
+    )
+    hdwallet.from_xpublic_key(
+        xpublic_key=_["bitcoin"]["mainnet"]["root_xpublic_key"]
+    )
+    hdwallet.from_path(
+        path="m/44/0/0/0"
+    )
+
+    indexes = [0, 1, 7, 2 ** 31 - 1]
+    public_keys = hdwallet.child_public_keys(indexes=indexes)
+    uncompressed_public_keys = hdwallet.child_public_keys(indexes=indexes, compressed=False)
+
+    assert public_keys[0].hex() == "038f24175db513b40c75503c25040e5f0ea4d38e912d1f83daf5fd8c4b9512ad87"
+    assert hdwallet.p2pkh_address(public_key=public_keys[0]) == "189qPd6J81ns9LEGx6kun7Xtg1bJV8GJXh"
+    assert hdwallet.p2wsh_address(public_key=public_keys[0].hex()) == \
+        "bc1qazm6kznlgs06exh4cq2qxh567xrffppwujje5zg84upnng4essusd08nhz"
+
+    for index, public_key, uncompressed_public_key in zip(indexes, public_keys, uncompressed_public_keys):
+        hdwallet.from_index(index)
+        assert public_key.hex() == hdwallet.compressed()
+        assert uncompressed_public_key.hex() == "04" + hdwallet.uncompressed()
+        assert hdwallet.p2wpkh_address(public_key=public_key) == hdwallet.p2wpkh_address()
+        hdwallet.clean_derivation()
+        hdwallet.from_path(path="m/44/0/0/0")
+
+    with pytest.raises(DerivationError, match="Hardened derivation path is invalid for child public keys."):
+        hdwallet.child_public_keys(indexes=[2 ** 31])
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+
+import json
+import os
+import pytest
+
+from hdwallet import HDWallet
+from hdwallet.nodes import (
+    HDNode, derive_paths
+)
+from hdwallet.derivations import BIP84Derivation
+from hdwallet.cryptocurrencies import BitcoinMainnet
+
+# Test Values
+base_path: str = os.path.dirname(__file__)
+file_path: str = os.path.abspath(os.path.join(base_path, "../values.json"))
+values = open(file_path, "r", encoding="utf-8")
+_: dict = json.loads(values.read())
+values.close()
+
+PATHS: list = [
+    "m/84'/0'/3'/0/17",
+    "m/84'/0'/3'/1/5",
+    "m/84'/0'/7'/0/100000",
+    "m/84'/0'/3'/0/17",
+    "m/84'/0'/3'",
+    BIP84Derivation(cryptocurrency=BitcoinMainnet, account=7, address=2)
+]
+
+
+def test_derive_many(monkeypatch):
+
+    hdwallet: HDWallet = HDWallet(
+        symbol=_["bitcoin"]["mainnet"]["symbol"]
+    )
+    hdwallet.from_xprivate_key(
+        xprivate_key=_["bitcoin"]["mainnet"]["root_xprivate_key"]
+    )
+    derived: HDWallet = HDWallet(
+        symbol=_["bitcoin"]["mainnet"]["symbol"]
+    )
+    derived.from_xprivate_key(
+        xprivate_key=_["bitcoin"]["mainnet"]["root_xprivate_key"]
+    )
+
+    derivations: list = []
+    derive = HDNode.derive
+
+    def counted_derive(self, index, hardened=False):
+        derivations.append(index)
+        return derive(self, index, hardened=hardened)
+
+    monkeypatch.setattr(HDNode, "derive", counted_derive)
+
+    children = hdwallet.derive_many(paths=PATHS, semantics=["p2wpkh", "p2pkh"])
+    # m/84', m/84'/0', both accounts, three change nodes and four leaves
+    assert len(derivations) == 11
+    assert hdwallet.path() is None
+
+    for path, child in zip(PATHS, children):
+        derived.from_path(path=path)
+        dumps: dict = derived.dumps()
+        assert child.path == dumps["path"] == str(path)
+        assert child.index == int(str(path).split("/")[-1].rstrip("'"))
+        assert child.public_key.hex() == dumps["public_key"]
+        assert child.private_key.hex() == dumps["private_key"]
+        assert child.addresses == {
+            "p2wpkh": dumps["addresses"]["p2wpkh"], "p2pkh": dumps["addresses"]["p2pkh"]
+        }
+        derived.clean_derivation()
+
+    assert hdwallet.derive_many(paths=[]) == []
+    with pytest.raises(ValueError, match="Invalid semantic 'p2tr'"):
+        hdwallet.derive_many(paths=PATHS, semantics=["p2tr"])
+    with pytest.raises(ValueError, match="Bad path"):
+        hdwallet.derive_many(paths=["84'/0'"])
+
+
+def test_derive_paths():
+
+    hdwallet: HDWallet = HDWallet(
+        symbol=_["bitcoin"]["mainnet"]["symbol"]
+    )
+    hdwallet.from_xpublic_key(
+        xpublic_key=_["bitcoin"]["mainnet"]["root_xpublic_key"]
+    )
+    root: HDNode = hdwallet.node()
+    nodes: list = derive_paths(root, ["m/44/0/0/0/0", [44, 0, 0, 0, 0], "m", [44, 0, 1]])
+
+    assert nodes[0] is nodes[1]
+    assert nodes[2] is root
+    assert nodes[3] == root.derive_path(path="m/44/0/1")
+    assert nodes[0].public_key.hex() == "038f24175db513b40c75503c25040e5f0ea4d38e912d1f83daf5fd8c4b9512ad87"
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+
+import json
+import os
+import types
+import pytest
+
+from hdwallet import HDWallet
+from hdwallet.nodes import (
+    ChildKey, NodeCache
+)
+from hdwallet.exceptions import DerivationError
+
+# Test Values
+base_path: str = os.path.dirname(__file__)
+file_path: str = os.path.abspath(os.path.join(base_path, "../values.json"))
+values = open(file_path, "r", encoding="utf-8")
+_: dict = json.loads(values.read())
+values.close()
+
+
+@pytest.mark.parametrize("cache", [None, NodeCache()])
+def test_derive_range(cache):
+
+    hdwallet: HDWallet = HDWallet(
+        symbol=_["bitcoin"]["mainnet"]["symbol"], cache=cache
+    )
+    hdwallet.from_xprivate_key(
+        xprivate_key=_["bitcoin"]["mainnet"]["root_xprivate_key"]
+    )
+    derived: HDWallet = HDWallet(
+        symbol=_["bitcoin"]["mainnet"]["symbol"]
+    )
+    derived.from_xprivate_key(
+        xprivate_key=_["bitcoin"]["mainnet"]["root_xprivate_key"]
+    )
+
+    children = hdwallet.derive_range(
+        path="m/44'/0'/0'/0", start=3, stop=6, semantics=["p2pkh", "p2wpkh", "p2wsh_in_p2sh"]
+    )
+    assert isinstance(children, types.GeneratorType)
+    for index, child in zip(range(3, 6), children):
+        derived.from_path(path=f"m/44'/0'/0'/0/{index}")
+        dumps: dict = derived.dumps()
+        assert isinstance(child, ChildKey)
+        assert child.index == index
+        assert child.path == dumps["path"]
+        assert child.public_key.hex() == dumps["public_key"]
+        assert child.private_key.hex() == dumps["private_key"]
+        assert child.addresses == {
+            semantic: dumps["addresses"][semantic] for semantic in ["p2pkh", "p2wpkh", "p2wsh_in_p2sh"]
+        }
+        derived.clean_derivation()
+
+    # Hardened children, the wallet is left as it was
+    assert [child.path for child in hdwallet.derive_range(path="m", start=0, stop=2, hardened=True)] == \
+        ["m/0'", "m/1'"]
+    assert hdwallet.path() is None
+    assert list(hdwallet.derive_range(path="m/0", start=7, stop=7)) == []
+
+
+def test_derive_range_public():
+
+    hdwallet: HDWallet = HDWallet(
+        symbol=_["bitcoin"]["mainnet"]["symbol"]
+    )
+    hdwallet.from_xpublic_key(
+        xpublic_key=_["bitcoin"]["mainnet"]["root_xpublic_key"]
+    )
+    child: ChildKey = next(hdwallet.derive_range(path="m/44/0/0/0", start=0, stop=2 ** 31))
+
+    assert child.private_key is None
+    assert child.public_key.hex() == "038f24175db513b40c75503c25040e5f0ea4d38e912d1f83daf5fd8c4b9512ad87"
+    assert child.addresses == {"p2pkh": "189qPd6J81ns9LEGx6kun7Xtg1bJV8GJXh"}
+
+    with pytest.raises(DerivationError, match="Hardened derivation path is invalid for xpublic key."):
+        next(hdwallet.derive_range(path="m/0", start=0, stop=1, hardened=True))
+    with pytest.raises(ValueError, match="Invalid index range"):
+        hdwallet.derive_range(path="m/0", start=2, stop=1)
+    with pytest.raises(ValueError, match="Invalid semantic 'p2tr'"):
+        hdwallet.derive_range(path="m/0", start=0, stop=1, semantics=["p2tr"])
+    with pytest.raises(ValueError, match="Bad path"):
+        hdwallet.derive_range(path="0/1", start=0, stop=1)
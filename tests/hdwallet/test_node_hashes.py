@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+
+import json
+import os
+
+import hdwallet.hdwallet
+from hdwallet import HDWallet
+
+# Test Values
+base_path: str = os.path.dirname(__file__)
+file_path: str = os.path.abspath(os.path.join(base_path, "../values.json"))
+values = open(file_path, "r", encoding="utf-8")
+_: dict = json.loads(values.read())
+values.close()
+
+
+def test_node_hashes(monkeypatch):
+
+    hashed = []
+
+    def hash160(data: bytes) -> bytes:
+        hashed.append(data)
+        return _hash160(data)
+
+    _hash160 = hdwallet.hdwallet.hash160
+    monkeypatch.setattr(hdwallet.hdwallet, "hash160", hash160)
+
+    wallet: HDWallet = HDWallet(
+        symbol=_["bitcoin"]["mainnet"]["symbol"]
+    )
+    wallet.from_xprivate_key(
+        xprivate_key=_["bitcoin"]["mainnet"]["root_xprivate_key"]
+    )
+    wallet.from_path(path=_["bitcoin"]["mainnet"]["path"])
+
+    hashed.clear()
+    dumps = wallet.dumps()
+    assert dumps["addresses"] == _["bitcoin"]["mainnet"]["addresses"]
+    assert dumps["hash"] == _["bitcoin"]["mainnet"]["hash"]
+    assert dumps["finger_print"] == _["bitcoin"]["mainnet"]["finger_print"]
+    # public key, p2sh, p2wpkh in p2sh and p2wsh in p2sh scripts once each
+    assert hashed.count(bytes.fromhex(wallet.public_key())) == 1
+    assert len(hashed) == 4
+    assert wallet.dumps() == dumps and len(hashed) == 4
+
+    # derivation moves to another node, its hashes are computed again
+    wallet.from_index(0)
+    assert wallet.p2pkh_address() != dumps["addresses"]["p2pkh"]
+    assert wallet.clean_derivation().p2wpkh_address() == HDWallet(
+        symbol=_["bitcoin"]["mainnet"]["symbol"]
+    ).from_xprivate_key(xprivate_key=_["bitcoin"]["mainnet"]["root_xprivate_key"]).p2wpkh_address()
+    assert len(hashed) == 7
+
+    # an explicit public key never touches the node hashes
+    assert wallet.p2sh_address(public_key=dumps["public_key"]) == dumps["addresses"]["p2sh"]
+    assert wallet.hash(private_key=dumps["private_key"]) == dumps["hash"]
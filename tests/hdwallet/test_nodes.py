@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+
+import json
+import os
+import pytest
+
+from concurrent.futures import ThreadPoolExecutor
+
+from hdwallet import HDWallet
+from hdwallet.nodes import (
+    HDNode, NodeCache, parse_path, BIP32KEY_HARDEN
+)
+from hdwallet.derivations import BIP44Derivation
+from hdwallet.cryptocurrencies import BitcoinMainnet
+from hdwallet.backends import get_backend
+from hdwallet.exceptions import DerivationError
+
+# Test Values
+base_path: str = os.path.dirname(__file__)
+file_path: str = os.path.abspath(os.path.join(base_path, "../values.json"))
+values = open(file_path, "r", encoding="utf-8")
+_: dict = json.loads(values.read())
+values.close()
+
+
+def test_parse_path():
+
+    assert parse_path(path="m") == []
+    assert parse_path(path="m/44'/0'/0'/0/1") == [44 + BIP32KEY_HARDEN, BIP32KEY_HARDEN, BIP32KEY_HARDEN, 0, 1]
+
+    with pytest.raises(ValueError, match="Bad path"):
+        parse_path(path="44'/0'")
+
+
+def test_node_derive():
+
+    hdwallet: HDWallet = HDWallet(
+        symbol=_["bitcoin"]["mainnet"]["symbol"]
+    )
+    hdwallet.from_xprivate_key(
+        xprivate_key=_["bitcoin"]["mainnet"]["root_xprivate_key"]
+    )
+    root: HDNode = hdwallet.node()
+    change: HDNode = root.derive_path(path="m/44'/0'/0'/0")
+
+    # Derivation leaves the parent and the wallet untouched
+    assert root.depth == 0 and change.depth == 4
+    assert hdwallet.path() is None
+
+    for index in range(3):
+        child: HDNode = change.derive(index=index)
+        hdwallet.from_path(path=f"m/44'/0'/0'/0/{index}")
+        assert child.private_key.hex() == hdwallet.private_key()
+        assert child.public_key.hex() == hdwallet.public_key()
+        assert child.chain_code.hex() == hdwallet.chain_code()
+        assert child.parent_fingerprint == change.fingerprint
+        assert (child.depth, child.index) == (5, index)
+        hdwallet.clean_derivation()
+
+    assert root.derive(index=44, hardened=True) == root.derive(index=44 + BIP32KEY_HARDEN)
+    assert change.neuter().derive(index=7).public_key == change.derive(index=7).public_key
+    assert change.neuter().private_key is None
+
+    with pytest.raises(DerivationError, match="Hardened derivation path is invalid for xpublic key."):
+        change.neuter().derive(index=0, hardened=True)
+    with pytest.raises(AttributeError, match="immutable"):
+        change.depth = 0
+
+
+def test_from_node():
+
+    hdwallet: HDWallet = HDWallet(
+        symbol=_["bitcoin"]["mainnet"]["symbol"]
+    )
+    hdwallet.from_xprivate_key(
+        xprivate_key=_["bitcoin"]["mainnet"]["root_xprivate_key"]
+    )
+    change: HDNode = hdwallet.node().derive_path(path="m/44'/0'/0'/0")
+
+    derived: HDWallet = HDWallet(
+        symbol=_["bitcoin"]["mainnet"]["symbol"]
+    )
+    derived.from_xprivate_key(
+        xprivate_key=_["bitcoin"]["mainnet"]["root_xprivate_key"]
+    )
+    derived.from_path(path="m/44'/0'/0'/0/1")
+
+    hdwallet.from_node(node=change.derive(index=1), path="m/44'/0'/0'/0/1")
+    assert hdwallet.dumps() == derived.dumps()
+
+    # A wallet without master key takes the node as master key
+    public: HDWallet = HDWallet(
+        symbol=_["bitcoin"]["mainnet"]["symbol"]
+    )
+    public.from_node(node=change.neuter())
+    assert public.root_xpublic_key() == public.xpublic_key()
+    assert public.private_key() is None
+    assert public.from_index(index=1).public_key() == derived.public_key()
+
+    with pytest.raises(TypeError, match="Invalid node type"):
+        public.from_node(node=None)
+
+
+def test_node_cache():
+
+    cache: NodeCache = NodeCache(maxsize=3)
+    hdwallet: HDWallet = HDWallet(
+        symbol=_["bitcoin"]["mainnet"]["symbol"], cache=cache
+    )
+    hdwallet.from_xprivate_key(
+        xprivate_key=_["bitcoin"]["mainnet"]["root_xprivate_key"]
+    )
+    derived: HDWallet = HDWallet(
+        symbol=_["bitcoin"]["mainnet"]["symbol"]
+    )
+    derived.from_xprivate_key(
+        xprivate_key=_["bitcoin"]["mainnet"]["root_xprivate_key"]
+    )
+
+    for path in ["m/44'/0'/0'/0/0", "m/44'/0'/0'/0/1", "m/44'/0'/0'/1/0", BIP44Derivation(cryptocurrency=BitcoinMainnet, address=2)]:
+        hdwallet.from_path(path=path)
+        derived.from_path(path=path)
+        assert hdwallet.dumps() == derived.dumps()
+        hdwallet.clean_derivation()
+        derived.clean_derivation()
+
+    # Five prefixes derived up to m/44'/0'/0'/0 and m/44'/0'/0'/1, three kept
+    assert cache.info() == (3, 5, 3, 3)
+    assert len(cache.resize(maxsize=1)) == 1
+
+    # Cached private nodes are never served to a public wallet of the same key
+    public: HDWallet = HDWallet(
+        symbol=_["bitcoin"]["mainnet"]["symbol"], cache=cache
+    )
+    public.from_xpublic_key(
+        xpublic_key=hdwallet.from_path(path="m/44'/0'/0'").xpublic_key()
+    )
+    public.from_path(path="m/0/0/5")
+    hdwallet.from_path(path="m/0/0/5")
+    assert public.private_key() is None
+    assert public.public_key() == hdwallet.public_key()
+
+    assert cache.purge().info() == (0, 0, 1, 0)
+    with pytest.raises(ValueError, match="Cache size must be positive or 0 to disable it."):
+        NodeCache(maxsize=-1)
+
+
+def test_node_cache_roots():
+
+    hdwallet: HDWallet = HDWallet(
+        symbol=_["bitcoin"]["mainnet"]["symbol"]
+    )
+    hdwallet.from_xpublic_key(
+        xpublic_key=_["bitcoin"]["mainnet"]["root_xpublic_key"]
+    )
+    victim: HDNode = hdwallet.node()
+    attacker: HDNode = HDNode(
+        chain_code=victim.chain_code, private_key=b"\x01" * 32
+    ).neuter()
+    # Same chain code and fingerprint, only the public keys differ
+    object.__setattr__(attacker, "_fingerprint", victim.fingerprint)
+
+    cache: NodeCache = NodeCache()
+    cache.derive(attacker, [44, 0, 0])
+    assert cache.derive(victim, [44, 0, 0]) == victim.derive_path(path="m/44/0/0")
+
+    # Same key and chain code, the account only differs from the root by its depth
+    root: HDNode = HDNode(chain_code=victim.chain_code, private_key=b"\x01" * 32)
+    account: HDNode = HDNode(chain_code=victim.chain_code, private_key=b"\x01" * 32, depth=3)
+    cache.derive(root, [44, 0, 0])
+    derived: HDNode = cache.derive(account, [44, 0, 0])
+    assert derived == account.derive_path(path="m/44/0/0")
+    assert derived.depth == 6
+
+
+def test_node_cache_threads():
+
+    hdwallet: HDWallet = HDWallet(
+        symbol=_["bitcoin"]["mainnet"]["symbol"]
+    )
+    hdwallet.from_xprivate_key(
+        xprivate_key=_["bitcoin"]["mainnet"]["root_xprivate_key"]
+    )
+    root: HDNode = hdwallet.node()
+    paths: list = [[index % 5 + BIP32KEY_HARDEN, index % 3, index] for index in range(60)]
+    expected: list = [root.derive_path(path="m/" + "/".join(
+        f"{index - BIP32KEY_HARDEN}'" if index >= BIP32KEY_HARDEN else str(index) for index in path
+    )) for path in paths]
+
+    cache: NodeCache = NodeCache(maxsize=4)
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        nodes: list = list(executor.map(lambda path: cache.derive(root, path), paths * 4))
+
+    assert nodes == expected * 4
+    assert cache.info().currsize <= 4
+
+
+def test_lazy_derivation(monkeypatch):
+
+    hdwallet: HDWallet = HDWallet(
+        symbol=_["bitcoin"]["mainnet"]["symbol"], backend="python"
+    )
+    hdwallet.from_xprivate_key(
+        xprivate_key=_["bitcoin"]["mainnet"]["root_xprivate_key"]
+    )
+    derived: HDWallet = HDWallet(
+        symbol=_["bitcoin"]["mainnet"]["symbol"], backend="python"
+    )
+    derived.from_xprivate_key(
+        xprivate_key=_["bitcoin"]["mainnet"]["root_xprivate_key"]
+    )
+    derived.from_path(path="m/44'/0'/0'")
+    derived_node: HDNode = derived.node()
+    root: HDNode = hdwallet.node()
+    cached: HDWallet = HDWallet(
+        symbol=_["bitcoin"]["mainnet"]["symbol"], backend="python", cache=NodeCache()
+    )
+    cached.from_xprivate_key(
+        xprivate_key=_["bitcoin"]["mainnet"]["root_xprivate_key"]
+    )
+
+    multiplications: list = []
+    backend = get_backend("python")
+    public_key = type(backend).public_key
+
+    def counted_public_key(self, *args, **kwargs):
+        multiplications.append(args)
+        return public_key(self, *args, **kwargs)
+
+    monkeypatch.setattr(type(backend), "public_key", counted_public_key)
+
+    # A hardened chain is only scalar additions, keys are computed when read
+    hdwallet.clean_derivation().from_path(path="m/44'/0'/0'")
+    node: HDNode = root.derive_path(path="m/44'/0'/0'")
+    # through the cache too, its lookups do not need the root public key
+    cached.clean_derivation().from_path(path="m/44'/0'/0'")
+    cached.clean_derivation().from_path(path="m/44'/0'/0'")
+    assert multiplications == []
+
+    assert node == derived_node
+    assert hdwallet.xpublic_key() == derived.xpublic_key()
+    assert hdwallet.dumps() == derived.dumps()
+    assert cached.dumps() == derived.dumps()
+
+
+def test_lazy_parent_public_key(monkeypatch):
+
+    hdwallet: HDWallet = HDWallet(
+        symbol=_["bitcoin"]["mainnet"]["symbol"]
+    )
+    hdwallet.from_xprivate_key(
+        xprivate_key=_["bitcoin"]["mainnet"]["root_xprivate_key"]
+    )
+    expected: bytes = hdwallet.node().derive(0, hardened=True).fingerprint
+    parent: HDNode = hdwallet.node().derive(0, hardened=True)
+    assert parent._public_key is None
+
+    init = HDNode.__init__
+
+    def filling_init(self, *args, **kwargs):
+        init(self, *args, **kwargs)
+        # another thread reads the parent public key while the child is built
+        parent.public_key
+
+    monkeypatch.setattr(HDNode, "__init__", filling_init)
+    child: HDNode = parent.derive(1, hardened=True)
+    monkeypatch.undo()
+
+    assert parent._public_key is not None
+    assert child.parent_fingerprint == expected == parent.fingerprint
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+
+import json
+import os
+import pytest
+
+from hashlib import sha256
+
+from hdwallet import HDWallet
+
+# Test Values
+base_path: str = os.path.dirname(__file__)
+file_path: str = os.path.abspath(os.path.join(base_path, "../values.json"))
+values = open(file_path, "r", encoding="utf-8")
+_: dict = json.loads(values.read())
+values.close()
+
+DIGESTS: list = [sha256(bytes([index])).digest() for index in range(5)]
+
+
+@pytest.mark.parametrize("deterministic", [True, False])
+def test_sign_many(deterministic):
+
+    hdwallet: HDWallet = HDWallet(
+        symbol=_["bitcoin"]["mainnet"]["symbol"]
+    )
+    hdwallet.from_private_key(
+        private_key=_["bitcoin"]["mainnet"]["private_key"]
+    )
+
+    signatures = hdwallet.sign_many(digests=DIGESTS, deterministic=deterministic, der=False)
+    assert len(signatures) == len(DIGESTS)
+    for digest, signature in zip(DIGESTS, signatures):
+        assert hdwallet.verify(data=digest, signature=signature)
+        assert signature[1] <= 0x7fffffffffffffffffffffffffffffff5d576e7357a4501ddfe92f46681b20a0
+    if deterministic:
+        assert hdwallet.sign_many(digests=DIGESTS) == [hdwallet.sign(data=digest) for digest in DIGESTS]
+    assert hdwallet.sign_many(digests=[]) == []
+
+    with pytest.raises(ValueError, match="You can't sign without private key."):
+        HDWallet(symbol="BTC").from_public_key(public_key=hdwallet.public_key()).sign_many(digests=DIGESTS)
+
+
+def test_sign_paths():
+
+    hdwallet: HDWallet = HDWallet(
+        symbol=_["bitcoin"]["mainnet"]["symbol"]
+    )
+    hdwallet.from_xprivate_key(
+        xprivate_key=_["bitcoin"]["mainnet"]["root_xprivate_key"]
+    )
+    hdwallet.from_path(path="m/44'/0'/0'")
+
+    paths = ["m/0/0", "m/0/1", "m/0/0", "m/1/0", "m/0/1"]
+    items = list(zip(paths, DIGESTS))
+    signatures = hdwallet.sign_paths(items=items)
+    assert hdwallet.path() == "m/44'/0'/0'"
+    raw_signatures = hdwallet.sign_paths(items=items, der=False)
+
+    for (path, digest), signature, raw_signature in zip(items, signatures, raw_signatures):
+        child: HDWallet = HDWallet(symbol="BTC").from_xprivate_key(xprivate_key=hdwallet.xprivate_key())
+        child.from_path(path=path)
+        assert signature == child.sign(data=digest)
+        assert raw_signature == child.raw_sign(data=digest)[:2]
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+
+import pytest
+
+from hashlib import sha256
+
+from hdwallet import HDWallet
+from hdwallet.backends import (
+    Backend, PythonBackend, BACKENDS, get_backend, register_backend, batch_verify
+)
+from hdwallet.exceptions import BackendError
+from hdwallet.libs.ecc import N
+from hdwallet.symbols import BTC
+
+PRIVATE_KEY: bytes = bytes.fromhex("6cd78b0d69eab1a47bfa53a52b9d8c4331e858b5d7a599270a95d9735fdb0b94")
+PUBLIC_KEY: bytes = bytes.fromhex("02f93f58b97c3bb616645c3dda256ec946d87c45baf531984c022dd0fd1503b0a8")
+UNCOMPRESSED: bytes = bytes.fromhex(
+    "04f93f58b97c3bb616645c3dda256ec946d87c45baf531984c022dd0fd1503b0a8"
+    "75f63285a539213ac241fc4a88e7137ba1c8d897b1c1e5efb81bfc6b45a22d40"
+)
+DIGEST: bytes = sha256(b"meherett").digest()
+
+AVAILABLE: list = [name for name, backend in BACKENDS.items() if backend.is_available()]
+
+
+@pytest.mark.parametrize("name", AVAILABLE)
+def test_backend(name):
+
+    backend, reference = get_backend(name), get_backend("python")
+    assert backend.NAME == name
+
+    assert backend.public_key(PRIVATE_KEY) == PUBLIC_KEY
+    assert backend.public_key(PRIVATE_KEY, compressed=False) == UNCOMPRESSED
+    assert backend.serialize(PUBLIC_KEY, compressed=False) == UNCOMPRESSED
+    assert backend.serialize(UNCOMPRESSED) == PUBLIC_KEY
+    assert backend.serialize(UNCOMPRESSED[1:]) == PUBLIC_KEY
+
+    for scalar in [2, 0xdeadbeef, int.from_bytes(DIGEST, "big")]:
+        assert backend.multiply(PUBLIC_KEY, scalar) == reference.multiply(PUBLIC_KEY, scalar)
+        assert backend.tweak_add(PUBLIC_KEY, scalar) == reference.tweak_add(PUBLIC_KEY, scalar)
+    other_public_key = reference.multiply(PUBLIC_KEY, 3)
+    assert backend.add(PUBLIC_KEY, other_public_key) == reference.multiply(PUBLIC_KEY, 4)
+
+    signature = backend.sign(PRIVATE_KEY, DIGEST)
+    assert signature[0] == reference.sign(PRIVATE_KEY, DIGEST)[0]
+    for verifier in AVAILABLE:
+        assert get_backend(verifier).verify(PUBLIC_KEY, DIGEST, signature)
+        assert not get_backend(verifier).verify(PUBLIC_KEY, sha256(DIGEST).digest(), signature)
+    assert backend.verify(PUBLIC_KEY, DIGEST, backend.sign(PRIVATE_KEY, DIGEST, deterministic=False))
+
+
+def test_get_backend(monkeypatch):
+
+    assert isinstance(get_backend("python"), PythonBackend)
+    assert get_backend("python") is get_backend("PYTHON")
+    assert get_backend(PythonBackend()).NAME == "python"
+    monkeypatch.setenv("HDWALLET_BACKEND", "ecdsa")
+    assert get_backend().NAME == "ecdsa"
+    assert HDWallet(symbol=BTC)._backend.NAME == "ecdsa"
+
+    with pytest.raises(BackendError, match="Invalid backend 'unknown'"):
+        get_backend("unknown")
+    with pytest.raises(TypeError):
+        register_backend(object)
+
+    @register_backend
+    class UnavailableBackend(Backend):
+        NAME = "unavailable"
+
+        @staticmethod
+        def is_available() -> bool:
+            return False
+
+    with pytest.raises(TypeError):
+        UnavailableBackend()
+    try:
+        with pytest.raises(BackendError, match="Backend 'unavailable' is not available"):
+            get_backend("unavailable")
+    finally:
+        BACKENDS.pop("unavailable")
+
+
+@pytest.mark.parametrize("name", AVAILABLE)
+def test_hdwallet_backend(name):
+
+    hdwallet = HDWallet(symbol=BTC, backend=name)
+    hdwallet.from_xprivate_key(
+        xprivate_key="xprv9s21ZrQH143K3xPGUzpogJeKtRdjHkK6muBJo8v7rEVRzT83xJgNcLpMoJXUf9wJFKfuHR4SGvfgdShh4t9VmjjrE9usBunK3LfNna31LGF"
+    )
+    hdwallet.from_path(path="m/44'/0'/0'/0/0")
+    xpublic_key, private_key = hdwallet.xpublic_key(), hdwallet.private_key()
+
+    reference = HDWallet(symbol=BTC, backend="python")
+    reference.from_xpublic_key(xpublic_key=hdwallet.root_xpublic_key())
+    reference.from_path(path="m/44/0/0/0/0")
+    assert HDWallet(symbol=BTC, backend=name).from_xpublic_key(xpublic_key).public_key() == hdwallet.public_key()
+    assert reference.from_private_key(private_key).public_key() == hdwallet.public_key()
+
+    assert hdwallet.verify(DIGEST, hdwallet.raw_sign(DIGEST))
+    assert hdwallet.sign(DIGEST) == reference.sign(DIGEST)
+
+
+@pytest.mark.parametrize("name", AVAILABLE)
+def test_batch_verify(name):
+
+    backend, items = get_backend(name), []
+    for index in range(1, 6):
+        private_key = (int.from_bytes(PRIVATE_KEY, "big") + index % 3).to_bytes(32, "big")
+        digest = sha256(bytes([index])).digest()
+        items.append((backend.public_key(private_key), digest, backend.sign(private_key, digest)))
+    assert backend.verify_many(items) == [True] * 5
+    assert batch_verify(items, backend=name)
+
+    public_key, digest, (r, s) = items[2]
+    items[2] = (public_key, digest, (r, get_backend("python").sign(PRIVATE_KEY, DIGEST)[1]))
+    items.append((public_key, digest, (r, N - s)))
+    assert backend.verify_many(items) == [True, True, False, True, True, True]
+    assert not batch_verify(items, backend=name)
+    assert batch_verify([], backend=name)
+
+    # malformed public keys fail their own item instead of aborting the batch
+    items = items[:2] + [
+        (b"\x02" + bytes(32), digest, (r, s)),
+        (b"\x05" + public_key[1:], digest, (r, s)),
+        (public_key[:10], digest, (r, s)),
+        (b"\x04" + bytes(64), digest, (r, s))
+    ] + items[3:]
+    assert backend.verify_many(items) == [True, True, False, False, False, False, True, True, True]
+    assert not batch_verify(items, backend=name)
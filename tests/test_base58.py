@@ -10,8 +10,11 @@ import hashlib
 
 from hdwallet.libs.ripemd160 import ripemd160
 from hdwallet.libs.base58 import (
-    checksum_encode, check_encode, check_decode, decode, encode, string_to_int
+    checksum_encode, check_encode, check_decode, decode, encode, string_to_int, XRP_ALPHABET,
+    check_encode_many, account_addresses
 )
+from hdwallet.libs import base58
+from hdwallet.libs.ecc import PrivateKey
 
 
 RAW: str = "0488ade405d5bc481680000000b5b40efbdef2e0a2e8ee6fa9d371f951f93e3b1e3c1b50fb31f9ea36cfc7c88100b9d3f3" \
@@ -45,6 +48,70 @@ def test_base58():
     assert eth_check == eth
 
 
+def test_base58_alphabets():
+
+    raw = unhexlify("00" + "4d887566d408dfe5ea8090f2b716f9639523ca89")
+    assert check_encode(raw) == "184xW5gWDnhS7LriL2JAZs1XGTJjimz7pq"
+    assert check_encode(raw, alphabet=XRP_ALPHABET) == "r3hxWngWD86SfLi5LpJwZ1rXGTJj5mzfFq"
+    assert check_decode("r3hxWngWD86SfLi5LpJwZ1rXGTJj5mzfFq", alphabet=XRP_ALPHABET) == raw
+    assert check_encode(raw, alphabet=XRP_ALPHABET.encode()) == check_encode(raw, alphabet=XRP_ALPHABET)
+
+    for data in [b"", b"\0", b"\0\0\xff", bytes(range(256)), unhexlify(RAW)]:
+        assert decode(encode(data)) == data
+        assert decode(encode(data, alphabet=XRP_ALPHABET), alphabet=XRP_ALPHABET) == data
+    assert string_to_int(bytes(range(1, 200))) == int.from_bytes(bytes(range(1, 200)), "big")
+
+    with pytest.raises(ValueError, match="character not in alphabet"):
+        decode("111233QC0")
+    with pytest.raises(ValueError, match="checksum error"):
+        check_decode("184xW5gWDnhS7LriL2JAZs1XGTJjimz7pp")
+
+
+def test_check_encode_many():
+
+    numpy = pytest.importorskip("numpy")
+
+    hashes = [hashlib.sha256(bytes([index])).digest()[:20] for index in range(8)] + [b"\0" * 20, b"\xff" * 20]
+    for version, alphabet in [(b"\x00", "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"),
+                              (b"\x05", XRP_ALPHABET)]:
+        assert check_encode_many(hashes, version, alphabet) == \
+            [check_encode(version + _hash, alphabet=alphabet) for _hash in hashes]
+        array = numpy.frombuffer(b"".join(hashes), dtype=numpy.uint8).reshape(len(hashes), 20)
+        assert check_encode_many(array, version, alphabet) == check_encode_many(hashes, version, alphabet)
+
+    xkeys = [unhexlify(RAW), unhexlify(RAW)[::-1], b"\0" * 78]
+    assert check_encode_many(xkeys) == [check_encode(xkey) for xkey in xkeys]
+    assert check_encode_many([], b"\x00") == []
+
+    with pytest.raises(ValueError, match="same width"):
+        check_encode_many([b"\0" * 20, b"\0" * 21])
+
+
+def test_account_addresses(monkeypatch):
+
+    # m/44'/60'/0'/0/0 from the README
+    private_key = PrivateKey(0xa45f9af43912fdd5e88c492226be082029f257681d4b3e73b68be535d2fb0526)
+    public_keys = [private_key.point.sec(compressed=False), PrivateKey(0xdeadbeef).point.sec(compressed=False)[1:]]
+    eth = account_addresses(public_keys)
+    assert eth[0] == "0x3a149f0c5dc5c0F1E29e573215C23710dE9c4f87"
+    assert eth == [checksum_encode(address.lower()) for address in eth]
+    assert [address[3:] for address in account_addresses(public_keys, crypto="xdc")] == [address[2:] for address in eth]
+    assert account_addresses(public_keys, crypto="trx") == \
+        [check_encode(b"\x41" + unhexlify(address[2:])) for address in eth]
+
+    pytest.importorskip("numpy")
+    for crypto in ["eth", "xdc", "trx"]:
+        monkeypatch.setattr(base58, "ACCOUNT_BATCH_THRESHOLD", 1024)
+        expected = account_addresses(public_keys, crypto=crypto)
+        monkeypatch.setattr(base58, "ACCOUNT_BATCH_THRESHOLD", 0)
+        assert account_addresses(public_keys, crypto=crypto) == expected
+
+    with pytest.raises(ValueError, match="Invalid account address crypto"):
+        account_addresses(public_keys, crypto="btc")
+    with pytest.raises(ValueError, match="64 bytes"):
+        account_addresses([b"\x04" * 33])
+
+
 def test_keccak():
     """Keccak 256 hash is required by several crypto algorithms.  Ensure our hash implementations
     are correct.
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+
+import pytest
+
+from hdwallet.libs.bech32 import (
+    bech32_polymod, bech32_hrp_expand, bech32_hrp_state, bech32_encode, bech32_decode, encode, decode, encode_many,
+    decode_many, HRP_STATE_CACHE_SIZE
+)
+
+# Segwit address vectors from BIP173.
+VECTORS: list = [
+    ("bc", 0, "751e76e8199196d454941c45d1b3a323f1433bd6",
+     "bc1qw508d6qejxtdg4y5r3zarvary0c5xw7kv8f3t4"),
+    ("tb", 0, "1863143c14c5166804bd19203356da136c985678cd4d27a1b8c6329604903262",
+     "tb1qrp33g0q5c5txsp9arysrx4k6zdkfs4nce4xj0gdcccefvpysxf3q0sl5k7"),
+    ("bc", 16, "751e", "bc1sw50qa3jx3s"),
+    ("tb", 0, "000000c4a5cad46221b2a187905e5266362b99d5e91c6ce24d165dab93e86433",
+     "tb1qqqqqp399et2xygdj5xreqhjjvcmzhxw4aywxecjdzew6hylgvsesrxh6hy"),
+]
+
+
+def test_bech32_polymod():
+
+    values = bech32_hrp_expand("bc") + [0, 14, 20, 15]
+    assert bech32_polymod(values) == bech32_polymod(values[5:], bech32_polymod(values[:5]))
+    assert bech32_decode("A12UEL5L") == ("a", [])
+    assert bech32_encode("a", []) == "a12uel5l"
+    assert bech32_decode("a12uel5m") == (None, None)
+
+
+def test_bech32_hrp_state():
+
+    assert bech32_hrp_state("bc") == bech32_polymod(bech32_hrp_expand("bc"))
+    # HRPs of untrusted input never grow the cache past its bound
+    for index in range(HRP_STATE_CACHE_SIZE * 2):
+        bech32_decode(f"x{index}1qqqqqq")
+    assert bech32_hrp_state.cache_info().currsize <= HRP_STATE_CACHE_SIZE
+
+
+@pytest.mark.parametrize("hrp,witver,witprog,address", VECTORS)
+def test_segwit_address(hrp, witver, witprog, address):
+
+    program = list(bytes.fromhex(witprog))
+    assert encode(hrp, witver, program) == address
+    assert decode(hrp, address) == (witver, program)
+    assert decode(hrp, address.upper()) == (witver, program)
+
+
+def test_encode_decode_many():
+
+    programs = [bytes([index]) * 20 for index in range(4)] + [b"\x00" * 21]
+    addresses = encode_many("bc", 0, programs)
+    assert addresses[:-1] == [encode("bc", 0, program) for program in programs[:-1]]
+    assert addresses[-1] is None
+    assert encode_many("bc", 17, programs) == [None] * len(programs)
+    assert encode_many("BC", 0, programs) == [None] * len(programs)
+
+    invalid = [
+        addresses[0][:-1] + "q", addresses[0][:5] + addresses[0][5:].upper(), "tb" + addresses[0][2:],
+        "bc1zw508d6qejxtdg4y5r3zarvaryvqyzf3du", "bc1gmk9yu", ""
+    ]
+    assert decode_many("bc", addresses[:-1] + invalid) == \
+        [(0, list(program)) for program in programs[:-1]] + [(None, None)] * len(invalid)
@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+
+import pytest
+
+from concurrent.futures import ThreadPoolExecutor
+
+from hdwallet.libs.ecc import (
+    Point, S256Point, PrivateKey, Signature, G, N, P, INFINITY_JACOBIAN,
+    jacobian_add, jacobian_double, jacobian_multiply, from_jacobian,
+    generator_multiply, generator_table, save_generator_table, load_generator_table, valid_generator_table,
+    glv_split, glv_multiply, GLV_BETA, GLV_LAMBDA, wnaf, multi_scalar_multiply,
+    decompress, decompression_cache_info, set_decompression_cache_size, clear_decompression_cache,
+    DECOMPRESSION_CACHE_SIZE, DECOMPRESSION_CACHE_ENVIRON, _environ_cache_size, verify_many, batch_verify
+)
+
+SCALARS: list = [
+    1, 2, 3, 7, 0xff, 2 ** 128 + 1, N - 1, N - 2,
+    0x6cd78b0d69eab1a47bfa53a52b9d8c4331e858b5d7a599270a95d9735fdb0b94,
+    0x8d5f4fe5b81a6a6a18b08603b6b3f59df9f4bbb25d10c55d23e0cbdc5ee385e5
+]
+
+
+def affine_multiply(point: S256Point, coefficient: int) -> S256Point:
+    # Reference affine double-and-add from the generic Point class.
+    return Point.__rmul__(point, coefficient % N)
+
+
+def test_jacobian_arithmetic():
+
+    assert jacobian_double(INFINITY_JACOBIAN) == INFINITY_JACOBIAN
+    assert jacobian_add(INFINITY_JACOBIAN, G.jacobian()) == G.jacobian()
+    assert jacobian_add(G.jacobian(), INFINITY_JACOBIAN) == G.jacobian()
+    assert from_jacobian(jacobian_multiply(G.jacobian(), N)) is None
+    assert from_jacobian(jacobian_add(G.jacobian(), (G.x.num, P - G.y.num, 1))) is None
+
+    assert from_jacobian(jacobian_double(G.jacobian())) == from_jacobian(jacobian_add(G.jacobian(), G.jacobian()))
+    double_g = G + G
+    assert from_jacobian(jacobian_double(G.jacobian())) == (double_g.x.num, double_g.y.num)
+
+
+@pytest.mark.parametrize("coefficient", SCALARS)
+def test_scalar_multiplication(coefficient):
+
+    expected = affine_multiply(G, coefficient)
+    assert coefficient * G == expected
+    assert S256Point.from_jacobian(jacobian_multiply(G.jacobian(), coefficient)) == expected
+    assert S256Point.from_jacobian(generator_multiply(coefficient)) == expected
+
+    point = 0xdeadbeef * G
+    assert coefficient * point == affine_multiply(point, coefficient)
+    assert from_jacobian(glv_multiply(point.jacobian(), coefficient)) == \
+        from_jacobian(jacobian_multiply(point.jacobian(), coefficient))
+
+
+@pytest.mark.parametrize("coefficient", SCALARS)
+def test_glv_split(coefficient):
+
+    k1, k2 = glv_split(coefficient)
+    assert (k1 + k2 * GLV_LAMBDA - coefficient) % N == 0
+    assert abs(k1).bit_length() <= 129 and abs(k2).bit_length() <= 129
+
+
+def test_glv_endomorphism():
+
+    point = GLV_LAMBDA * G
+    assert (point.x.num, point.y.num) == (GLV_BETA * G.x.num % P, G.y.num)
+
+    point = 0xdeadbeef * G
+    # Vector computed with the affine double-and-add implementation.
+    assert (0x6cd78b0d69eab1a47bfa53a52b9d8c4331e858b5d7a599270a95d9735fdb0b94 * point).sec().hex() == \
+        "03fdc507fbc9a9e82ba3090603e33ad14ac246d015680032c1e99e82ae7378cdbc"
+    assert from_jacobian(glv_multiply(point.jacobian(), N)) is None
+    assert from_jacobian(glv_multiply(jacobian_double(point.jacobian()), 3)) == \
+        from_jacobian(jacobian_multiply(point.jacobian(), 6))
+
+
+@pytest.mark.parametrize("coefficient", SCALARS)
+def test_wnaf(coefficient):
+
+    for window in [2, 4, 5]:
+        digits = wnaf(coefficient, window)
+        assert sum(digit << i for i, digit in enumerate(digits)) == coefficient
+        assert all(digit % 2 and abs(digit) < 2 ** (window - 1) for digit in digits if digit)
+        assert all(not any(digits[i + 1:i + window]) for i, digit in enumerate(digits) if digit)
+
+
+def test_multi_scalar_multiply():
+
+    point, other = 0xdeadbeef * G, 0xcafebabe * G
+    for a, b in zip(SCALARS, reversed(SCALARS)):
+        expected = affine_multiply(G, a) + affine_multiply(point, b)
+        assert S256Point.from_jacobian(multi_scalar_multiply([(a, G.jacobian()), (b, point.jacobian())])) == expected
+        expected = expected + affine_multiply(other, a + b)
+        assert S256Point.from_jacobian(multi_scalar_multiply([
+            (a, G.jacobian()), (b, point.jacobian()), (a + b, other.jacobian())
+        ])) == expected
+
+    assert multi_scalar_multiply([]) == INFINITY_JACOBIAN
+    assert from_jacobian(multi_scalar_multiply([(1, point.jacobian()), (N - 1, point.jacobian())])) is None
+    assert from_jacobian(multi_scalar_multiply([(3, G.jacobian()), (5, G.jacobian())])) == \
+        from_jacobian(generator_multiply(8))
+
+
+def test_generator_table(tmp_path):
+
+    path = str(tmp_path / "generator.table")
+    save_generator_table(path)
+    assert load_generator_table(path) == generator_table()
+
+    with open(path, "r+b") as table_file:
+        table_file.seek(100)
+        table_file.write(b"\xff")
+    assert load_generator_table(path) is None
+
+    # a wrong entry, even on the curve and saved with a matching checksum, is refused
+    table = [list(row) for row in generator_table()]
+    x, y, z = table[7][100]
+    table[7][100] = (x, P - y, z)
+    assert not valid_generator_table(table)
+    save_generator_table(path, table)
+    assert load_generator_table(path) is None
+    assert valid_generator_table(generator_table())
+
+
+def test_private_key():
+
+    private_key = PrivateKey(0x6cd78b0d69eab1a47bfa53a52b9d8c4331e858b5d7a599270a95d9735fdb0b94)
+    assert private_key.point.sec().hex() == "02f93f58b97c3bb616645c3dda256ec946d87c45baf531984c022dd0fd1503b0a8"
+
+    z = 0x2cf24dba5fb0a30e26e83b2ac5b9e29e1b161e5c1fa7425e73043362938b9824
+    signature = private_key.sign(z)
+    assert private_key.point.verify(z, signature)
+    assert not private_key.point.verify(z + 1, signature)
+
+
+def test_s256_point():
+
+    point = 0xdeadbeef * G
+    assert not hasattr(point, "__dict__") and not hasattr(point.x, "__dict__")
+    assert point + G == S256Point.from_jacobian(jacobian_add(point.jacobian(), G.jacobian()))
+    assert point + point == 2 * point
+    assert point + S256Point(point.x.num, P - point.y.num) == S256Point(None, None)
+    assert S256Point(None, None) + point == point
+
+    for point in [G, 0xdeadbeef * G, 0xcafebabe * G]:
+        assert S256Point.parse(point.sec(compressed=True)) == point
+        assert S256Point.parse(point.sec(compressed=False)) == point
+
+    with pytest.raises(ValueError, match="not on the curve"):
+        S256Point(G.x.num, G.y.num + 1)
+    with pytest.raises(ValueError):
+        S256Point.parse(b"\x02" + (5).to_bytes(32, "big"))
+
+
+def test_decompression_cache():
+
+    clear_decompression_cache()
+    points = [coefficient * G for coefficient in range(1, 6)]
+    try:
+        set_decompression_cache_size(3)
+        for point in points + points[-2:]:
+            assert S256Point.parse(point.sec()) == point
+        assert decompression_cache_info() == (2, 5, 3, 3)
+        assert decompress(points[0].sec()) == (points[0].x.num, points[0].y.num)
+        assert decompression_cache_info().misses == 6
+
+        set_decompression_cache_size(0)
+        assert decompression_cache_info().currsize == 0
+        S256Point.parse(points[0].sec())
+        assert decompression_cache_info() == (2, 7, 0, 0)
+        with pytest.raises(ValueError):
+            set_decompression_cache_size(-1)
+        with pytest.raises(ValueError):
+            decompress(b"\x04" + points[0].sec()[1:])
+
+        # over-long compressed keys are refused, even with their first 33 bytes cached
+        set_decompression_cache_size(3)
+        assert S256Point.parse(points[0].sec()) == points[0]
+        with pytest.raises(ValueError):
+            S256Point.parse(points[0].sec() + b"junk")
+        with pytest.raises(ValueError):
+            S256Point.parse(points[0].sec() + b"\x00")
+    finally:
+        set_decompression_cache_size(DECOMPRESSION_CACHE_SIZE)
+        clear_decompression_cache()
+
+
+@pytest.mark.parametrize("value,maxsize", [
+    (None, DECOMPRESSION_CACHE_SIZE), ("16", 16), ("0", 0), ("-1", DECOMPRESSION_CACHE_SIZE),
+    ("lots", DECOMPRESSION_CACHE_SIZE), ("", DECOMPRESSION_CACHE_SIZE)
+])
+def test_decompression_cache_environ(monkeypatch, value, maxsize):
+
+    if value is None:
+        monkeypatch.delenv(DECOMPRESSION_CACHE_ENVIRON, raising=False)
+    else:
+        monkeypatch.setenv(DECOMPRESSION_CACHE_ENVIRON, value)
+    assert _environ_cache_size() == maxsize
+
+
+def test_decompression_cache_threads():
+
+    clear_decompression_cache()
+    points = [coefficient * G for coefficient in range(1, 33)]
+    try:
+        set_decompression_cache_size(4)
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda point: decompress(point.sec()), points * 20))
+        assert results == [(point.x.num, point.y.num) for point in points] * 20
+        info = decompression_cache_info()
+        assert info.hits + info.misses == len(results) and info.currsize <= 4
+    finally:
+        set_decompression_cache_size(DECOMPRESSION_CACHE_SIZE)
+        clear_decompression_cache()
+
+
+def test_verify_many():
+
+    keys = [PrivateKey(secret) for secret in [0xdeadbeef, 0xcafebabe, SCALARS[-1]]]
+    items = []
+    for i, z in enumerate(SCALARS):
+        key = keys[i % len(keys)]
+        items.append((key.point, z, key.sign(z)))
+    assert verify_many(items) == [True] * len(items)
+    assert batch_verify(items)
+
+    point, z, signature = items[3]
+    items[3] = (point, z + 1, signature)
+    items.append((keys[0].point, z, Signature(signature.r, N)))
+    items.append((S256Point(None, None), z, signature))
+    assert verify_many(items) == [i != 3 for i in range(len(SCALARS))] + [False, False]
+    assert not batch_verify(items)
+    assert verify_many([]) == [] and batch_verify([])
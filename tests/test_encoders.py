@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+
+import pytest
+
+from hdwallet import HDWallet
+from hdwallet.cryptocurrencies import (
+    BitcoinMainnet, BitcoinTestnet, EthereumMainnet, TronMainnet, RippleMainnet
+)
+from hdwallet.encoders import (
+    Encoder, get_encoder, prefix_bytes
+)
+from hdwallet.utils import _unhexlify
+
+
+def test_prefix_bytes():
+
+    for value in [0x00, 0x05, 0x80, 0xef, 0x5389, 0x488ade4, 0x2aa7a99]:
+        assert prefix_bytes(value) == _unhexlify(value)
+    assert prefix_bytes(None) is None
+
+
+def test_get_encoder():
+
+    encoder = get_encoder(BitcoinMainnet)
+    assert isinstance(encoder, Encoder) and get_encoder(BitcoinMainnet) is encoder
+    assert (encoder.family, encoder.p2pkh_input, encoder.account) == ("btc", "hash160", None)
+    assert (encoder.public_key_address, encoder.script_address, encoder.wif_secret_key) == (b"\x00", b"\x05", b"\x80")
+    assert (encoder.hrp, encoder.segwit_version) == ("bc", 0)
+    assert encoder.xprivate_key_versions["p2pkh"] == bytes.fromhex("0488ade4")
+    assert encoder.xpublic_key_versions["p2wpkh"] == bytes.fromhex("04b24746")
+    assert get_encoder(BitcoinTestnet).hrp == "tb"
+
+    with pytest.raises(AttributeError):
+        encoder.hrp = "tb"
+    with pytest.raises(TypeError):
+        encoder.xpublic_key_versions["p2pkh"] = b"\x00"
+
+    assert (get_encoder(EthereumMainnet).family, get_encoder(EthereumMainnet).account) == ("evm", "eth")
+    assert (get_encoder(TronMainnet).family, get_encoder(TronMainnet).p2pkh_input) == ("tron", "uncompressed")
+    assert get_encoder(RippleMainnet).family == "xrp"
+
+
+@pytest.mark.parametrize("cryptocurrency, address", [
+    (BitcoinMainnet, "184xW5gWDnhS7LriL2JAZs1XGTJjimz7pq"),
+    (RippleMainnet, "r3hxWngWD86SfLi5LpJwZ1rXGTJj5mzfFq"),
+])
+def test_p2pkh_address(cryptocurrency, address):
+
+    hdwallet = HDWallet(cryptocurrency=cryptocurrency)
+    hdwallet.from_private_key("6cd78b0d69eab1a47bfa53a52b9d8c4331e858b5d7a599270a95d9735fdb0b94")
+    assert hdwallet.p2pkh_address() == address
+    assert get_encoder(cryptocurrency).p2pkh_address(hdwallet._node_hash("hash160")) == address
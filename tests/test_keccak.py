@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+
+import pytest
+
+from hdwallet.libs import keccak
+
+VECTORS: list = [
+    (b"", "c5d2460186f7233c927e7db2dcc703c0e500b653ca82273b7bfad8045d85a470"),
+    (b"abc", "4e03657aea45a94fc7d47ba826c8d667c0d1e6e33a64a036ec44f58fa12d6c45"),
+    (b"1234567890" * 14, "959fd8dc3ad09e2197e51a9e81edbdab6324053da782379b6d10204039be59fb")
+]
+
+
+@pytest.mark.parametrize("message, digest", VECTORS)
+def test_keccak_256(message, digest):
+
+    assert keccak.keccak_256(message).hex() == digest
+
+
+def test_keccak_256_many():
+
+    numpy = pytest.importorskip("numpy")
+
+    for length in [0, 3, 64, 135, 136, 140]:
+        messages = [bytes([index]) * length for index in range(5)]
+        digests = keccak.keccak_256_many(messages)
+        assert digests.shape == (5, 32) and digests.dtype == numpy.uint8
+        assert [bytes(digest) for digest in digests] == [keccak.keccak_256(message) for message in messages]
+    array = numpy.arange(64 * 3, dtype=numpy.uint8).reshape(3, 64)
+    assert bytes(keccak.keccak_256_many(array)[2]) == keccak.keccak_256(array[2].tobytes())
+    assert keccak.keccak_256_many([]).shape == (0, 32)
+
+    with pytest.raises(ValueError, match="same length"):
+        keccak.keccak_256_many([b"a", b"ab"])
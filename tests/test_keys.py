@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+
+import json
+import os
+import pytest
+
+from hdwallet import HDWallet
+from hdwallet.cryptocurrencies import BitcoinMainnet
+from hdwallet.keys import (
+    ExtendedKey, parse_xprivate_key, parse_xpublic_key, parse_wif
+)
+from hdwallet.libs.base58 import check_decode, check_encode
+
+# Test Values
+base_path: str = os.path.dirname(__file__)
+file_path: str = os.path.abspath(os.path.join(base_path, "values.json"))
+values = open(file_path, "r", encoding="utf-8")
+_: dict = json.loads(values.read())
+values.close()
+
+BITCOIN: dict = _["bitcoin"]["mainnet"]
+
+
+def test_parse_xkeys():
+
+    xkey = parse_xprivate_key(BITCOIN["root_xprivate_key"], BITCOIN["symbol"])
+    assert isinstance(xkey, ExtendedKey) and xkey.is_root and xkey.is_private
+    assert xkey.semantic == "p2pkh"
+    assert xkey.version + bytes([xkey.depth]) + xkey.parent_fingerprint + xkey.index.to_bytes(4, "big") + \
+        xkey.chain_code + b"\x00" + xkey.key == check_decode(BITCOIN["root_xprivate_key"])
+    with pytest.raises(AttributeError):
+        xkey.depth = 1
+
+    xkey = parse_xpublic_key(BITCOIN["xpublic_key"], BitcoinMainnet)
+    assert not xkey.is_root and not xkey.is_private
+    assert xkey.key.hex() == BITCOIN["compressed"] and xkey.chain_code.hex() == BITCOIN["chain_code"]
+
+    # Shared versions resolve to the same semantic as before.
+    raw = check_decode(BITCOIN["root_xpublic_key"])
+    for semantic in ["p2wpkh", "p2wpkh_in_p2sh"]:
+        version = getattr(BitcoinMainnet.EXTENDED_PUBLIC_KEY, semantic.upper()).to_bytes(4, "big")
+        assert parse_xpublic_key(check_encode(version + raw[4:]), BitcoinMainnet).semantic == semantic
+
+
+@pytest.mark.parametrize("xpublic_key", [
+    "", b"xpub", "xpub" + "z" * 107, "xpub0OIl", _["bitcoin"]["testnet"]["root_xpublic_key"],
+    _["bitcoin"]["mainnet"]["root_xpublic_key"][:-1] + "1", _["bitcoin"]["mainnet"]["root_xprivate_key"],
+    check_encode(check_decode(_["bitcoin"]["mainnet"]["root_xpublic_key"])[:45] + b"\x04" + b"\x00" * 32)
+])
+def test_parse_invalid_xpublic_key(xpublic_key):
+
+    with pytest.raises(ValueError):
+        parse_xpublic_key(xpublic_key, BitcoinMainnet)
+    with pytest.raises(ValueError):
+        HDWallet(symbol=BITCOIN["symbol"]).from_xpublic_key(xpublic_key)
+
+
+def test_parse_wif():
+
+    private_key = bytes.fromhex(BITCOIN["private_key"])
+    assert parse_wif(BITCOIN["wif"], BitcoinMainnet) == (private_key, True)
+    assert parse_wif(check_encode(b"\x80" + private_key), BitcoinMainnet) == (private_key, False)
+    assert HDWallet(symbol=BITCOIN["symbol"]).from_wif(BITCOIN["wif"]).private_key() == BITCOIN["private_key"]
+
+    for wif in [_["bitcoin"]["testnet"]["wif"], check_encode(b"\x80" + private_key + b"\x02"), BITCOIN["wif"][:-1]]:
+        with pytest.raises(ValueError, match="Invalid Bitcoin wallet important format"):
+            parse_wif(wif, BitcoinMainnet)
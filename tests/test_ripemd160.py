@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+
+import hashlib
+import pytest
+
+from hdwallet.libs import ripemd160
+
+VECTORS: list = [
+    (b"", "9c1185a5c5e9fc54612808977ee8f548b2258d31"),
+    (b"abc", "8eb208f7e05d987a9b044a8e98c6b087f15a0bfc"),
+    (b"1234567890" * 8, "9b752e45573d4b39f4dbd3323cab82bf63326bfb")
+]
+
+
+@pytest.mark.parametrize("message, digest", VECTORS)
+def test_ripemd160(message, digest):
+
+    assert ripemd160.ripemd160(message).hex() == digest
+    assert ripemd160.new(message).hex() == digest
+    assert ripemd160.hash160(message) == ripemd160.ripemd160(hashlib.sha256(message).digest())
+
+
+def test_provider(monkeypatch):
+
+    assert ripemd160.PROVIDER in ["openssl", "pycryptodome", "python"]
+
+    def unsupported(data):
+        raise ValueError("unsupported hash type ripemd160")
+
+    monkeypatch.setattr(ripemd160, "_hashlib_ripemd160", unsupported)
+    name, function = ripemd160._select_ripemd160()
+    assert name in ["pycryptodome", "python"]
+    assert function(b"abc").hex() == VECTORS[1][1]
+
+
+def test_ripemd160_many():
+
+    numpy = pytest.importorskip("numpy")
+
+    for length in [0, 32, 55, 56, 64, 100]:
+        messages = [bytes([index]) * length for index in range(5)]
+        digests = ripemd160.ripemd160_many(messages)
+        assert digests.shape == (5, 20) and digests.dtype == numpy.uint8
+        assert [bytes(digest) for digest in digests] == [ripemd160.ripemd160(message) for message in messages]
+
+    messages = numpy.arange(3 * 33, dtype=numpy.uint8).reshape(3, 33)
+    assert [bytes(digest) for digest in ripemd160.hash160_many([bytes(message) for message in messages])] == \
+        [ripemd160.hash160(bytes(message)) for message in messages]
+    assert bytes(ripemd160.ripemd160_many(messages)[1]) == ripemd160.ripemd160(bytes(messages[1]))
+    assert ripemd160.ripemd160_many([]).shape == (0, 20)
+
+    with pytest.raises(ValueError, match="same length"):
+        ripemd160.ripemd160_many([b"a", b"ab"])
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+
+import random
+import pytest
+
+from binascii import (
+    hexlify, unhexlify
+)
+
+from hdwallet.libs.script import (
+    p2pkh_script, p2wpkh_script, p2wsh_script, multisig_script
+)
+
+PUBLIC_KEY: bytes = bytes.fromhex("02f93f58b97c3bb616645c3dda256ec946d87c45baf531984c022dd0fd1503b0a8")
+PUBLIC_KEY_HASH: bytes = bytes.fromhex("4d887566d408dfe5ea8090f2b716f9639523ca89")
+
+
+def test_scripts():
+
+    assert p2pkh_script(PUBLIC_KEY_HASH).hex() == "76a914" + PUBLIC_KEY_HASH.hex() + "88ac"
+    assert p2wpkh_script(PUBLIC_KEY_HASH).hex() == "0014" + PUBLIC_KEY_HASH.hex()
+    assert p2wsh_script(PUBLIC_KEY[1:]).hex() == "0020" + PUBLIC_KEY[1:].hex()
+    assert multisig_script(PUBLIC_KEY).hex() == "5121" + PUBLIC_KEY.hex() + "51ae"
+
+    with pytest.raises(ValueError, match="expected 20 bytes"):
+        p2pkh_script(PUBLIC_KEY)
+    with pytest.raises(ValueError, match="expected 32 bytes"):
+        p2wsh_script(PUBLIC_KEY_HASH)
+    with pytest.raises(ValueError, match="expected 33 bytes"):
+        multisig_script(PUBLIC_KEY[1:])
+
+
+def test_scripts_match_hex_strings():
+
+    # Templates against the hex string building they replaced, byte for byte
+    generator = random.Random(0)
+    for _ in range(256):
+        public_key_hash: bytes = bytes(generator.getrandbits(8) for _ in range(20))
+        script_hash: bytes = bytes(generator.getrandbits(8) for _ in range(32))
+        public_key: bytes = bytes([generator.choice((2, 3))]) + script_hash
+
+        assert p2pkh_script(public_key_hash) == unhexlify("76a914" + hexlify(public_key_hash).decode() + "88ac")
+        assert p2wpkh_script(public_key_hash) == unhexlify("0014" + hexlify(public_key_hash).decode())
+        assert p2wsh_script(script_hash) == unhexlify("0020" + hexlify(script_hash).decode())
+        assert multisig_script(public_key) == unhexlify("5121" + hexlify(public_key).decode() + "51ae")